@@ -1,7 +1,11 @@
 """Utility functions for MITx Supply Chain Analytics."""
 
 from . import testing
+from . import forecasting
+from . import inventory
 
 __all__ = [
-    'testing'
+    'testing',
+    'forecasting',
+    'inventory'
 ]
@@ -0,0 +1,124 @@
+"""Vectorized forecasting engines for panels of time series."""
+
+from .moving_average import (
+    simple_moving_average,
+    weighted_moving_average
+)
+
+from .exponential_smoothing import (
+    simple_exponential_smoothing,
+    holts_method,
+    holts_forecast
+)
+
+from .fitting import (
+    fit_smoothing_parameters,
+    save_parameters,
+    load_parameters
+)
+
+from .holt_winters import (
+    holt_winters,
+    holt_winters_forecast
+)
+
+from .decomposition import multi_seasonal_decompose
+
+from .state import SmoothingState
+
+from .diagnostics import (
+    autocorrelation,
+    ljung_box,
+    residual_diagnostics
+)
+
+from .periodicity import detect_seasonal_periods
+
+from .cleaning import rolling_median_filter, resample_panel
+
+from .autoregressive import (
+    fit_ar,
+    ar_residuals,
+    ar_forecast
+)
+
+from .accuracy import (
+    AccuracyAccumulator,
+    forecast_accuracy,
+    naive_scale
+)
+
+from .backtest import (
+    rolling_origins,
+    backtest
+)
+
+from .reconciliation import (
+    Hierarchy,
+    bottom_up,
+    top_down,
+    mint_shrink
+)
+
+from .cache import (
+    ForecastCache,
+    cached
+)
+
+__all__ = [
+    # Moving averages
+    'simple_moving_average',
+    'weighted_moving_average',
+    
+    # Exponential smoothing
+    'simple_exponential_smoothing',
+    'holts_method',
+    'holts_forecast',
+    'holt_winters',
+    'holt_winters_forecast',
+    
+    # Cleaning
+    'rolling_median_filter',
+    'resample_panel',
+    
+    # Decomposition
+    'multi_seasonal_decompose',
+    'detect_seasonal_periods',
+    
+    # Streaming state
+    'SmoothingState',
+    
+    # Residual diagnostics
+    'autocorrelation',
+    'ljung_box',
+    'residual_diagnostics',
+    
+    # Autoregressive models
+    'fit_ar',
+    'ar_residuals',
+    'ar_forecast',
+    
+    # Accuracy metrics
+    'AccuracyAccumulator',
+    'forecast_accuracy',
+    'naive_scale',
+    
+    # Backtesting
+    'rolling_origins',
+    'backtest',
+    
+    # Hierarchical reconciliation
+    'Hierarchy',
+    'bottom_up',
+    'top_down',
+    'mint_shrink',
+    
+    # Caching
+    'ForecastCache',
+    'cached',
+    
+    # Parameter fitting
+    'fit_smoothing_parameters',
+    'save_parameters',
+    'load_parameters'
+]
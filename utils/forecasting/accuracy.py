@@ -0,0 +1,211 @@
+"""Grouped forecast-accuracy metrics with mergeable streaming accumulators."""
+import numpy as np
+import pandas as pd
+
+from .panel import factorize
+
+_SUMS = ('count', 'abs_error', 'sq_error', 'ape', 'ape_count', 'sape', 'sape_count',
+         'scaled_error', 'scaled_count')
+
+def _group_columns(groups, n_rows):
+    """Normalize the `groups` argument to (names, list of key arrays)."""
+    if groups is None:
+        return ['group'], [np.zeros(n_rows, dtype=np.int64)]
+    if isinstance(groups, dict):
+        names = list(groups)
+        columns = [np.asarray(groups[name]) for name in names]
+    else:
+        names = ['group']
+        columns = [np.asarray(groups)]
+    if any(len(column) != n_rows for column in columns):
+        raise ValueError("Every group key must have one value per row")
+    return names, columns
+
+class AccuracyAccumulator:
+    """
+    Running sums for MAE, RMSE, MAPE, sMAPE and MASE per group.
+    
+    Rows can be fed in any number of chunks with `update`, and accumulators
+    built on different chunks or workers can be combined with `merge`, so a
+    backtest never has to be held in memory at once. Per-chunk reductions
+    use `np.bincount` on integer group codes; only the distinct keys of a
+    chunk are handled in Python.
+    """
+    
+    def __init__(self):
+        self.names = None
+        self.keys = []
+        self._index = {}
+        self.sums = {name: np.zeros(0) for name in _SUMS}
+    
+    def _group_ids(self, names, columns):
+        """Map each row to a global group id, registering unseen keys."""
+        if self.names is None:
+            self.names = names
+        elif names != self.names:
+            raise ValueError(f"Group keys {names} do not match {self.names}")
+        
+        # Combine per-column codes into one code per row
+        uniques, codes = [], np.zeros(len(columns[0]), dtype=np.int64)
+        for column in columns:
+            unique, inverse = factorize(column)
+            uniques.append(unique)
+            codes = codes * len(unique) + inverse
+        local_codes, local_inverse = factorize(codes)
+        
+        local_to_global = np.empty(len(local_codes), dtype=np.int64)
+        for i, code in enumerate(local_codes):
+            key = []
+            for unique in reversed(uniques):
+                code, position = divmod(code, len(unique))
+                key.append(unique[position].item())
+            key = tuple(reversed(key))
+            if key not in self._index:
+                self._index[key] = len(self.keys)
+                self.keys.append(key)
+            local_to_global[i] = self._index[key]
+        
+        self._grow(len(self.keys))
+        return local_to_global[local_inverse]
+    
+    def _grow(self, n_groups):
+        """Extend the running sums with zeros for newly seen groups."""
+        for name, values in self.sums.items():
+            if len(values) < n_groups:
+                self.sums[name] = np.concatenate([values, np.zeros(n_groups - len(values))])
+    
+    def update(self, forecasts, actuals, groups=None, scale=None):
+        """
+        Add a chunk of (forecast, actual) rows.
+        
+        Args:
+            forecasts (array-like): Forecasted values
+            actuals (array-like): Actual values
+            groups (array-like or dict, optional): One key array, or a dict of
+                key arrays (e.g. {'store': ..., 'horizon': ...}) with one
+                value per row
+            scale (array-like, optional): MASE scale of each row, typically the
+                in-sample MAE of the naive forecast of its series
+                
+        Returns:
+            AccuracyAccumulator: self, to allow chaining
+        """
+        forecasts = np.asarray(forecasts, dtype=float).ravel()
+        actuals = np.asarray(actuals, dtype=float).ravel()
+        if forecasts.shape != actuals.shape:
+            raise ValueError("forecasts and actuals must have the same length")
+        
+        names, columns = _group_columns(groups, len(actuals))
+        ids = self._group_ids(names, [np.ravel(c) for c in columns])
+        n_groups = len(self.keys)
+        
+        abs_error = np.abs(actuals - forecasts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ape = abs_error / np.abs(actuals)
+            sape = 2 * abs_error / (np.abs(actuals) + np.abs(forecasts))
+        ape_valid = actuals != 0
+        sape_valid = (actuals != 0) | (forecasts != 0)
+        
+        chunk = {
+            'count': np.ones_like(abs_error),
+            'abs_error': abs_error,
+            'sq_error': abs_error**2,
+            'ape': np.where(ape_valid, ape, 0),
+            'ape_count': ape_valid,
+            'sape': np.where(sape_valid, sape, 0),
+            'sape_count': sape_valid
+        }
+        if scale is not None:
+            scale = np.broadcast_to(np.asarray(scale, dtype=float), abs_error.shape)
+            scale_valid = scale > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                chunk['scaled_error'] = np.where(scale_valid, abs_error / scale, 0)
+            chunk['scaled_count'] = scale_valid
+        
+        for name, values in chunk.items():
+            self.sums[name] += np.bincount(ids, weights=values, minlength=n_groups)
+        return self
+    
+    def merge(self, other):
+        """
+        Add the sums of another accumulator into this one.
+        
+        Args:
+            other (AccuracyAccumulator): Accumulator built on other rows
+            
+        Returns:
+            AccuracyAccumulator: self, to allow chaining
+        """
+        if other.names is None:
+            return self
+        if self.names is None:
+            self.names = other.names
+        elif other.names != self.names:
+            raise ValueError(f"Group keys {other.names} do not match {self.names}")
+        
+        ids = np.empty(len(other.keys), dtype=np.int64)
+        for i, key in enumerate(other.keys):
+            if key not in self._index:
+                self._index[key] = len(self.keys)
+                self.keys.append(key)
+            ids[i] = self._index[key]
+        
+        self._grow(len(self.keys))
+        for name in _SUMS:
+            np.add.at(self.sums[name], ids, other.sums[name])
+        return self
+    
+    def result(self):
+        """
+        Compute the metrics of every group.
+        
+        Returns:
+            pd.DataFrame: count, mae, rmse, mape, smape (percent) and mase per
+                group, indexed by the group keys
+        """
+        s = self.sums
+        with np.errstate(divide='ignore', invalid='ignore'):
+            metrics = pd.DataFrame({
+                'count': s['count'].astype(np.int64),
+                'mae': s['abs_error'] / s['count'],
+                'rmse': np.sqrt(s['sq_error'] / s['count']),
+                'mape': 100 * s['ape'] / s['ape_count'],
+                'smape': 100 * s['sape'] / s['sape_count'],
+                'mase': s['scaled_error'] / s['scaled_count']
+            })
+        
+        names = self.names or ['group']
+        if len(names) == 1:
+            metrics.index = pd.Index([key[0] for key in self.keys], name=names[0])
+        else:
+            metrics.index = pd.MultiIndex.from_tuples(self.keys, names=names)
+        return metrics.sort_index()
+
+def naive_scale(history, season=1):
+    """
+    MASE scale of each series: in-sample MAE of the (seasonal) naive forecast.
+    
+    Args:
+        history (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        season (int): Lag of the naive forecast (1 for the random walk)
+        
+    Returns:
+        np.ndarray: One scale per series (a scalar for 1-D input)
+    """
+    history = np.asarray(history, dtype=float)
+    return np.nanmean(np.abs(history[..., season:] - history[..., :-season]), axis=-1)
+
+def forecast_accuracy(forecasts, actuals, groups=None, scale=None):
+    """
+    Compute MAE, RMSE, MAPE, sMAPE and MASE per group in one call.
+    
+    Args:
+        forecasts (array-like): Forecasted values
+        actuals (array-like): Actual values
+        groups (array-like or dict, optional): Group key(s) of every row
+        scale (array-like, optional): MASE scale of every row (see `naive_scale`)
+        
+    Returns:
+        pd.DataFrame: Metrics per group (see `AccuracyAccumulator.result`)
+    """
+    return AccuracyAccumulator().update(forecasts, actuals, groups, scale).result()
@@ -0,0 +1,141 @@
+"""Batched Yule-Walker AR(p) models with optional differencing (ARIMA-lite)."""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .panel import to_panel, from_panel
+from .diagnostics import autocorrelation
+
+def _levinson_durbin(acf, order):
+    """
+    Solve the Yule-Walker equations for every series at once.
+    
+    Args:
+        acf (np.ndarray): Autocorrelations shaped (n_series, order + 1)
+        order (int): AR order
+        
+    Returns:
+        tuple: (coefficients, partial autocorrelations, relative innovation
+            variance), the first two shaped (n_series, order)
+    """
+    n_series = acf.shape[0]
+    coef = np.zeros((n_series, order))
+    pacf = np.zeros((n_series, order))
+    error = np.ones(n_series)
+    
+    for k in range(1, order + 1):
+        previous = coef[:, :k-1]
+        acc = acf[:, k] - np.sum(previous * acf[:, k-1:0:-1], axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            reflection = np.where(error > 0, acc / error, 0.0)
+        coef[:, :k-1] = previous - reflection[:, np.newaxis] * previous[:, ::-1]
+        coef[:, k-1] = reflection
+        pacf[:, k-1] = reflection
+        error = error * (1 - reflection**2)
+    
+    return coef, pacf, error
+
+def _difference(panel, d):
+    """Difference a panel d times along time."""
+    return np.diff(panel, n=d, axis=1) if d else panel
+
+def fit_ar(data, order, d=0):
+    """
+    Fit an AR(p) model (ARIMA(p, d, 0)) to every series by Yule-Walker.
+    
+    The autocorrelations of all series come from one FFT call and the
+    Levinson-Durbin recursion runs over the order, vectorized across series,
+    so fitting costs O(n log n + p^2) per series.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        order (int): Autoregressive order p
+        d (int): Number of differences taken before fitting
+        
+    Returns:
+        dict: 'coef' (lag 1 first), 'pacf', 'mean' and 'sigma2' per series,
+            plus 'order' and 'd'
+    """
+    if order < 1:
+        raise ValueError("order must be at least 1")
+    if d < 0:
+        raise ValueError("d must be non-negative")
+    
+    panel, single = to_panel(data)
+    differenced = _difference(panel, d)
+    if differenced.shape[1] <= order:
+        raise ValueError("Series are too short for the requested order")
+    
+    mean = differenced.mean(axis=1)
+    variance = differenced.var(axis=1)
+    acf = autocorrelation(differenced, max_lag=order)
+    acf = np.where(np.isfinite(acf), acf, 0.0)
+    coef, pacf, relative_error = _levinson_durbin(acf, order)
+    
+    return {
+        'coef': from_panel(coef, single),
+        'pacf': from_panel(pacf, single),
+        'mean': from_panel(mean, single),
+        'sigma2': from_panel(variance * relative_error, single),
+        'order': order,
+        'd': d
+    }
+
+def _lagged_prediction(centered, coef):
+    """One-step predictions of a centered panel for t = p..n_periods-1."""
+    order = coef.shape[1]
+    windows = sliding_window_view(centered[:, :-1], order, axis=1)
+    # Windows run oldest to newest, coefficients lag 1 first
+    return np.einsum('ntp,np->nt', windows, coef[:, ::-1])
+
+def ar_residuals(data, params):
+    """
+    In-sample one-step residuals of fitted AR models.
+    
+    Args:
+        data (array-like): The series used by `fit_ar`
+        params (dict): Result of `fit_ar`
+        
+    Returns:
+        np.ndarray: Residuals shaped (n_series, n_periods - d - order), ready
+            for `residual_diagnostics`
+    """
+    panel, single = to_panel(data)
+    coef, _ = to_panel(params['coef'])
+    mean = np.atleast_1d(params['mean'])[:, np.newaxis]
+    
+    centered = _difference(panel, params['d']) - mean
+    residuals = centered[:, params['order']:] - _lagged_prediction(centered, coef)
+    return from_panel(residuals, single)
+
+def ar_forecast(data, params, horizon):
+    """
+    Forecast fitted AR models, undoing any differencing.
+    
+    Args:
+        data (array-like): The series used by `fit_ar`
+        params (dict): Result of `fit_ar`
+        horizon (int): Number of periods to forecast
+        
+    Returns:
+        np.ndarray: Forecasts shaped (horizon,) or (n_series, horizon)
+    """
+    panel, single = to_panel(data)
+    coef, _ = to_panel(params['coef'])
+    mean = np.atleast_1d(params['mean'])[:, np.newaxis]
+    order, d = params['order'], params['d']
+    
+    centered = _difference(panel, d) - mean
+    # Most recent value first, matching the coefficient order
+    history = centered[:, :-order-1:-1].copy()
+    forecasts = np.empty((panel.shape[0], horizon))
+    for h in range(horizon):
+        step = np.sum(coef * history, axis=1)
+        forecasts[:, h] = step
+        history = np.concatenate([step[:, np.newaxis], history[:, :-1]], axis=1)
+    forecasts += mean
+    
+    # Integrate back through each differencing level
+    for level in range(d - 1, -1, -1):
+        last = _difference(panel, level)[:, -1:]
+        forecasts = last + np.cumsum(forecasts, axis=1)
+    return from_panel(forecasts, single)
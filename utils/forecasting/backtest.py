@@ -0,0 +1,123 @@
+"""Rolling-origin backtests of the smoothing and moving-average methods."""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .panel import to_panel
+from .moving_average import simple_moving_average, weighted_moving_average
+from .state import SmoothingState
+from .accuracy import AccuracyAccumulator, naive_scale
+
+_STATEFUL = ('ses', 'holt', 'holt_winters')
+
+def rolling_origins(n_periods, initial, horizon, step=1):
+    """
+    Lazily generate forecast origins for a rolling-origin evaluation.
+    
+    An origin `t` means the model has seen periods `[0, t)` and forecasts
+    periods `[t, t + horizon)`. Only origins with a full horizon are produced.
+    
+    Args:
+        n_periods (int): Length of the series
+        initial (int): Length of the first training window
+        horizon (int): Number of periods forecast from each origin
+        step (int): Periods between consecutive origins
+        
+    Yields:
+        int: Forecast origin
+    """
+    if initial < 1 or horizon < 1 or step < 1:
+        raise ValueError("initial, horizon and step must be positive")
+    yield from range(initial, n_periods - horizon + 1, step)
+
+def _flat_forecaster(panel, kind, params, horizon):
+    """Return origin -> forecasts for the moving averages (computed once)."""
+    if kind == 'sma':
+        smoothed = simple_moving_average(panel, params['window'])
+    else:
+        smoothed = weighted_moving_average(panel, params['weights'])
+    return lambda origin: np.repeat(smoothed[:, origin-1:origin], horizon, axis=1)
+
+def _backtest_task(task):
+    """Backtest one method on one chunk of series; runs in a worker process."""
+    panel, name, kind, params, initial, horizon, step = task
+    n_series, n_periods = panel.shape
+    accumulator = AccuracyAccumulator()
+    scale = np.repeat(naive_scale(panel[:, :initial]), horizon)
+    labels = {'method': np.full(n_series * horizon, name),
+              'horizon': np.tile(np.arange(1, horizon + 1), n_series)}
+    
+    if kind in _STATEFUL:
+        # Fit once, then roll the state forward between adjacent origins
+        state = SmoothingState.from_history(panel[:, :initial], **params)
+        seen = initial
+    else:
+        forecaster = _flat_forecaster(panel, kind, params, horizon)
+    
+    for origin in rolling_origins(n_periods, initial, horizon, step):
+        if kind in _STATEFUL:
+            if origin > seen:
+                state.update(panel[:, seen:origin])
+                seen = origin
+            forecasts = state.forecast(horizon)
+        else:
+            forecasts = forecaster(origin)
+        accumulator.update(forecasts, panel[:, origin:origin + horizon], labels, scale)
+    
+    return accumulator
+
+def backtest(data, methods, initial, horizon, step=1, n_jobs=1, chunk_size=1000):
+    """
+    Evaluate forecasting methods with rolling forecast origins.
+    
+    Supported method kinds and their parameters:
+    
+    - 'sma': window
+    - 'wma': weights
+    - 'ses': alpha
+    - 'holt': alpha, beta
+    - 'holt_winters': alpha, beta, gamma, seasonal_periods, seasonal
+    
+    Moving averages are computed once over the whole panel and read at each
+    origin. Smoothing methods are fitted once on the first window and then
+    advanced with `SmoothingState.update` between origins instead of being
+    refitted. Every (method, chunk of series) pair is an independent task,
+    run on a process pool when `n_jobs > 1`.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        methods (dict): Method name -> (kind, parameter dict), e.g.
+            {'ses_0.2': ('ses', {'alpha': 0.2})}
+        initial (int): Length of the first training window
+        horizon (int): Number of periods forecast from each origin
+        step (int): Periods between consecutive origins
+        n_jobs (int): Number of worker processes
+        chunk_size (int): Number of series per task
+        
+    Returns:
+        pd.DataFrame: Accuracy metrics per (method, horizon); MASE is scaled
+            by the naive in-sample error over the first window
+    """
+    panel, _ = to_panel(data)
+    n_series, n_periods = panel.shape
+    if initial + horizon > n_periods:
+        raise ValueError("Series are too short for one full training window and horizon")
+    
+    for name, (kind, _) in methods.items():
+        if kind not in _STATEFUL + ('sma', 'wma'):
+            raise ValueError(f"Unknown method kind '{kind}' for '{name}'")
+    
+    tasks = [(panel[start:start + chunk_size], name, kind, params, initial, horizon, step)
+             for name, (kind, params) in methods.items()
+             for start in range(0, n_series, chunk_size)]
+    
+    if n_jobs == 1 or len(tasks) == 1:
+        accumulators = [_backtest_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            accumulators = list(executor.map(_backtest_task, tasks))
+    
+    total = AccuracyAccumulator()
+    for accumulator in accumulators:
+        total.merge(accumulator)
+    return total.result()
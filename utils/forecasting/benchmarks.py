@@ -0,0 +1,139 @@
+"""Timing comparisons between the panel engines and per-index Python loops.
+
+Run as a script to print the results:
+
+    python -m utils.forecasting.benchmarks
+"""
+import time
+
+import numpy as np
+
+from .moving_average import simple_moving_average, weighted_moving_average
+from .exponential_smoothing import simple_exponential_smoothing, holts_method
+
+def _best_time(func, repeat):
+    """Return the fastest wall-clock time of `repeat` calls to `func`."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def loop_simple_moving_average(data, window):
+    """Per-index reference implementation from the moving average notebook."""
+    data = np.asarray(data, dtype=float)
+    result = np.zeros_like(data)
+    result[:window-1] = np.nan
+    for i in range(window-1, len(data)):
+        result[i] = np.mean(data[i-window+1:i+1])
+    return result
+
+def loop_weighted_moving_average(data, weights):
+    """Per-index reference implementation from the moving average notebook."""
+    data = np.asarray(data, dtype=float)
+    window = len(weights)
+    result = np.zeros_like(data)
+    result[:window-1] = np.nan
+    for i in range(window-1, len(data)):
+        result[i] = np.sum(data[i-window+1:i+1] * weights)
+    return result
+
+def benchmark_moving_average(n_series=200, n_periods=1095, window=7, repeat=3, seed=42):
+    """
+    Time the panel moving averages against the notebook loops.
+    
+    Args:
+        n_series (int): Number of series in the synthetic panel
+        n_periods (int): Length of each series (default: 3 years of days)
+        window (int): Moving average window
+        repeat (int): Number of timing repetitions (best time is kept)
+        seed (int): Random seed for the synthetic demand
+        
+    Returns:
+        dict: Best times in seconds and speedups for SMA and WMA
+    """
+    rng = np.random.default_rng(seed)
+    panel = rng.poisson(50, size=(n_series, n_periods)).astype(float)
+    weights = np.arange(1, window + 1) / np.sum(np.arange(1, window + 1))
+    
+    timings = {
+        'sma_loop': _best_time(
+            lambda: [loop_simple_moving_average(row, window) for row in panel], repeat),
+        'sma_panel': _best_time(lambda: simple_moving_average(panel, window), repeat),
+        'wma_loop': _best_time(
+            lambda: [loop_weighted_moving_average(row, weights) for row in panel], repeat),
+        'wma_panel': _best_time(lambda: weighted_moving_average(panel, weights), repeat),
+    }
+    timings['sma_speedup'] = timings['sma_loop'] / timings['sma_panel']
+    timings['wma_speedup'] = timings['wma_loop'] / timings['wma_panel']
+    return timings
+
+def loop_simple_exponential_smoothing(data, alpha):
+    """Scalar recurrence from the exponential smoothing notebook (float input)."""
+    data = np.asarray(data, dtype=float)
+    result = np.zeros_like(data)
+    result[0] = data[0]
+    for t in range(1, len(data)):
+        result[t] = alpha * data[t] + (1 - alpha) * result[t-1]
+    return result
+
+def loop_holts_method(data, alpha, beta):
+    """Scalar recurrence from the exponential smoothing notebook."""
+    n = len(data)
+    result = np.zeros(n)
+    level = np.zeros(n)
+    trend = np.zeros(n)
+    level[0] = data[0]
+    trend[0] = data[1] - data[0]
+    result[0] = level[0]
+    for t in range(1, n):
+        prev_smooth = level[t-1] + trend[t-1]
+        level[t] = alpha * data[t] + (1 - alpha) * prev_smooth
+        trend[t] = beta * (level[t] - level[t-1]) + (1 - beta) * trend[t-1]
+        result[t] = level[t] + trend[t]
+    return result, level, trend
+
+def benchmark_exponential_smoothing(n_series=200, n_periods=1095, alpha=0.2, beta=0.3,
+                                    repeat=3, seed=42):
+    """
+    Time the panel SES and Holt engines against the notebook recurrences.
+    
+    Args:
+        n_series (int): Number of series in the synthetic panel
+        n_periods (int): Length of each series
+        alpha (float): Level smoothing parameter
+        beta (float): Trend smoothing parameter
+        repeat (int): Number of timing repetitions (best time is kept)
+        seed (int): Random seed for the synthetic demand
+        
+    Returns:
+        dict: Best times in seconds and speedups for SES and Holt
+    """
+    rng = np.random.default_rng(seed)
+    panel = rng.poisson(50, size=(n_series, n_periods)).astype(float)
+    
+    timings = {
+        'ses_loop': _best_time(
+            lambda: [loop_simple_exponential_smoothing(row, alpha) for row in panel], repeat),
+        'ses_panel': _best_time(lambda: simple_exponential_smoothing(panel, alpha), repeat),
+        'holt_loop': _best_time(
+            lambda: [loop_holts_method(row, alpha, beta) for row in panel], repeat),
+        'holt_panel': _best_time(lambda: holts_method(panel, alpha, beta), repeat),
+    }
+    timings['ses_speedup'] = timings['ses_loop'] / timings['ses_panel']
+    timings['holt_speedup'] = timings['holt_loop'] / timings['holt_panel']
+    return timings
+
+def _print_results(title, results):
+    """Print a benchmark result dictionary."""
+    print(title)
+    for name, value in results.items():
+        unit = 'x' if name.endswith('speedup') else 's'
+        print(f"  {name:<16}{value:>12.4f}{unit}")
+
+if __name__ == '__main__':
+    _print_results("Moving average (200 series x 1095 days, window 7)",
+                   benchmark_moving_average())
+    _print_results("Exponential smoothing (200 series x 1095 days)",
+                   benchmark_exponential_smoothing())
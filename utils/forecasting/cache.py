@@ -0,0 +1,245 @@
+"""Content-addressed cache for forecasting results."""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+def _update_hash(digest, value):
+    """Feed a function argument into the hash, recursing into containers."""
+    # Classes such as np.float64 expose __array_interface__ too, but are plain values
+    if isinstance(value, np.ndarray) or (hasattr(value, '__array_interface__')
+                                         and not isinstance(value, type)):
+        array = np.ascontiguousarray(value)
+        digest.update(f"ndarray:{array.dtype.str}:{array.shape}:".encode())
+        if array.dtype.hasobject:
+            # Object arrays hold references, so hash the elements themselves
+            for item in array.ravel().tolist():
+                _update_hash(digest, item)
+        else:
+            digest.update(array.view(np.uint8).data if array.size else b'')
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}:{len(value)}:".encode())
+        for item in value:
+            _update_hash(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict:{len(value)}:".encode())
+        for key in sorted(value, key=repr):
+            _update_hash(digest, key)
+            _update_hash(digest, value[key])
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes,
+                                             np.generic, np.dtype, type)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    else:
+        raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+def _result_nbytes(value):
+    """Approximate memory held by a cached result."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_result_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_result_nbytes(item) for item in value.values())
+    return sys.getsizeof(value)
+
+def _freeze(value):
+    """Make cached arrays read-only so callers cannot corrupt the cache."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    return value
+
+class ForecastCache:
+    """
+    LRU cache of forecasting results keyed on a hash of the inputs.
+    
+    Keys are BLAKE2b digests of the function name and the contents of every
+    argument (array bytes, dtype and shape plus parameter values), so an
+    unchanged history with unchanged parameters hits the cache no matter
+    which array object holds it. The in-memory tier is bounded by bytes and
+    evicts least recently used entries; an optional directory adds a
+    persistent tier that survives restarts. Cached arrays are returned
+    read-only.
+    
+    Args:
+        max_bytes (int): Memory budget of the in-memory tier
+        directory (str, optional): Directory of the on-disk tier
+    """
+    
+    def __init__(self, max_bytes=256 * 2**20, directory=None):
+        self.max_bytes = int(max_bytes)
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(name, args=(), kwargs=None):
+        """
+        Hash a function name and its arguments.
+        
+        Args:
+            name (str): Function identifier
+            args (tuple): Positional arguments
+            kwargs (dict, optional): Keyword arguments
+            
+        Returns:
+            str: Hex digest used as cache key
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        _update_hash(digest, name)
+        _update_hash(digest, tuple(args))
+        _update_hash(digest, dict(kwargs or {}))
+        return digest.hexdigest()
+    
+    def _path(self, key):
+        """File of a key in the on-disk tier."""
+        return os.path.join(self.directory, f"{key}.pkl")
+    
+    def _store_in_memory(self, key, value):
+        """Insert into the LRU, evicting old entries to respect the byte budget."""
+        size = _result_nbytes(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        while self._entries and self.current_bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+    
+    def get(self, key):
+        """
+        Look up a key in memory, then on disk.
+        
+        Args:
+            key (str): Cache key from `make_key`
+            
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, self._entries[key][0]
+        
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), 'rb') as handle:
+                value = _freeze(pickle.load(handle))
+            self._store_in_memory(key, value)
+            self.disk_hits += 1
+            return True, value
+        
+        self.misses += 1
+        return False, None
+    
+    def put(self, key, value):
+        """
+        Store a result in memory and, if configured, on disk.
+        
+        Args:
+            key (str): Cache key from `make_key`
+            value: Result to cache (arrays, tuples/dicts of arrays, ...)
+            
+        Returns:
+            The stored (read-only) value
+        """
+        value = _freeze(value)
+        self._store_in_memory(key, value)
+        if self.directory is not None:
+            # Write to a temporary file first so readers never see partial files
+            tmp_path = self._path(key) + '.tmp'
+            with open(tmp_path, 'wb') as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        return value
+    
+    def wrap(self, func):
+        """
+        Decorate a forecasting function so its results are cached.
+        
+        Calls are bound to the signature of `func` with defaults applied
+        before hashing, so `f(x, 7)`, `f(x, window=7)` and a call relying on
+        a default value share one key.
+        
+        Args:
+            func (callable): Function whose arguments are arrays and plain values
+            
+        Returns:
+            callable: Cached version of `func`
+        """
+        name = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = self.make_key(name, kwargs=bound.arguments)
+            found, value = self.get(key)
+            if found:
+                return value
+            return self.put(key, func(*args, **kwargs))
+        
+        wrapper.cache = self
+        return wrapper
+    
+    def clear(self, disk=False):
+        """
+        Empty the in-memory tier (and optionally the on-disk tier).
+        
+        Args:
+            disk (bool): Also delete cached files
+        """
+        self._entries.clear()
+        self.current_bytes = 0
+        if disk and self.directory is not None:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, filename))
+    
+    @property
+    def stats(self):
+        """Hit/miss counters and memory usage."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0
+        }
+
+def cached(func=None, cache=None):
+    """
+    Cache a forecasting function, e.g. `sma = cached(simple_moving_average)`.
+    
+    Args:
+        func (callable, optional): Function to wrap; omit to use as `@cached(cache=...)`
+        cache (ForecastCache, optional): Cache to use (a new in-memory cache if None)
+        
+    Returns:
+        callable: Cached function exposing its cache as `.cache`
+    """
+    if func is None:
+        return lambda f: cached(f, cache)
+    return (cache or ForecastCache()).wrap(func)
@@ -0,0 +1,189 @@
+"""Streaming pre-processing: rolling median/MAD outlier filter and resampling."""
+import numpy as np
+
+from .panel import to_panel, from_panel, factorize
+
+# Scales the MAD to a standard deviation under normality
+MAD_SCALE = 1.4826
+
+class _SortedWindows:
+    """
+    One sorted sliding window per series, updated in lockstep.
+    
+    Each update deletes or inserts a single value with a vectorized shift
+    of the sorted buffers (unused slots hold +inf), so windows are never
+    re-sorted; order statistics are then plain indexing.
+    """
+    
+    def __init__(self, n_series, window):
+        self.sorted = np.full((n_series, window), np.inf)
+        self.count = np.zeros(n_series, dtype=np.intp)
+        self.slots = np.arange(window)
+    
+    def _shift(self, rows, source):
+        """Gather each row of the buffer from the given slot indices."""
+        self.sorted[rows] = np.take_along_axis(self.sorted[rows], source, axis=1)
+    
+    def remove(self, values, mask):
+        """Delete one occurrence of `values` from the masked windows."""
+        rows = np.flatnonzero(mask)
+        position = np.sum(self.sorted[rows] < values[rows, np.newaxis], axis=1)
+        source = self.slots + (self.slots >= position[:, np.newaxis])
+        self._shift(rows, np.minimum(source, len(self.slots) - 1))
+        self.sorted[rows, -1] = np.inf
+        self.count[rows] -= 1
+    
+    def insert(self, values, mask):
+        """Insert `values` into the masked windows, keeping them sorted."""
+        rows = np.flatnonzero(mask)
+        position = np.sum(self.sorted[rows] < values[rows, np.newaxis], axis=1)
+        self._shift(rows, self.slots - (self.slots > position[:, np.newaxis]))
+        self.sorted[rows, position] = values[rows]
+        self.count[rows] += 1
+    
+    def _kth_distance(self, rows, center, k):
+        """k-th smallest |value - center|; the k nearest values are contiguous."""
+        window = self.sorted[rows]
+        low = np.zeros(len(rows), dtype=np.intp)
+        high = self.count[rows] - k
+        # Binary search for the block of k sorted values nearest to the center:
+        # slide it right while the value after it is closer than its first one
+        searching = low < high
+        while np.any(searching):
+            mid = (low + high) // 2
+            first = np.take_along_axis(window, mid[:, np.newaxis], axis=1)[:, 0]
+            after = np.minimum(mid + k, window.shape[1] - 1)
+            after = np.take_along_axis(window, after[:, np.newaxis], axis=1)[:, 0]
+            shift = searching & (center - first > after - center)
+            low = np.where(shift, mid + 1, low)
+            high = np.where(searching & ~shift, mid, high)
+            searching = low < high
+        first = window[np.arange(len(rows)), low]
+        last = window[np.arange(len(rows)), low + k - 1]
+        return np.maximum(center - first, last - center)
+    
+    def median_mad(self, rows):
+        """Median and median absolute deviation of the masked windows."""
+        count = self.count[rows]
+        lower, upper = (count + 1) // 2, count // 2 + 1
+        median = (self.sorted[rows, lower - 1] + self.sorted[rows, upper - 1]) / 2
+        mad = (self._kth_distance(rows, median, lower)
+               + self._kth_distance(rows, median, upper)) / 2
+        return median, mad
+
+def rolling_median_filter(data, window, n_mads=3.0, min_periods=None, min_mad=0.0,
+                          chunk_size=1000, dtype=np.float64):
+    """
+    Replace spikes by the rolling median (a causal Hampel filter).
+    
+    A value is an outlier when it is more than `n_mads` scaled MADs away
+    from the median of the trailing window ending at it. Each window is a
+    sorted buffer updated as it slides (one delete and one insert per
+    period) rather than re-sorted, the MAD is found by binary search over
+    that buffer, and all series of a chunk slide together. Missing values (NaN) are skipped and
+    kept as NaN; the raw values, not the cleaned ones, stay in the window.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        window (int): Number of trailing periods in each window
+        n_mads (float): Outlier threshold in scaled MADs (1.4826 * MAD)
+        min_periods (int, optional): Minimum observed values in a window
+            before flagging (default: window // 2 + 1)
+        min_mad (float): Floor on the scaled MAD, so near-constant or
+            intermittent windows do not flag every non-median value
+        chunk_size (int): Number of series processed at a time
+        dtype (numpy dtype): Floating point dtype used for the computation
+    
+    Returns:
+        tuple: (Cleaned values, Boolean outlier mask), each with the same
+            shape as `data`
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if min_periods is None:
+        min_periods = window // 2 + 1
+    
+    panel, single = to_panel(data, dtype)
+    n_series, n_periods = panel.shape
+    cleaned = panel.copy()
+    outliers = np.zeros(panel.shape, dtype=bool)
+    
+    for start in range(0, n_series, chunk_size):
+        values = panel[start:start + chunk_size]
+        observed = np.isfinite(values)
+        windows = _SortedWindows(values.shape[0], window)
+        
+        for t in range(n_periods):
+            if t >= window:
+                windows.remove(values[:, t - window], observed[:, t - window])
+            windows.insert(values[:, t], observed[:, t])
+            
+            rows = np.flatnonzero(observed[:, t] & (windows.count >= min_periods))
+            if not len(rows):
+                continue
+            median, mad = windows.median_mad(rows)
+            threshold = n_mads * np.maximum(MAD_SCALE * mad, min_mad)
+            flagged = np.abs(values[rows, t] - median) > threshold
+            
+            outliers[start + rows[flagged], t] = True
+            cleaned[start + rows[flagged], t] = median[flagged]
+    
+    return from_panel(cleaned, single), from_panel(outliers, single)
+
+def resample_panel(data, buckets, how='sum', chunk_size=1000, dtype=np.float64):
+    """
+    Aggregate every series to coarser time buckets (e.g. hourly to daily).
+    
+    All series of a chunk are aggregated with one `np.bincount` over
+    (series, bucket) pairs instead of a pandas `resample` per series.
+    Missing values (NaN) are ignored.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        buckets (int or array-like): Number of consecutive periods per bucket
+            (a partial last bucket is kept), or one bucket label per period,
+            e.g. `index.floor('D')` of an hourly DatetimeIndex
+        how (str): 'sum' or 'mean'
+        chunk_size (int): Number of series aggregated at a time
+        dtype (numpy dtype): Floating point dtype of the result
+    
+    Returns:
+        tuple: (Resampled values shaped (n_buckets,) or (n_series, n_buckets),
+            sorted bucket labels, or the first period of each bucket when
+            `buckets` is an integer)
+    """
+    if how not in ('sum', 'mean'):
+        raise ValueError("how must be 'sum' or 'mean'")
+    
+    panel, single = to_panel(data, dtype)
+    n_series, n_periods = panel.shape
+    if np.ndim(buckets) == 0:
+        if int(buckets) < 1:
+            raise ValueError("buckets must be a positive integer or one label per period")
+        bucket_index = np.arange(n_periods) // int(buckets)
+        labels = np.arange(0, n_periods, int(buckets))
+    else:
+        buckets = np.asarray(buckets)
+        if buckets.shape != (n_periods,):
+            raise ValueError("buckets must be a positive integer or one label per period")
+        labels, bucket_index = factorize(buckets)
+    n_buckets = len(labels)
+    
+    result = np.empty((n_series, n_buckets), dtype=panel.dtype)
+    for start in range(0, n_series, chunk_size):
+        values = panel[start:start + chunk_size]
+        n_rows = values.shape[0]
+        observed = np.isfinite(values)
+        flat = (np.arange(n_rows)[:, np.newaxis] * n_buckets + bucket_index).ravel()
+        
+        size = n_rows * n_buckets
+        totals = np.bincount(flat, weights=np.where(observed, values, 0).ravel(),
+                             minlength=size).reshape(n_rows, n_buckets)
+        if how == 'mean':
+            counts = np.bincount(flat, weights=observed.ravel(),
+                                 minlength=size).reshape(n_rows, n_buckets)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                totals = totals / counts
+        result[start:start + n_rows] = totals
+    
+    return from_panel(result, single), labels
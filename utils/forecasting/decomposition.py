@@ -0,0 +1,157 @@
+"""Additive decomposition with several seasonal periods, chunked over series."""
+import os
+
+import numpy as np
+from scipy.ndimage import convolve1d
+
+def _centered_moving_average(values, period):
+    """
+    Centered moving average along the time axis of a 2-D chunk.
+    
+    Even periods use the usual 2 x m average. The edges are extended with
+    the nearest value so the trend is defined for every period.
+    """
+    if period % 2:
+        kernel = np.ones(period) / period
+    else:
+        kernel = np.r_[0.5, np.ones(period - 1), 0.5] / period
+    return convolve1d(values, kernel, axis=1, mode='nearest')
+
+def _phase_means(detrended, period):
+    """Zero-mean seasonal indices repeated over the whole time axis."""
+    n_rows, n_periods = detrended.shape
+    n_cycles = -(-n_periods // period)
+    padded = np.full((n_rows, n_cycles * period), np.nan)
+    padded[:, :n_periods] = detrended
+    
+    indices = np.nanmean(padded.reshape(n_rows, n_cycles, period), axis=1)
+    indices -= indices.mean(axis=1, keepdims=True)
+    return np.tile(indices, n_cycles)[:, :n_periods]
+
+def _decompose_chunk(values, periods, n_iter, trend_period):
+    """
+    Decompose a (n_series, n_periods) chunk into trend, seasonals and residual.
+    
+    The trend is a centered moving average over `trend_period`; with no
+    seasonal periods the chunk is trend-only.
+    """
+    seasonals = np.zeros((len(periods),) + values.shape)
+    deseasonalized = values.copy()
+    
+    # Backfitting: re-estimate each seasonal on data without the others
+    for _ in range(n_iter):
+        for k, period in enumerate(periods):
+            deseasonalized += seasonals[k]
+            detrended = deseasonalized - _centered_moving_average(deseasonalized, period)
+            seasonals[k] = _phase_means(detrended, period)
+            deseasonalized -= seasonals[k]
+    
+    trend = _centered_moving_average(deseasonalized, trend_period)
+    return trend, seasonals, deseasonalized - trend
+
+def _period_table(periods, n_series):
+    """Per-series periods sorted ascending with unused (0) slots last."""
+    if isinstance(periods, np.ndarray) and periods.ndim == 2:
+        if periods.shape[0] != n_series:
+            raise ValueError("Per-series periods must have one row per series")
+        table = np.where(periods > 0, periods, np.iinfo(np.int64).max).astype(np.int64)
+        table = np.sort(table, axis=1)
+        table[table == np.iinfo(np.int64).max] = 0
+        if np.all(table == 0):
+            raise ValueError("At least one series needs a seasonal period")
+        return table, True
+    shared = sorted(int(p) for p in np.atleast_1d(periods) if p != 0)
+    if not shared:
+        raise ValueError("At least one seasonal period is required")
+    return np.tile(np.array(shared, dtype=np.int64), (n_series, 1)), False
+
+def multi_seasonal_decompose(data, periods, n_iter=2, chunk_size=256, out_dir=None):
+    """
+    Decompose series into trend, several seasonal components and residual.
+    
+    Follows the MSTL idea with moving averages in place of LOESS: seasonal
+    components are extracted shortest period first, each from the data with
+    the other seasonals removed, and refined over `n_iter` backfitting
+    passes. All periods are estimated together from a single read of each
+    chunk of series, so `data` can be a `np.memmap` larger than memory and
+    the components can be written straight to memory-mapped .npy files.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods),
+            e.g. a memory-mapped hourly panel
+        periods (int, list or np.ndarray): Seasonal period(s) shared by all
+            series, e.g. [24, 24*7], or a 2-D integer array with the periods
+            of each series (0 = unused slot), such as the output of
+            `detect_seasonal_periods`; series without any period are
+            trend-only, with zero seasonals and a moving-average trend over
+            the longest period in the table
+        n_iter (int): Number of backfitting passes
+        chunk_size (int): Number of series decomposed at a time
+        out_dir (str, optional): Directory for trend.npy, seasonal.npy and
+            resid.npy memory-mapped outputs; in-memory arrays if None
+    
+    Returns:
+        dict: 'trend' and 'resid' shaped like `data`, 'seasonal' shaped
+            (n_slots,) + data.shape and 'periods' (the sorted list of shared
+            periods, or the per-series table matching the seasonal slots)
+    """
+    if n_iter < 1:
+        raise ValueError("n_iter must be at least 1")
+    
+    # Memory-mapped panels pass through unchanged and are read chunk by chunk
+    if not isinstance(data, np.ndarray):
+        data = np.asarray(data)
+    single = data.ndim == 1
+    source = data[np.newaxis, :] if single else data
+    if source.ndim != 2:
+        raise ValueError("data must be 1-D (time) or 2-D (series x time)")
+    n_series, n_periods = source.shape
+    
+    table, per_series = _period_table(periods, n_series)
+    used = table[table > 0]
+    if used.min() < 2:
+        raise ValueError("Seasonal periods must be at least 2")
+    if n_periods < 2 * used.max():
+        raise ValueError("Series must cover at least two cycles of the longest period")
+    
+    shape = (n_series, n_periods)
+    seasonal_shape = (table.shape[1],) + shape
+    if out_dir is None:
+        trend, seasonal, resid = np.empty(shape), np.empty(seasonal_shape), np.empty(shape)
+    else:
+        os.makedirs(out_dir, exist_ok=True)
+        open_memmap = np.lib.format.open_memmap
+        trend = open_memmap(os.path.join(out_dir, 'trend.npy'), 'w+', np.float64, shape)
+        seasonal = open_memmap(os.path.join(out_dir, 'seasonal.npy'), 'w+', np.float64,
+                               seasonal_shape)
+        resid = open_memmap(os.path.join(out_dir, 'resid.npy'), 'w+', np.float64, shape)
+    
+    for start in range(0, n_series, chunk_size):
+        stop = min(start + chunk_size, n_series)
+        values = np.asarray(source[start:stop], dtype=np.float64)
+        chunk_seasonal = np.zeros((table.shape[1],) + values.shape)
+        chunk_trend = np.empty_like(values)
+        chunk_resid = np.empty_like(values)
+        
+        # Series sharing the same set of periods are decomposed together
+        groups, group_index = np.unique(table[start:stop], axis=0, return_inverse=True)
+        for g, group_periods in enumerate(groups):
+            rows = np.flatnonzero(group_index.ravel() == g)
+            group_periods = [int(p) for p in group_periods if p > 0]
+            trend_period = group_periods[-1] if group_periods else int(used.max())
+            chunk_trend[rows], group_seasonal, chunk_resid[rows] = \
+                _decompose_chunk(values[rows], group_periods, n_iter, trend_period)
+            chunk_seasonal[:len(group_periods), rows] = group_seasonal
+        
+        trend[start:stop] = chunk_trend
+        seasonal[:, start:stop] = chunk_seasonal
+        resid[start:stop] = chunk_resid
+    
+    if out_dir is not None:
+        for array in (trend, seasonal, resid):
+            array.flush()
+    if single:
+        trend, seasonal, resid = trend[0], seasonal[:, 0], resid[0]
+    
+    periods = table if per_series else [int(p) for p in table[0]]
+    return {'trend': trend, 'seasonal': seasonal, 'resid': resid, 'periods': periods}
@@ -0,0 +1,127 @@
+"""Batched residual diagnostics: FFT autocorrelation, Ljung-Box and white-noise tests."""
+import numpy as np
+from scipy import fft, stats
+
+from .panel import to_panel, from_panel
+
+def autocorrelation(residuals, max_lag=None, demean=True):
+    """
+    Autocorrelation function of one or many series computed with the FFT.
+    
+    Runs in O(n log n) per series instead of the O(n^2) of
+    `np.correlate(..., mode='full')`, and handles a whole panel at once.
+    
+    Args:
+        residuals (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        max_lag (int, optional): Largest lag returned (default: n_periods - 1)
+        demean (bool): Subtract each series' mean first; False reproduces
+            the raw `np.correlate` normalization
+            
+    Returns:
+        np.ndarray: Autocorrelations for lags 0..max_lag, shaped
+            (max_lag + 1,) or (n_series, max_lag + 1)
+    """
+    panel, single = to_panel(residuals)
+    n_periods = panel.shape[1]
+    max_lag = n_periods - 1 if max_lag is None else min(int(max_lag), n_periods - 1)
+    if demean:
+        panel = panel - panel.mean(axis=1, keepdims=True)
+    
+    # Zero-pad to avoid circular wrap-around
+    n_fft = fft.next_fast_len(2 * n_periods - 1, real=True)
+    spectrum = fft.rfft(panel, n_fft, axis=1)
+    acov = fft.irfft(spectrum * np.conj(spectrum), n_fft, axis=1)[:, :max_lag + 1]
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        acf = acov / acov[:, :1]
+    return from_panel(acf, single)
+
+def ljung_box(residuals, lags=10):
+    """
+    Ljung-Box test for autocorrelation up to `lags`, for every series.
+    
+    Args:
+        residuals (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        lags (int): Number of lags included in the statistic
+        
+    Returns:
+        tuple: (Q statistics, p-values), one value per series
+    """
+    panel, single = to_panel(residuals)
+    n_periods = panel.shape[1]
+    if not 1 <= lags < n_periods:
+        raise ValueError("lags must be between 1 and n_periods - 1")
+    
+    acf = autocorrelation(panel, max_lag=lags)[:, 1:]
+    k = np.arange(1, lags + 1)
+    q_stat = n_periods * (n_periods + 2) * np.sum(acf**2 / (n_periods - k), axis=1)
+    p_value = stats.chi2.sf(q_stat, lags)
+    return from_panel(q_stat, single), from_panel(p_value, single)
+
+def _levene_halves(panel):
+    """Median-centred Levene test comparing the two halves of each series."""
+    half = panel.shape[1] // 2
+    groups = (panel[:, :half], panel[:, half:])
+    deviations = [np.abs(g - np.median(g, axis=1, keepdims=True)) for g in groups]
+    sizes = np.array([g.shape[1] for g in groups])
+    n_total = sizes.sum()
+    
+    group_means = np.stack([d.mean(axis=1) for d in deviations], axis=1)
+    grand_mean = (group_means * sizes).sum(axis=1) / n_total
+    between = (sizes * (group_means - grand_mean[:, np.newaxis])**2).sum(axis=1)
+    within = sum(((d - m[:, np.newaxis])**2).sum(axis=1)
+                 for d, m in zip(deviations, group_means.T))
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        statistic = (n_total - 2) * between / within
+    return stats.f.sf(statistic, 1, n_total - 2)
+
+def residual_diagnostics(residuals, significance_level=0.05, lags=None):
+    """
+    Run the white-noise checks of `check_arima_residuals` on many series at once.
+    
+    Each test is computed for the whole panel in one vectorized call: a
+    one-sample t-test for zero mean, Levene's test between the two halves
+    for constant variance, D'Agostino's normality test and Ljung-Box on the
+    first `lags` autocorrelations. The +/- 2/sqrt(n) bound is reported too,
+    but is left out of the verdict: with several lags, white noise breaks
+    it by chance far more often than `significance_level`.
+    
+    Args:
+        residuals (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        significance_level (float): Significance level for statistical tests
+        lags (int, optional): Autocorrelation lags tested
+            (default: min(10, n_periods // 5))
+            
+    Returns:
+        dict: Per-series p-values ('mean_p', 'levene_p', 'normality_p',
+            'ljung_box_p'), 'acf_within_bounds' and the combined 'white_noise' verdict
+    """
+    panel, single = to_panel(residuals)
+    n_periods = panel.shape[1]
+    if n_periods < 20:
+        raise ValueError("At least 20 observations are needed for the normality test")
+    if lags is None:
+        lags = min(10, n_periods // 5)
+    
+    mean_p = stats.ttest_1samp(panel, 0, axis=1).pvalue
+    levene_p = _levene_halves(panel)
+    normality_p = stats.normaltest(panel, axis=1).pvalue
+    _, ljung_box_p = ljung_box(panel, lags)
+    acf = autocorrelation(panel, max_lag=lags)[:, 1:]
+    acf_within_bounds = np.all(np.abs(acf) <= 2 / np.sqrt(n_periods), axis=1)
+    
+    white_noise = ((mean_p >= significance_level) &
+                   (levene_p >= significance_level) &
+                   (normality_p >= significance_level) &
+                   (ljung_box_p >= significance_level))
+    
+    results = {
+        'mean_p': mean_p,
+        'levene_p': levene_p,
+        'normality_p': normality_p,
+        'ljung_box_p': ljung_box_p,
+        'acf_within_bounds': acf_within_bounds,
+        'white_noise': white_noise
+    }
+    return {k: from_panel(v, single) for k, v in results.items()}
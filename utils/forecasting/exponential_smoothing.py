@@ -0,0 +1,119 @@
+"""Simple and Holt exponential smoothing for whole panels of series."""
+import numpy as np
+from scipy.signal import lfilter
+
+from .panel import to_panel, from_panel
+
+def _smoothing_parameter(value, n_series, name, dtype):
+    """Validate a scalar or per-series smoothing parameter and broadcast it."""
+    value = np.asarray(value, dtype=dtype)
+    if value.ndim > 1 or (value.ndim == 1 and len(value) != n_series):
+        raise ValueError(f"{name} must be a scalar or have one value per series")
+    if np.any((value < 0) | (value > 1)):
+        raise ValueError(f"{name} must be between 0 and 1")
+    return np.broadcast_to(value, (n_series,))
+
+def simple_exponential_smoothing(data, alpha, dtype=np.float64):
+    """
+    Implement simple exponential smoothing for one or many series.
+    
+    The recurrence `s[t] = alpha * x[t] + (1 - alpha) * s[t-1]` with
+    `s[0] = x[0]` is a first-order linear filter. A scalar `alpha` is
+    applied to the whole panel with `scipy.signal.lfilter`; per-series
+    values are handled with a time-step loop vectorized across series.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        alpha (float or array-like): Smoothing parameter between 0 and 1,
+            either shared or one value per series
+        dtype (numpy dtype): Floating point dtype used for the computation
+        
+    Returns:
+        np.ndarray: Smoothed values with the same shape as `data`
+    """
+    panel, single = to_panel(data, dtype)
+    n_series, n_periods = panel.shape
+    if n_periods == 0:
+        return from_panel(panel.copy(), single)
+    
+    if np.ndim(alpha) == 0:
+        alpha = _smoothing_parameter(alpha, n_series, 'alpha', panel.dtype)[0]
+        b = np.array([alpha], dtype=panel.dtype)
+        a = np.array([1, alpha - 1], dtype=panel.dtype)
+        zi = (1 - alpha) * panel[:, :1]
+        result, _ = lfilter(b, a, panel, axis=1, zi=zi)
+        return from_panel(result.astype(panel.dtype, copy=False), single)
+    
+    alpha = _smoothing_parameter(alpha, n_series, 'alpha', panel.dtype)
+    values = np.ascontiguousarray(panel.T)
+    result = np.empty_like(values)
+    result[0] = values[0]
+    for t in range(1, n_periods):
+        result[t] = alpha * values[t] + (1 - alpha) * result[t-1]
+    return from_panel(np.ascontiguousarray(result.T), single)
+
+def holts_method(data, alpha, beta, dtype=np.float64):
+    """
+    Implement Holt's double exponential smoothing for one or many series.
+    
+    Uses the same initialization as the exponential smoothing notebook:
+    the level starts at the first observation and the trend at the first
+    difference. Each time step updates every series at once.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+            with at least two periods
+        alpha (float or array-like): Level smoothing parameter, shared or per series
+        beta (float or array-like): Trend smoothing parameter, shared or per series
+        dtype (numpy dtype): Floating point dtype used for the computation
+        
+    Returns:
+        tuple: (Smoothed values, Level component, Trend component), each
+            with the same shape as `data`
+    """
+    panel, single = to_panel(data, dtype)
+    n_series, n_periods = panel.shape
+    if n_periods < 2:
+        raise ValueError("Holt's method needs at least two periods")
+    
+    alpha = _smoothing_parameter(alpha, n_series, 'alpha', panel.dtype)
+    beta = _smoothing_parameter(beta, n_series, 'beta', panel.dtype)
+    
+    # Work time-major so each step reads and writes contiguous rows
+    values = np.ascontiguousarray(panel.T)
+    level = np.empty_like(values)
+    trend = np.empty_like(values)
+    
+    # Initialize
+    level[0] = values[0]
+    trend[0] = values[1] - values[0]
+    
+    for t in range(1, n_periods):
+        prev_smooth = level[t-1] + trend[t-1]
+        level[t] = alpha * values[t] + (1 - alpha) * prev_smooth
+        trend[t] = beta * (level[t] - level[t-1]) + (1 - beta) * trend[t-1]
+    
+    result = level + trend
+    result[0] = level[0]
+    
+    level, trend, result = (np.ascontiguousarray(a.T) for a in (level, trend, result))
+    return (from_panel(result, single), from_panel(level, single),
+            from_panel(trend, single))
+
+def holts_forecast(level, trend, horizon):
+    """
+    Extrapolate Holt's method from the last level and trend.
+    
+    Args:
+        level (array-like): Level component returned by `holts_method`
+        trend (array-like): Trend component returned by `holts_method`
+        horizon (int): Number of periods to forecast
+        
+    Returns:
+        np.ndarray: Forecasts shaped (horizon,) or (n_series, horizon)
+    """
+    level, single = to_panel(level)
+    trend, _ = to_panel(trend)
+    steps = np.arange(1, horizon + 1)
+    forecasts = level[:, -1:] + steps * trend[:, -1:]
+    return from_panel(forecasts, single)
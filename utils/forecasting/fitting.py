@@ -0,0 +1,246 @@
+"""Fit exponential smoothing parameters for every series in a panel."""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .panel import to_panel
+
+_GOLDEN = (np.sqrt(5) - 1) / 2
+
+def _one_step_mse(values, index, alpha, beta=None):
+    """
+    Mean squared one-step-ahead error for many candidate parameter sets.
+    
+    Args:
+        values (np.ndarray): Time-major panel shaped (n_periods, n_series)
+        index (np.ndarray): Series index evaluated by each candidate
+        alpha (np.ndarray): Level parameter of each candidate
+        beta (np.ndarray, optional): Trend parameter of each candidate (Holt)
+        
+    Returns:
+        np.ndarray: Mean squared error of each candidate
+    """
+    n_periods = values.shape[0]
+    level = values[0, index]
+    sse = np.zeros(len(index))
+    
+    if beta is None:
+        for t in range(1, n_periods):
+            error = values[t, index] - level
+            sse += error**2
+            level = level + alpha * error
+        return sse / (n_periods - 1)
+    
+    # The initial trend makes the first forecast exact, so errors start at t=2
+    trend = values[1, index] - level
+    for t in range(1, n_periods):
+        forecast = level + trend
+        error = values[t, index] - forecast
+        if t >= 2:
+            sse += error**2
+        new_level = forecast + alpha * error
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        level = new_level
+    return sse / (n_periods - 2)
+
+def _grid_search(values, grid, holt):
+    """Evaluate every grid point for every series and keep the best."""
+    n_series = values.shape[1]
+    if holt:
+        alphas, betas = (g.ravel() for g in np.meshgrid(grid, grid, indexing='ij'))
+    else:
+        alphas, betas = grid, None
+    n_points = len(alphas)
+    
+    index = np.repeat(np.arange(n_series), n_points)
+    alpha = np.tile(alphas, n_series)
+    beta = np.tile(betas, n_series) if holt else None
+    mse = _one_step_mse(values, index, alpha, beta).reshape(n_series, n_points)
+    
+    best = np.argmin(mse, axis=1)
+    return alphas[best], (betas[best] if holt else None)
+
+def _golden_section(objective, lo, hi, n_iter):
+    """
+    Vectorized golden-section search of `objective` on per-series brackets.
+    
+    `objective` receives candidate values for every series, stacked one or
+    more times, and returns their losses in the same order.
+    """
+    n = len(lo)
+    c = hi - _GOLDEN * (hi - lo)
+    d = lo + _GOLDEN * (hi - lo)
+    f = objective(np.concatenate([c, d]))
+    fc, fd = f[:n], f[n:]
+    
+    # Each iteration keeps one interior point and evaluates one new point
+    for _ in range(n_iter):
+        left = fc < fd
+        hi = np.where(left, d, hi)
+        lo = np.where(left, lo, c)
+        new_c = hi - _GOLDEN * (hi - lo)
+        new_d = lo + _GOLDEN * (hi - lo)
+        f_new = objective(np.where(left, new_c, new_d))
+        c, d = np.where(left, new_c, d), np.where(left, c, new_d)
+        fc, fd = np.where(left, f_new, fd), np.where(left, fc, f_new)
+    return (lo + hi) / 2
+
+def _refine(values, alpha, beta, radius, n_iter, n_sweeps):
+    """Refine parameters inside [x - radius, x + radius] clipped to [0, 1]."""
+    series = np.arange(values.shape[1])
+    
+    def bracket(x):
+        return np.clip(x - radius, 0, 1), np.clip(x + radius, 0, 1)
+    
+    def loss(a, b=None):
+        # Candidates arrive stacked per series, so repeat the series index
+        index = np.resize(series, len(a))
+        return _one_step_mse(values, index, a, None if b is None else np.resize(b, len(a)))
+    
+    if beta is None:
+        return _golden_section(loss, *bracket(alpha), n_iter), None
+    
+    # Coordinate-wise search: alternate between alpha and beta
+    for _ in range(n_sweeps):
+        alpha = _golden_section(lambda a: loss(a, beta), *bracket(alpha), n_iter)
+        beta = _golden_section(lambda b: loss(np.resize(alpha, len(b)), b),
+                               *bracket(beta), n_iter)
+    return alpha, beta
+
+def _fit_chunk(task):
+    """Fit one chunk of series; runs in a worker process."""
+    panel, initial_alpha, initial_beta, holt, grid_size, n_iter, n_sweeps = task
+    values = np.ascontiguousarray(panel.T)
+    grid = np.linspace(0, 1, grid_size)
+    step = 1 / (grid_size - 1)
+    
+    # Warm-started series skip the grid and search a narrower bracket
+    warm = ~np.isnan(initial_alpha)
+    if holt:
+        warm &= ~np.isnan(initial_beta)
+    alpha = initial_alpha.copy()
+    beta = initial_beta.copy() if holt else None
+    radius = np.where(warm, step / 2, step)
+    
+    cold = ~warm
+    if cold.any():
+        grid_alpha, grid_beta = _grid_search(values[:, cold], grid, holt)
+        alpha[cold] = grid_alpha
+        if holt:
+            beta[cold] = grid_beta
+    
+    alpha, beta = _refine(values, alpha, beta, radius, n_iter, n_sweeps)
+    index = np.arange(values.shape[1])
+    mse = _one_step_mse(values, index, alpha, beta)
+    return alpha, beta, mse
+
+def fit_smoothing_parameters(data, method='ses', initial=None, grid_size=11, n_iter=20,
+                             n_sweeps=2, n_jobs=1, chunk_size=1000):
+    """
+    Fit the smoothing parameters of every series by minimizing in-sample MSE.
+    
+    The objective is the mean squared one-step-ahead forecast error (the
+    smoothed value itself would trivially favour alpha = 1). Each series is
+    fitted with a coarse grid evaluated for all series at once, followed by
+    a vectorized golden-section search around the best grid point, which
+    alternates between alpha and beta for Holt's method. Chunks of series
+    are distributed over a process pool when `n_jobs > 1`.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        method (str): 'ses' for simple exponential smoothing or 'holt'
+        initial (dict, optional): Previously fitted parameters (as returned by
+            this function or `load_parameters`); series with finite values
+            skip the grid and refine around them
+        grid_size (int): Number of grid points per parameter in [0, 1]
+        n_iter (int): Golden-section iterations per refinement
+        n_sweeps (int): Alpha/beta alternations for Holt's method
+        n_jobs (int): Number of worker processes
+        chunk_size (int): Number of series per worker task
+        
+    Returns:
+        dict: 'alpha', 'beta' (None for SES) and 'mse' arrays, one value per series
+    """
+    if method not in ('ses', 'holt'):
+        raise ValueError("method must be 'ses' or 'holt'")
+    if grid_size < 2:
+        raise ValueError("grid_size must be at least 2")
+    
+    holt = method == 'holt'
+    panel, _ = to_panel(data)
+    n_series, n_periods = panel.shape
+    if n_periods < (3 if holt else 2):
+        raise ValueError("Not enough periods to compute one-step-ahead errors")
+    
+    initial = initial or {}
+    initial_alpha = np.full(n_series, np.nan)
+    initial_beta = np.full(n_series, np.nan)
+    if initial.get('alpha') is not None:
+        initial_alpha[:] = initial['alpha']
+    if holt and initial.get('beta') is not None:
+        initial_beta[:] = initial['beta']
+    
+    tasks = [(panel[start:start + chunk_size], initial_alpha[start:start + chunk_size],
+              initial_beta[start:start + chunk_size], holt, grid_size, n_iter, n_sweeps)
+             for start in range(0, n_series, chunk_size)]
+    
+    if n_jobs == 1 or len(tasks) == 1:
+        results = [_fit_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_fit_chunk, tasks))
+    
+    return {
+        'alpha': np.concatenate([r[0] for r in results]),
+        'beta': np.concatenate([r[1] for r in results]) if holt else None,
+        'mse': np.concatenate([r[2] for r in results])
+    }
+
+def save_parameters(path, params, series_ids=None):
+    """
+    Save fitted parameters so a later run can warm-start from them.
+    
+    Args:
+        path (str): Destination .npz file
+        params (dict): Result of `fit_smoothing_parameters`
+        series_ids (array-like, optional): Identifier of each series
+    """
+    arrays = {k: np.asarray(v) for k, v in params.items() if v is not None}
+    if series_ids is not None:
+        arrays['series_ids'] = np.asarray(series_ids)
+    np.savez(path, **arrays)
+
+def load_parameters(path, series_ids=None):
+    """
+    Load parameters saved with `save_parameters`.
+    
+    Args:
+        path (str): .npz file written by `save_parameters`
+        series_ids (array-like, optional): Identifiers of the series to fit
+            next; saved values are reordered to match them and unknown
+            series get NaN (cold start)
+            
+    Returns:
+        dict: 'alpha', 'beta' and 'mse' arrays (missing keys are None)
+    """
+    with np.load(path) as saved:
+        stored = {k: saved[k] for k in saved.files}
+    params = {k: stored.get(k) for k in ('alpha', 'beta', 'mse')}
+    if series_ids is None:
+        return params
+    
+    if 'series_ids' not in stored:
+        raise ValueError("File has no series_ids to align against")
+    lookup = {sid: i for i, sid in enumerate(stored['series_ids'].tolist())}
+    rows = np.array([lookup.get(sid, -1) for sid in np.asarray(series_ids).tolist()])
+    found = rows >= 0
+    
+    aligned = {}
+    for key, values in params.items():
+        if values is None:
+            aligned[key] = None
+            continue
+        column = np.full(len(rows), np.nan)
+        column[found] = values[rows[found]]
+        aligned[key] = column
+    return aligned
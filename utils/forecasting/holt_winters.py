@@ -0,0 +1,175 @@
+"""Holt-Winters (triple exponential smoothing) for whole panels of series."""
+import numpy as np
+
+from .panel import to_panel, from_panel
+from .exponential_smoothing import (
+    _smoothing_parameter,
+    simple_exponential_smoothing,
+    holts_method
+)
+
+def _seasonal_periods(seasonal_periods, n_series):
+    """Validate a scalar or per-series seasonal period and broadcast it."""
+    periods = np.asarray(seasonal_periods)
+    if periods.ndim == 2 and periods.shape[1] == 1:
+        # Single-column output of detect_seasonal_periods
+        periods = periods[:, 0]
+    if periods.ndim > 1 or (periods.ndim == 1 and len(periods) != n_series):
+        raise ValueError("seasonal_periods must be an integer or have one value per series")
+    if not np.issubdtype(periods.dtype, np.integer) or np.any((periods < 2) & (periods != 0)):
+        raise ValueError("seasonal_periods must be 0 (no season) or integers of at least 2")
+    if np.all(periods == 0):
+        raise ValueError("At least one series needs a seasonal period")
+    return np.broadcast_to(periods, (n_series,))
+
+def _holt_winters_group(values, period, alpha, beta, gamma, multiplicative):
+    """
+    Run the Holt-Winters recurrence for series sharing one seasonal period.
+    
+    Args:
+        values (np.ndarray): Time-major panel shaped (n_periods, n_series)
+        period (int): Seasonal period shared by the series
+        alpha, beta, gamma (np.ndarray): Per-series parameters (beta may be None)
+        multiplicative (bool): Use multiplicative instead of additive seasonality
+        
+    Returns:
+        tuple: Time-major (level, trend, season) arrays
+    """
+    level = np.empty_like(values)
+    trend = np.zeros_like(values)
+    season = np.empty_like(values)
+    
+    # Initialize from the first (and second) full season
+    level[:period] = values[:period].mean(axis=0)
+    if beta is not None:
+        trend[:period] = (values[period:2*period].mean(axis=0) - level[0]) / period
+    if multiplicative:
+        season[:period] = values[:period] / level[0]
+    else:
+        season[:period] = values[:period] - level[0]
+    
+    for t in range(period, values.shape[0]):
+        prev_season = season[t-period]
+        prev_smooth = level[t-1] + trend[t-1]
+        if multiplicative:
+            level[t] = alpha * values[t] / prev_season + (1 - alpha) * prev_smooth
+            season[t] = gamma * values[t] / level[t] + (1 - gamma) * prev_season
+        else:
+            level[t] = alpha * (values[t] - prev_season) + (1 - alpha) * prev_smooth
+            season[t] = gamma * (values[t] - level[t]) + (1 - gamma) * prev_season
+        if beta is not None:
+            trend[t] = beta * (level[t] - level[t-1]) + (1 - beta) * trend[t-1]
+    
+    return level, trend, season
+
+def holt_winters(data, alpha, beta, gamma, seasonal_periods, seasonal='additive',
+                 dtype=np.float64):
+    """
+    Implement Holt-Winters triple exponential smoothing for one or many series.
+    
+    The first season initializes the level (its mean) and the seasonal
+    indices; the trend starts at the average change between the first two
+    seasons. Smoothed values are `level + trend + season` (additive) or
+    `(level + trend) * season` (multiplicative), mirroring `holts_method`.
+    Series are grouped by seasonal period and each group is advanced one
+    time step at a time across all of its series. A period of 0 (e.g. an
+    undetected season from `detect_seasonal_periods`) smooths that series
+    with `holts_method`, or `simple_exponential_smoothing` when `beta` is
+    None, with a neutral seasonal component.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        alpha (float or array-like): Level smoothing parameter
+        beta (float or array-like, optional): Trend smoothing parameter; None
+            fits a model without trend
+        gamma (float or array-like): Seasonal smoothing parameter
+        seasonal_periods (int or array-like): Season length, shared or per
+            series (0 for a non-seasonal series)
+        seasonal (str): 'additive' or 'multiplicative'
+        dtype (numpy dtype): Floating point dtype used for the computation
+        
+    Returns:
+        tuple: (Smoothed values, Level, Trend, Seasonal component), each
+            with the same shape as `data`
+    """
+    if seasonal not in ('additive', 'multiplicative'):
+        raise ValueError("seasonal must be 'additive' or 'multiplicative'")
+    multiplicative = seasonal == 'multiplicative'
+    
+    panel, single = to_panel(data, dtype)
+    n_series, n_periods = panel.shape
+    periods = _seasonal_periods(seasonal_periods, n_series)
+    alpha = _smoothing_parameter(alpha, n_series, 'alpha', panel.dtype)
+    gamma = _smoothing_parameter(gamma, n_series, 'gamma', panel.dtype)
+    if beta is not None:
+        beta = _smoothing_parameter(beta, n_series, 'beta', panel.dtype)
+    
+    seasons_needed = 2 if beta is not None else 1
+    if n_periods < seasons_needed * periods.max():
+        raise ValueError(f"Holt-Winters needs at least {seasons_needed} full seasons")
+    if multiplicative and np.any(panel <= 0):
+        raise ValueError("Multiplicative seasonality requires strictly positive data")
+    
+    level = np.empty_like(panel)
+    trend = np.empty_like(panel)
+    season = np.empty_like(panel)
+    for period in np.unique(periods):
+        rows = np.flatnonzero(periods == period)
+        if period == 0:
+            if beta is None:
+                level[rows] = simple_exponential_smoothing(panel[rows], alpha[rows], panel.dtype)
+                trend[rows] = 0
+            else:
+                _, level[rows], trend[rows] = holts_method(panel[rows], alpha[rows], beta[rows],
+                                                           panel.dtype)
+            season[rows] = 1 if multiplicative else 0
+            continue
+        components = _holt_winters_group(
+            np.ascontiguousarray(panel[rows].T), int(period), alpha[rows],
+            None if beta is None else beta[rows], gamma[rows], multiplicative)
+        for out, component in zip((level, trend, season), components):
+            out[rows] = component.T
+    
+    if multiplicative:
+        result = (level + trend) * season
+    else:
+        result = level + trend + season
+    
+    return tuple(from_panel(a, single) for a in (result, level, trend, season))
+
+def holt_winters_forecast(level, trend, season, seasonal_periods, horizon,
+                          seasonal='additive'):
+    """
+    Forecast from the final Holt-Winters state.
+    
+    Args:
+        level (array-like): Level component returned by `holt_winters`
+        trend (array-like): Trend component returned by `holt_winters`
+        season (array-like): Seasonal component returned by `holt_winters`
+        seasonal_periods (int or array-like): Season length, shared or per series
+        horizon (int): Number of periods to forecast
+        seasonal (str): 'additive' or 'multiplicative'
+        
+    Returns:
+        np.ndarray: Forecasts shaped (horizon,) or (n_series, horizon)
+    """
+    level, single = to_panel(level)
+    trend, _ = to_panel(trend)
+    season, _ = to_panel(season)
+    n_series, n_periods = season.shape
+    periods = _seasonal_periods(seasonal_periods, n_series)[:, np.newaxis]
+    neutral = 1.0 if seasonal == 'multiplicative' else 0.0
+    
+    steps = np.arange(1, horizon + 1)
+    # Index of the last observed season position matching each future step
+    safe_periods = np.where(periods == 0, 1, periods)
+    season_index = n_periods - safe_periods + (steps - 1) % safe_periods
+    seasonal_part = np.take_along_axis(season, season_index, axis=1)
+    seasonal_part = np.where(periods == 0, neutral, seasonal_part)
+    
+    base = level[:, -1:] + steps * trend[:, -1:]
+    if seasonal == 'multiplicative':
+        forecasts = base * seasonal_part
+    else:
+        forecasts = base + seasonal_part
+    return from_panel(forecasts, single)
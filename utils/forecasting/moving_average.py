@@ -0,0 +1,72 @@
+"""Moving-average forecasts computed for whole panels of series at once."""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .panel import to_panel, from_panel
+
+def simple_moving_average(data, window, dtype=np.float64):
+    """
+    Calculate the simple moving average of one or many series.
+    
+    The first `window - 1` values of every series are NaN, matching the
+    warm-up expected by `check_moving_average`. Windows are summed with a
+    cumulative sum, so the cost does not grow with the window size. Series
+    containing NaN fall back to a sliding-window mean, so a missing value
+    only affects the windows that contain it.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        window (int): Window size for moving average
+        dtype (numpy dtype): Floating point dtype of the result
+        
+    Returns:
+        np.ndarray: Moving average values with the same shape as `data`
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    
+    panel, single = to_panel(data, dtype)
+    n_periods = panel.shape[1]
+    result = np.full(panel.shape, np.nan, dtype=panel.dtype)
+    if window > n_periods:
+        return from_panel(result, single)
+    
+    if np.isfinite(panel).all():
+        # Accumulate in float64 so float32 panels do not drift on long series
+        csum = np.zeros((panel.shape[0], n_periods + 1))
+        np.cumsum(panel, axis=1, out=csum[:, 1:])
+        result[:, window-1:] = (csum[:, window:] - csum[:, :-window]) / window
+    else:
+        result[:, window-1:] = sliding_window_view(panel, window, axis=1).mean(axis=2)
+    
+    return from_panel(result, single)
+
+def weighted_moving_average(data, weights, dtype=np.float64):
+    """
+    Calculate the weighted moving average of one or many series.
+    
+    Weights are applied oldest-first, i.e. `weights[-1]` multiplies the most
+    recent observation in each window, as in `check_moving_average`. The
+    windows are evaluated as one matrix-vector product over a strided view
+    of the panel, without copying the data.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        weights (array-like): Weights for moving average (should sum to 1)
+        dtype (numpy dtype): Floating point dtype of the result
+        
+    Returns:
+        np.ndarray: Weighted moving average values with the same shape as `data`
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 1 or len(weights) == 0:
+        raise ValueError("weights must be a non-empty 1-D array")
+    
+    window = len(weights)
+    panel, single = to_panel(data, dtype)
+    result = np.full(panel.shape, np.nan, dtype=panel.dtype)
+    if window > panel.shape[1]:
+        return from_panel(result, single)
+    
+    result[:, window-1:] = sliding_window_view(panel, window, axis=1) @ weights
+    return from_panel(result, single)
@@ -0,0 +1,61 @@
+"""Helpers for handling panels of time series (series x time arrays) and their keys."""
+import numpy as np
+
+def to_panel(data, dtype=np.float64):
+    """
+    Convert one series or a stack of series to a 2-D floating point panel.
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        dtype (numpy dtype): Floating point dtype of the returned panel
+    
+    Returns:
+        tuple: (2-D panel, True if the input was a single 1-D series)
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind != 'f':
+        raise ValueError("dtype must be a floating point type")
+    
+    panel = np.asarray(data, dtype=dtype)
+    if panel.ndim == 1:
+        return panel[np.newaxis, :], True
+    if panel.ndim != 2:
+        raise ValueError("data must be 1-D (time) or 2-D (series x time)")
+    return panel, False
+
+def from_panel(panel, single):
+    """
+    Undo `to_panel`, returning a 1-D array when the input was a single series.
+    
+    Args:
+        panel (np.ndarray): Array whose first axis indexes series
+        single (bool): Flag returned by `to_panel`
+    
+    Returns:
+        np.ndarray: The panel, or its only row
+    """
+    return panel[0] if single else panel
+
+def factorize(values):
+    """
+    Encode keys as indices into their sorted unique values.
+    
+    Integer keys with a compact range are factorized with a bincount in
+    O(n); anything else falls back to `np.unique`.
+    
+    Args:
+        values (np.ndarray): 1-D keys, e.g. group ids or period buckets
+    
+    Returns:
+        tuple: (sorted unique values, index of each value in them)
+    """
+    if np.issubdtype(values.dtype, np.integer) and len(values):
+        low = values.min()
+        span = int(values.max()) - int(low) + 1
+        if span <= 4 * len(values) + 1024:
+            offsets = (values - low).astype(np.intp)
+            present = np.bincount(offsets, minlength=span) > 0
+            position = np.cumsum(present) - 1
+            return np.flatnonzero(present) + low, position[offsets]
+    unique, inverse = np.unique(values, return_inverse=True)
+    return unique, inverse.ravel()
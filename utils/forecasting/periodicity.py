@@ -0,0 +1,91 @@
+"""Detect dominant seasonal periods of many series at once."""
+import numpy as np
+from scipy import fft
+
+from .panel import to_panel
+from .diagnostics import autocorrelation
+
+def _remove_linear_trend(panel):
+    """Subtract each series' least-squares line."""
+    t = np.arange(panel.shape[1]) - (panel.shape[1] - 1) / 2
+    slope = panel @ t / np.sum(t**2)
+    return panel - panel.mean(axis=1, keepdims=True) - slope[:, np.newaxis] * t
+
+def detect_seasonal_periods(data, n_periods=1, min_period=2, max_period=None,
+                            n_candidates=8, threshold=0.1, default=0):
+    """
+    Find the dominant seasonal periods of every series.
+    
+    Each detrended series is screened with an FFT periodogram: the strongest
+    frequencies give candidate periods. Candidates are then confirmed on the
+    autocorrelation function, which also snaps them to an integer lag: the
+    lag with the highest ACF near `n / k` must be a local ACF peak above
+    `threshold`. Both steps run on the whole panel at once. Confirmed
+    periods are kept in periodogram order, skipping near-duplicates.
+    
+    The result can be passed directly as `seasonal_periods` to
+    `holt_winters` (with `n_periods=1`) or as `periods` to
+    `multi_seasonal_decompose`; undetected slots hold `default`, and
+    both engines treat 0 as "no season".
+    
+    Args:
+        data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+        n_periods (int): Number of periods returned per series
+        min_period (int): Shortest period considered
+        max_period (int, optional): Longest period considered
+            (default: half the series length, so two cycles are observed)
+        n_candidates (int): Periodogram peaks screened per series
+        threshold (float): Minimum autocorrelation at a confirmed period
+        default (int): Value for periods that could not be detected
+        
+    Returns:
+        np.ndarray: Integer periods shaped (n_series, n_periods), strongest
+            first; a 1-D input drops the series axis
+    """
+    panel, single = to_panel(data)
+    n_series, length = panel.shape
+    max_period = length // 2 if max_period is None else min(int(max_period), length // 2)
+    if min_period < 2 or max_period < min_period:
+        raise ValueError("Series are too short for the requested period range")
+    
+    detrended = _remove_linear_trend(panel)
+    power = np.abs(fft.rfft(detrended, axis=1))**2
+    frequencies = np.arange(power.shape[1])
+    with np.errstate(divide='ignore'):
+        spectral_periods = length / frequencies
+    in_range = (spectral_periods >= min_period - 0.5) & (spectral_periods <= max_period + 0.5)
+    power[:, ~in_range] = -np.inf
+    
+    # Strongest frequencies first
+    n_candidates = min(n_candidates, int(in_range.sum()))
+    top = np.argpartition(-power, n_candidates - 1, axis=1)[:, :n_candidates]
+    order = np.argsort(-np.take_along_axis(power, top, axis=1), axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    
+    # Snap each candidate to the best nearby integer lag on the ACF
+    acf = autocorrelation(detrended, max_lag=max_period + 1)
+    acf = np.where(np.isfinite(acf), acf, 0.0)
+    centre = np.rint(length / top).astype(np.intp)
+    options = np.clip(centre[..., np.newaxis] + np.array([-1, 0, 1]), min_period, max_period)
+    option_acf = np.take_along_axis(acf, options.reshape(n_series, -1), axis=1)
+    best = np.argmax(option_acf.reshape(options.shape), axis=2)
+    lags = np.take_along_axis(options, best[..., np.newaxis], axis=2)[..., 0]
+    
+    at_lag = np.take_along_axis(acf, lags, axis=1)
+    before = np.take_along_axis(acf, lags - 1, axis=1)
+    after = np.take_along_axis(acf, lags + 1, axis=1)
+    confirmed = (at_lag > threshold) & (at_lag >= before) & (at_lag >= after)
+    confirmed &= np.isfinite(np.take_along_axis(power, top, axis=1))
+    
+    periods = np.zeros((n_series, n_periods), dtype=np.int64)
+    found = np.zeros(n_series, dtype=np.intp)
+    rows = np.arange(n_series)
+    for c in range(n_candidates):
+        lag = lags[:, c]
+        duplicate = np.any((periods > 0) & (np.abs(periods - lag[:, np.newaxis]) <= 1), axis=1)
+        take = confirmed[:, c] & ~duplicate & (found < n_periods)
+        periods[rows[take], found[take]] = lag[take]
+        found += take
+    
+    periods[periods == 0] = default
+    return periods[0] if single else periods
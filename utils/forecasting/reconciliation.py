@@ -0,0 +1,231 @@
+"""Hierarchical forecast reconciliation with sparse summing matrices."""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+class Hierarchy:
+    """
+    Aggregation structure of a hierarchy such as SKU -> store -> region -> total.
+    
+    Nodes are ordered with every aggregate first (top level down) and the
+    leaves last, so the summing matrix is `S = [A; I]` where `A` is the
+    sparse (n_aggregates x n_leaves) aggregation matrix. Neither `S` nor any
+    matrix of size (n_nodes x n_nodes) is densified.
+    
+    Args:
+        aggregation (scipy.sparse matrix): Aggregation matrix `A`
+        labels (list): (level, key) label of every node, aggregates first
+    """
+    
+    def __init__(self, aggregation, labels):
+        self.aggregation = sparse.csr_matrix(aggregation)
+        self.labels = list(labels)
+        if len(self.labels) != self.n_nodes:
+            raise ValueError("labels must have one entry per node")
+    
+    @classmethod
+    def from_levels(cls, levels, leaf_ids=None, include_total=True):
+        """
+        Build a hierarchy from the ancestors of every leaf.
+        
+        Args:
+            levels (dict): Level name -> array with the key of each leaf at that
+                level, ordered from the top level down, e.g.
+                {'region': regions, 'store': stores}
+            leaf_ids (array-like, optional): Identifier of each leaf
+            include_total (bool): Add a grand-total node on top
+            
+        Returns:
+            Hierarchy: The hierarchy
+        """
+        frame = pd.DataFrame({name: np.asarray(keys) for name, keys in levels.items()})
+        n_leaves = len(frame)
+        leaf_index = np.arange(n_leaves)
+        blocks, labels = [], []
+        
+        if include_total:
+            blocks.append(sparse.csr_matrix(np.ones((1, n_leaves))))
+            labels.append(('total', 'total'))
+        
+        names = list(levels)
+        for depth, name in enumerate(names):
+            # Group by the full path so repeated keys under different parents stay apart
+            path = names[0] if depth == 0 else names[:depth + 1]
+            grouped = frame.groupby(path, sort=True)
+            codes = grouped.ngroup().to_numpy()
+            blocks.append(sparse.csr_matrix((np.ones(n_leaves), (codes, leaf_index)),
+                                            shape=(grouped.ngroups, n_leaves)))
+            labels.extend((name, key) for key in grouped.groups)
+        
+        leaf_ids = leaf_index if leaf_ids is None else np.asarray(leaf_ids)
+        labels.extend(('leaf', leaf_id) for leaf_id in leaf_ids.tolist())
+        aggregation = sparse.vstack(blocks, format='csr') if blocks else \
+            sparse.csr_matrix((0, n_leaves))
+        return cls(aggregation, labels)
+    
+    @property
+    def n_aggregates(self):
+        """Number of aggregate (non-leaf) nodes."""
+        return self.aggregation.shape[0]
+    
+    @property
+    def n_leaves(self):
+        """Number of leaves."""
+        return self.aggregation.shape[1]
+    
+    @property
+    def n_nodes(self):
+        """Total number of nodes."""
+        return self.n_aggregates + self.n_leaves
+    
+    @property
+    def summing_matrix(self):
+        """Sparse summing matrix `S = [A; I]` shaped (n_nodes, n_leaves)."""
+        return sparse.vstack([self.aggregation, sparse.identity(self.n_leaves, format='csr')],
+                             format='csr')
+    
+    @property
+    def constraint_matrix(self):
+        """Sparse matrix `C = [I, -A]`; coherent node vectors satisfy C y = 0."""
+        return sparse.hstack([sparse.identity(self.n_aggregates, format='csr'),
+                              -self.aggregation], format='csr')
+    
+    def aggregate(self, leaf_values):
+        """
+        Sum leaf series or forecasts up to every node.
+        
+        Args:
+            leaf_values (array-like): Array shaped (n_leaves,) or (n_leaves, n_periods)
+            
+        Returns:
+            np.ndarray: Node values shaped (n_nodes,) or (n_nodes, n_periods)
+        """
+        leaf_values = np.asarray(leaf_values, dtype=float)
+        if leaf_values.shape[0] != self.n_leaves:
+            raise ValueError("leaf_values must have one row per leaf")
+        return np.concatenate([self.aggregation @ leaf_values, leaf_values])
+
+def bottom_up(leaf_forecasts, hierarchy):
+    """
+    Reconcile by summing leaf forecasts up the hierarchy.
+    
+    Args:
+        leaf_forecasts (array-like): Forecasts shaped (n_leaves,) or (n_leaves, horizon),
+            e.g. from `holts_forecast` on the leaf panel
+        hierarchy (Hierarchy): Hierarchy structure
+        
+    Returns:
+        np.ndarray: Coherent forecasts for every node
+    """
+    return hierarchy.aggregate(leaf_forecasts)
+
+def top_down(top_forecast, hierarchy, leaf_history):
+    """
+    Reconcile by splitting the top-level forecast with historical proportions.
+    
+    Each leaf receives its share of total historical volume (proportions of
+    historical averages), and the split is summed back up the hierarchy.
+    
+    Args:
+        top_forecast (array-like): Forecast of the top node, scalar or (horizon,)
+        hierarchy (Hierarchy): Hierarchy structure
+        leaf_history (array-like): Leaf history shaped (n_leaves, n_periods)
+        
+    Returns:
+        np.ndarray: Coherent forecasts for every node
+    """
+    leaf_history = np.asarray(leaf_history, dtype=float)
+    if leaf_history.shape[0] != hierarchy.n_leaves:
+        raise ValueError("leaf_history must have one row per leaf")
+    
+    totals = np.nansum(leaf_history, axis=1)
+    if totals.sum() <= 0:
+        raise ValueError("leaf_history must have positive total volume")
+    proportions = totals / totals.sum()
+    
+    top_forecast = np.asarray(top_forecast, dtype=float)
+    leaf_forecasts = np.multiply.outer(proportions, top_forecast)
+    return hierarchy.aggregate(leaf_forecasts)
+
+def _shrinkage_intensity(residuals):
+    """
+    Schafer-Strimmer shrinkage intensity toward the diagonal.
+    
+    Computed from (n_periods x n_periods) Gram matrices, so the cost is
+    O(n_nodes * n_periods^2) instead of forming the node covariance.
+    """
+    n_periods = residuals.shape[1]
+    scale = np.sqrt(np.mean(residuals**2, axis=1, keepdims=True))
+    scale[scale == 0] = 1.0
+    standardized = residuals / scale
+    
+    squares = standardized**2
+    gram = standardized.T @ standardized
+    sum_sq_products = np.sum(squares.sum(axis=0)**2) - np.sum(squares**2)
+    sum_products_sq = np.sum(gram**2) - np.sum(squares.sum(axis=1)**2)
+    
+    variance = (sum_sq_products - sum_products_sq / n_periods) / (n_periods * (n_periods - 1))
+    correlation = sum_products_sq / n_periods**2
+    if correlation <= 0:
+        return 1.0
+    return float(np.clip(variance / correlation, 0, 1))
+
+def mint_shrink(base_forecasts, hierarchy, residuals):
+    """
+    MinT reconciliation with a shrinkage estimate of the error covariance.
+    
+    Uses the projection form `y~ = y^ - W C' (C W C')^-1 C y^`, which equals
+    the usual `S (S' W^-1 S)^-1 S' W^-1 y^`. With `T` residual periods,
+    `W = lambda * D + (1 - lambda) * R R' / T` is diagonal plus rank `T`, so
+    `C W C'` is a sparse (n_aggregates x n_aggregates) matrix plus a low-rank
+    term, handled with a sparse LU factorization and the Woodbury identity.
+    
+    Args:
+        base_forecasts (array-like): Base forecasts of every node shaped
+            (n_nodes,) or (n_nodes, horizon), in hierarchy node order
+        hierarchy (Hierarchy): Hierarchy structure
+        residuals (array-like): In-sample one-step errors of every node
+            shaped (n_nodes, n_periods)
+            
+    Returns:
+        np.ndarray: Coherent forecasts for every node
+    """
+    base_forecasts = np.asarray(base_forecasts, dtype=float)
+    residuals = np.asarray(residuals, dtype=float)
+    if base_forecasts.shape[0] != hierarchy.n_nodes or residuals.shape[0] != hierarchy.n_nodes:
+        raise ValueError("base_forecasts and residuals must have one row per node")
+    if residuals.shape[1] < 2:
+        raise ValueError("At least two residual periods are needed")
+    
+    single = base_forecasts.ndim == 1
+    base = base_forecasts[:, np.newaxis] if single else base_forecasts
+    n_periods = residuals.shape[1]
+    
+    residuals = np.where(np.isfinite(residuals), residuals, 0.0)
+    # A positive intensity keeps lam * C D C' factorizable when the sample
+    # covariance is exact (e.g. perfectly correlated residuals)
+    lam = max(_shrinkage_intensity(residuals), 1e-6)
+    variances = np.mean(residuals**2, axis=1)
+    # Keep D positive definite for nodes without residual variance
+    variances = np.maximum(variances, 1e-12 * max(variances.max(), 1.0))
+    
+    C = hierarchy.constraint_matrix
+    low_rank = residuals / np.sqrt(n_periods)
+    
+    # (C W C') = lam * C D C' + V V'
+    sparse_part = (lam * (C @ sparse.diags(variances) @ C.T)).tocsc()
+    V = np.sqrt(1 - lam) * (C @ low_rank)
+    lu = splu(sparse_part)
+    
+    rhs = C @ base
+    inv_rhs = lu.solve(rhs)
+    inv_V = lu.solve(V)
+    capacitance = np.eye(n_periods) + V.T @ inv_V
+    z = inv_rhs - inv_V @ np.linalg.solve(capacitance, V.T @ inv_rhs)
+    
+    ct_z = C.T @ z
+    adjustment = lam * variances[:, np.newaxis] * ct_z + \
+        (1 - lam) * (low_rank @ (low_rank.T @ ct_z))
+    reconciled = base - adjustment
+    return reconciled[:, 0] if single else reconciled
@@ -0,0 +1,203 @@
+"""Compact smoothing state that advances with each new observation."""
+import numpy as np
+
+from .panel import to_panel
+from .exponential_smoothing import simple_exponential_smoothing, holts_method
+from .holt_winters import holt_winters
+
+class SmoothingState:
+    """
+    Exponential smoothing state (level, trend, season) for many series.
+    
+    The state holds only what the recurrences need: one level and trend per
+    series and, for seasonal models, a circular buffer with the last season
+    of indices. `update` advances every series by one period per column in
+    O(1) per observation, reproducing `simple_exponential_smoothing`,
+    `holts_method` and `holt_winters` without rereading history. NaN values
+    mark missing observations; those series roll their level forward along
+    the trend and keep their seasonal index.
+    
+    Args:
+        level (array-like): Current level of each series
+        alpha (float or array-like): Level smoothing parameter
+        trend (array-like, optional): Current trend of each series
+        beta (float or array-like, optional): Trend smoothing parameter
+        season (array-like, optional): Seasonal buffer shaped (n_series, period);
+            column `position` is the index used by the next update
+        gamma (float or array-like, optional): Seasonal smoothing parameter
+        seasonal (str): 'additive' or 'multiplicative'
+        position (int): Buffer column used by the next update
+    """
+    
+    def __init__(self, level, alpha, trend=None, beta=None, season=None, gamma=None,
+                 seasonal='additive', position=0):
+        self.level = np.array(level, dtype=float, ndmin=1)
+        n_series = len(self.level)
+        self.alpha = np.broadcast_to(np.asarray(alpha, dtype=float), (n_series,)).copy()
+        
+        self.trend = None if trend is None else np.array(trend, dtype=float, ndmin=1)
+        self.beta = None
+        if beta is not None:
+            self.beta = np.broadcast_to(np.asarray(beta, dtype=float), (n_series,)).copy()
+            if self.trend is None:
+                self.trend = np.zeros(n_series)
+        
+        self.season = None if season is None else np.array(season, dtype=float, ndmin=2)
+        self.gamma = None
+        if gamma is not None:
+            if self.season is None:
+                raise ValueError("A seasonal buffer is required when gamma is given")
+            self.gamma = np.broadcast_to(np.asarray(gamma, dtype=float), (n_series,)).copy()
+        
+        if seasonal not in ('additive', 'multiplicative'):
+            raise ValueError("seasonal must be 'additive' or 'multiplicative'")
+        self.seasonal = seasonal
+        self.position = int(position)
+    
+    @classmethod
+    def from_history(cls, data, alpha, beta=None, gamma=None, seasonal_periods=None,
+                     seasonal='additive'):
+        """
+        Build the state reached after smoothing a history with the batch engines.
+        
+        Args:
+            data (array-like): 1-D series or 2-D array shaped (n_series, n_periods)
+            alpha (float or array-like): Level smoothing parameter
+            beta (float or array-like, optional): Trend smoothing parameter
+            gamma (float or array-like, optional): Seasonal smoothing parameter
+            seasonal_periods (int, optional): Season length (required with gamma)
+            seasonal (str): 'additive' or 'multiplicative'
+            
+        Returns:
+            SmoothingState: State positioned after the last observation
+        """
+        panel, _ = to_panel(data)
+        if gamma is not None:
+            if seasonal_periods is None or np.ndim(seasonal_periods) != 0:
+                raise ValueError("A single integer seasonal_periods is required with gamma")
+            _, level, trend, season = holt_winters(panel, alpha, beta, gamma,
+                                                   seasonal_periods, seasonal=seasonal)
+            return cls(level[:, -1], alpha, trend[:, -1] if beta is not None else None, beta,
+                       season[:, -seasonal_periods:], gamma, seasonal)
+        if beta is not None:
+            _, level, trend = holts_method(panel, alpha, beta)
+            return cls(level[:, -1], alpha, trend[:, -1], beta)
+        return cls(simple_exponential_smoothing(panel, alpha)[:, -1], alpha)
+    
+    @property
+    def n_series(self):
+        """Number of series tracked by the state."""
+        return len(self.level)
+    
+    def _step(self, values):
+        """Advance every series by one period and return the smoothed values."""
+        observed = ~np.isnan(values)
+        trend = self.trend if self.trend is not None else 0.0
+        prev_smooth = self.level + trend
+        multiplicative = self.seasonal == 'multiplicative'
+        
+        if self.season is None:
+            level = self.alpha * values + (1 - self.alpha) * prev_smooth
+        else:
+            prev_season = self.season[:, self.position]
+            if multiplicative:
+                level = self.alpha * values / prev_season + (1 - self.alpha) * prev_smooth
+            else:
+                level = self.alpha * (values - prev_season) + (1 - self.alpha) * prev_smooth
+        level = np.where(observed, level, prev_smooth)
+        
+        if self.beta is not None:
+            new_trend = self.beta * (level - self.level) + (1 - self.beta) * self.trend
+            self.trend = np.where(observed, new_trend, self.trend)
+        self.level = level
+        smoothed = level + (self.trend if self.trend is not None else 0.0)
+        
+        if self.season is not None:
+            if multiplicative:
+                new_season = self.gamma * values / level + (1 - self.gamma) * prev_season
+            else:
+                new_season = self.gamma * (values - level) + (1 - self.gamma) * prev_season
+            new_season = np.where(observed, new_season, prev_season)
+            self.season[:, self.position] = new_season
+            self.position = (self.position + 1) % self.season.shape[1]
+            smoothed = smoothed * new_season if multiplicative else smoothed + new_season
+        
+        return smoothed
+    
+    def update(self, new_values):
+        """
+        Advance the state with new observations for every series.
+        
+        Args:
+            new_values (float or array-like): One value per series (a scalar
+                for a single series), or a matrix shaped (n_series,
+                n_new_periods); NaN marks a missing observation
+                
+        Returns:
+            np.ndarray: Smoothed values with the same shape as `new_values`
+        """
+        shape = np.shape(new_values)
+        new_values = np.atleast_1d(np.asarray(new_values, dtype=float))
+        if new_values.shape[0] != self.n_series or new_values.ndim > 2:
+            raise ValueError("new_values must have one row per series")
+        if new_values.ndim == 1:
+            return self._step(new_values).reshape(shape)
+        
+        smoothed = np.empty_like(new_values)
+        for t in range(new_values.shape[1]):
+            smoothed[:, t] = self._step(new_values[:, t])
+        return smoothed
+    
+    def forecast(self, horizon):
+        """
+        Forecast every series from the current state.
+        
+        Args:
+            horizon (int): Number of periods to forecast
+            
+        Returns:
+            np.ndarray: Forecasts shaped (n_series, horizon)
+        """
+        steps = np.arange(1, horizon + 1)
+        forecasts = np.repeat(self.level[:, np.newaxis], horizon, axis=1)
+        if self.trend is not None:
+            forecasts = forecasts + steps * self.trend[:, np.newaxis]
+        if self.season is not None:
+            period = self.season.shape[1]
+            seasonal_part = self.season[:, (self.position + steps - 1) % period]
+            if self.seasonal == 'multiplicative':
+                forecasts = forecasts * seasonal_part
+            else:
+                forecasts = forecasts + seasonal_part
+        return forecasts
+    
+    def save(self, path):
+        """
+        Serialize the state to a .npz file.
+        
+        Args:
+            path (str): Destination file
+        """
+        arrays = {'level': self.level, 'alpha': self.alpha,
+                  'seasonal': np.array(self.seasonal), 'position': np.array(self.position)}
+        for name in ('trend', 'beta', 'season', 'gamma'):
+            if getattr(self, name) is not None:
+                arrays[name] = getattr(self, name)
+        np.savez(path, **arrays)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load a state written by `save`.
+        
+        Args:
+            path (str): .npz file written by `save`
+            
+        Returns:
+            SmoothingState: The restored state
+        """
+        with np.load(path) as saved:
+            optional = {name: saved[name] for name in ('trend', 'beta', 'season', 'gamma')
+                        if name in saved.files}
+            return cls(saved['level'], saved['alpha'], seasonal=str(saved['seasonal']),
+                       position=int(saved['position']), **optional)
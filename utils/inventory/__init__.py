@@ -0,0 +1,130 @@
+"""Vectorized inventory engines for whole product catalogs."""
+
+from .eoq import (
+    economic_order_quantity,
+    eoq_analysis,
+    purchase_cost,
+    quantity_discount_eoq
+)
+
+from .classification import (
+    ABC_THRESHOLDS,
+    XYZ_THRESHOLDS,
+    INVENTORY_POLICIES,
+    abc_classify,
+    xyz_classify,
+    abc_xyz_classify,
+    apply_policies
+)
+
+from .abc_index import ABCIndex
+
+from .service_level import (
+    z_from_service_level,
+    service_level_from_z
+)
+
+from .loss_function import (
+    LOSS_RANGE,
+    MAX_LOSS_Z_ERROR,
+    normal_loss,
+    z_from_normal_loss
+)
+
+from .safety_stock import (
+    lead_time_demand_std,
+    safety_stock,
+    reorder_point,
+    fill_rate_safety_stock,
+    fill_rate_reorder_point,
+    expected_shortage
+)
+
+from .simulation import simulate_policy, simulate_sq_policy
+
+from .policy_optimization import (
+    SERVICE_MEASURES,
+    policy_candidates,
+    optimize_policy
+)
+
+from .multi_echelon import guaranteed_service_stock
+
+from .newsvendor import DISTRIBUTIONS, critical_ratio, newsvendor
+
+from .validation import (
+    POLICY_COLUMNS,
+    POLICY_CHECKS,
+    validate_policies,
+    violation_names
+)
+
+from .sweep import (
+    FORMULAS,
+    LabeledArray,
+    Sweep,
+    sweep
+)
+
+__all__ = [
+    # Economic order quantity
+    'economic_order_quantity',
+    'eoq_analysis',
+    'purchase_cost',
+    'quantity_discount_eoq',
+    
+    # ABC / XYZ classification
+    'ABC_THRESHOLDS',
+    'XYZ_THRESHOLDS',
+    'INVENTORY_POLICIES',
+    'abc_classify',
+    'xyz_classify',
+    'abc_xyz_classify',
+    'apply_policies',
+    'ABCIndex',
+    
+    # Service level <-> z-score conversion
+    'z_from_service_level',
+    'service_level_from_z',
+    
+    # Unit normal loss function
+    'LOSS_RANGE',
+    'MAX_LOSS_Z_ERROR',
+    'normal_loss',
+    'z_from_normal_loss',
+    
+    # Safety stock and reorder points
+    'lead_time_demand_std',
+    'safety_stock',
+    'reorder_point',
+    'fill_rate_safety_stock',
+    'fill_rate_reorder_point',
+    'expected_shortage',
+    
+    # Policy simulation and optimization
+    'simulate_policy',
+    'simulate_sq_policy',
+    'SERVICE_MEASURES',
+    'policy_candidates',
+    'optimize_policy',
+    
+    # Multi-echelon safety stock
+    'guaranteed_service_stock',
+    
+    # Newsvendor
+    'DISTRIBUTIONS',
+    'critical_ratio',
+    'newsvendor',
+    
+    # Policy table validation
+    'POLICY_COLUMNS',
+    'POLICY_CHECKS',
+    'validate_policies',
+    'violation_names',
+    
+    # Parameter sweeps
+    'FORMULAS',
+    'LabeledArray',
+    'Sweep',
+    'sweep'
+]
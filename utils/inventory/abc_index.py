@@ -0,0 +1,272 @@
+"""Incremental ABC reclassification as sales volumes change."""
+from bisect import bisect_left, bisect_right, insort
+
+import numpy as np
+
+from .classification import ABC_THRESHOLDS, INVENTORY_POLICIES, _validate_thresholds, apply_policies
+
+# Keys before and past every item: boundaries with no item / all items inside
+_START = (-np.inf, -np.inf)
+_END = (np.inf, np.inf)
+
+class _Fenwick:
+    """Fenwick (binary indexed) tree of floats with prefix-sum search."""
+    
+    def __init__(self, values):
+        self.tree = [0.0] + [float(v) for v in values]
+        n = len(values)
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                self.tree[parent] += self.tree[i]
+        self.top = 1 << (n.bit_length() - 1) if n else 0
+    
+    def add(self, i, delta):
+        """Add `delta` to element `i` (0-based)."""
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+    
+    def prefix(self, i):
+        """Sum of the first `i` elements."""
+        total = 0.0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+    
+    def search(self, target):
+        """Largest i with prefix(i) <= target, and that prefix sum."""
+        position, total = 0, 0.0
+        step = self.top
+        while step:
+            following = position + step
+            if following < len(self.tree) and total + self.tree[following] <= target:
+                position = following
+                total += self.tree[following]
+            step >>= 1
+        return position, total
+
+class ABCIndex:
+    """
+    SKUs kept in dollar-volume order, reclassified as volumes change.
+    
+    Items are ranked by descending volume (ties in catalog order) and held
+    in sorted buckets of about `bucket_size` keys. Fenwick trees over the
+    buckets' volume sums give the cumulative share, so each class boundary
+    of `assign_category` is found by an O(log n) prefix-sum search plus a
+    scan of one bucket. An update moves the changed SKUs between buckets
+    and only re-checks them and the items between the old and new
+    boundaries, so a handful of changes never re-sorts the catalog.
+    
+    Example:
+        index = ABCIndex(volume, skus=product_ids)
+        changes = index.add_sales(['P007', 'P042'], [1200.0, 80.0])
+        # [('P007', 'B', 'A')] -> only SKUs whose class changed
+    """
+    
+    def __init__(self, volumes, skus=None, thresholds=ABC_THRESHOLDS,
+                 labels=('A', 'B', 'C'), bucket_size=64):
+        """
+        Build the index from the current annual dollar volumes.
+        
+        Args:
+            volumes (array-like): Annual dollar volume of each SKU
+            skus (sequence, optional): SKU identifiers (default: positions)
+            thresholds (sequence): Cumulative shares closing each class
+            labels (sequence): Class labels, one more than `thresholds`
+            bucket_size (int): Target number of SKUs per bucket
+        """
+        self.thresholds = _validate_thresholds(thresholds, labels)
+        self.labels = list(labels)
+        self.bucket_size = bucket_size
+        
+        volumes = np.asarray(volumes, dtype=np.float64)
+        if volumes.ndim != 1 or not np.all(np.isfinite(volumes)) or np.any(volumes < 0):
+            raise ValueError("volumes must be a 1-D array of non-negative values")
+        self.skus = list(range(len(volumes))) if skus is None else list(skus)
+        if len(self.skus) != len(volumes):
+            raise ValueError("skus and volumes must have the same length")
+        self._position = {sku: i for i, sku in enumerate(self.skus)}
+        if len(self._position) != len(self.skus):
+            raise ValueError("SKU identifiers must be unique")
+        
+        self.volumes = volumes.copy()
+        self._rebuild()
+    
+    def _rebuild(self):
+        """Re-bucket every key and reclassify from scratch."""
+        n = len(self.volumes)
+        order = np.lexsort((np.arange(n), -self.volumes))
+        keys = list(zip((-self.volumes[order]).tolist(), order.tolist()))
+        size = self.bucket_size
+        self._buckets = [keys[i:i + size] for i in range(0, n, size)] or [[]]
+        self._bounds = [_START] + [bucket[0] for bucket in self._buckets[1:]]
+        self._counts = _Fenwick([len(bucket) for bucket in self._buckets])
+        self._sums = _Fenwick([-sum(key[0] for key in bucket) for bucket in self._buckets])
+        
+        self._cuts = self._find_cuts()
+        self._classes = np.empty(n, dtype=np.intp)
+        self._classes[order] = self._class_of_rank(np.arange(n))
+    
+    def _class_of_rank(self, rank):
+        """Classes of items at the given ranks, using the current cuts."""
+        cut_ranks = [self._rank(cut) for cut in self._cuts]
+        return np.searchsorted(cut_ranks, rank, side='right')
+    
+    def _rank(self, key):
+        """Number of items ranked before `key`."""
+        if key == _END:
+            return len(self.volumes)
+        if key == _START:
+            return 0
+        b = bisect_right(self._bounds, key) - 1
+        return int(round(self._counts.prefix(b))) + bisect_left(self._buckets[b], key)
+    
+    def _find_cuts(self):
+        """First key outside each class boundary (`_END` if all items are inside)."""
+        total = self._sums.prefix(len(self._buckets))
+        if total <= 0:
+            return [_START] * len(self.thresholds)
+        cuts = []
+        for share in self.thresholds:
+            target = share * total
+            b, cumulative = self._sums.search(target)
+            cut = _END
+            if b < len(self._buckets):
+                for key in self._buckets[b]:
+                    cumulative -= key[0]
+                    if cumulative > target:
+                        cut = key
+                        break
+            cuts.append(cut)
+        return cuts
+    
+    def _class_of_key(self, key):
+        """Class of an item from its key: the number of cuts at or before it."""
+        return sum(key >= cut for cut in self._cuts)
+    
+    def _insert(self, key):
+        """Add a key to its bucket; True when the bucket needs re-bucketing."""
+        b = bisect_right(self._bounds, key) - 1
+        insort(self._buckets[b], key)
+        self._counts.add(b, 1)
+        self._sums.add(b, -key[0])
+        return len(self._buckets[b]) > 4 * self.bucket_size
+    
+    def _remove(self, key):
+        """Delete a key from its bucket."""
+        b = bisect_right(self._bounds, key) - 1
+        bucket = self._buckets[b]
+        del bucket[bisect_left(bucket, key)]
+        self._counts.add(b, -1)
+        self._sums.add(b, key[0])
+    
+    def _keys_between(self, low, high):
+        """Item positions whose keys lie in [low, high)."""
+        found = []
+        b = bisect_right(self._bounds, low) - 1
+        start = bisect_left(self._buckets[b], low)
+        while b < len(self._buckets):
+            for key in self._buckets[b][start:]:
+                if key >= high:
+                    return found
+                found.append(key[1])
+            b, start = b + 1, 0
+        return found
+    
+    def update(self, skus, volumes):
+        """
+        Set new annual volumes and report the SKUs whose class changed.
+        
+        Unknown SKUs are added to the catalog (reported with old class None).
+        
+        Args:
+            skus (sequence): SKU identifiers
+            volumes (sequence): New annual dollar volume of each SKU
+        
+        Returns:
+            list: (sku, old class, new class) for every reclassified SKU
+        """
+        volumes = np.atleast_1d(np.asarray(volumes, dtype=np.float64))
+        skus = list(skus)
+        if len(skus) != len(volumes) or not np.all(np.isfinite(volumes)) or np.any(volumes < 0):
+            raise ValueError("Need one finite, non-negative volume per SKU")
+        
+        # Grow the catalog once for all unknown SKUs of the batch
+        new_skus = [sku for sku in dict.fromkeys(skus) if sku not in self._position]
+        added = set(range(len(self.skus), len(self.skus) + len(new_skus)))
+        self._position.update(zip(new_skus, sorted(added)))
+        self.skus.extend(new_skus)
+        self.volumes = np.concatenate([self.volumes, np.zeros(len(new_skus))])
+        self._classes = np.concatenate([self._classes, np.full(len(new_skus), -1, np.intp)])
+        
+        old_cuts = self._cuts
+        moved, overflow = set(), False
+        for sku, volume in zip(skus, volumes.tolist()):
+            i = self._position[sku]
+            if i in added:
+                added.discard(i)
+            else:
+                self._remove((-float(self.volumes[i]), i))
+            self.volumes[i] = volume
+            overflow |= self._insert((-volume, i))
+            moved.add(i)
+        
+        if overflow:
+            # A bucket grew too large: re-bucket, then diff every class
+            previous = self._classes.copy()
+            self._rebuild()
+            changed = np.flatnonzero(previous != self._classes).tolist()
+            before = {i: previous[i] for i in changed}
+        else:
+            self._cuts = self._find_cuts()
+            candidates = set(moved)
+            for old, new in zip(old_cuts, self._cuts):
+                if old != new:
+                    candidates.update(self._keys_between(min(old, new), max(old, new)))
+            before = {}
+            for i in sorted(candidates):
+                new_class = self._class_of_key((-float(self.volumes[i]), i))
+                if new_class != self._classes[i]:
+                    before[i] = self._classes[i]
+                    self._classes[i] = new_class
+        return [(self.skus[i], self._label(old), self.labels[self._classes[i]])
+                for i, old in before.items()]
+    
+    def add_sales(self, skus, amounts):
+        """
+        Add new sales (dollar volume) to SKUs and report class changes.
+        
+        Args:
+            skus (sequence): SKU identifiers (unknown SKUs are added)
+            amounts (sequence): Dollar volume to add to each SKU
+        
+        Returns:
+            list: (sku, old class, new class) for every reclassified SKU
+        """
+        skus = list(skus)
+        current = {}
+        for sku, amount in zip(skus, np.atleast_1d(amounts).tolist()):
+            i = self._position.get(sku)
+            base = current.get(sku, 0.0 if i is None else self.volumes[i])
+            current[sku] = base + amount
+        return self.update(list(current), list(current.values()))
+    
+    def _label(self, code):
+        """Label of a class code (None for SKUs that were just added)."""
+        return None if code < 0 else self.labels[code]
+    
+    @property
+    def classes(self):
+        """np.ndarray: Current class label of every SKU, in catalog order."""
+        return np.asarray(self.labels)[self._classes]
+    
+    def class_of(self, sku):
+        """Current class label of one SKU."""
+        return self.labels[self._classes[self._position[sku]]]
+    
+    def policies(self, policies=INVENTORY_POLICIES):
+        """Policy columns of every SKU from a per-class table (see `apply_policies`)."""
+        return apply_policies(self.classes, policies)
@@ -0,0 +1,197 @@
+"""ABC and ABC-XYZ classification for large product catalogs."""
+import numpy as np
+
+# Cumulative dollar-volume shares closing the A and B classes (`assign_category`)
+ABC_THRESHOLDS = (0.80, 0.95)
+
+# Coefficient-of-variation limits of the X and Y (stable, variable) classes
+XYZ_THRESHOLDS = (0.5, 1.0)
+
+# Policy table of the ABC analysis notebook
+INVENTORY_POLICIES = {
+    'A': {
+        'review_frequency': 'Weekly',
+        'review_period_days': 7,
+        'service_level': 0.99,
+        'safety_stock_days': 3
+    },
+    'B': {
+        'review_frequency': 'Bi-weekly',
+        'review_period_days': 14,
+        'service_level': 0.95,
+        'safety_stock_days': 7
+    },
+    'C': {
+        'review_frequency': 'Monthly',
+        'review_period_days': 30,
+        'service_level': 0.90,
+        'safety_stock_days': 14
+    }
+}
+
+# Below this many values the boundary search finishes with a full sort
+_SORT_SIZE = 4096
+
+def _validate_thresholds(thresholds, labels):
+    """Check thresholds are increasing and there is one label per class."""
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    if thresholds.ndim != 1 or np.any(np.diff(thresholds) <= 0):
+        raise ValueError("thresholds must be strictly increasing")
+    if len(labels) != len(thresholds) + 1:
+        raise ValueError("labels must have one more entry than thresholds")
+    return thresholds
+
+def _top_count(values, target, rng):
+    """
+    Largest k such that the k largest values sum to at most `target`.
+    
+    A weighted selection: a random sample estimates where the boundary
+    lies and two pivots just above and below it split the values in one
+    pass. Only the narrow band between the pivots is sorted; if the
+    boundary falls outside it the search continues on that side.
+    
+    Returns:
+        tuple: (k, the k-th largest value, or inf when k is 0)
+    """
+    count, total, smallest = 0, 0.0, np.inf
+    rest = values
+    while len(rest) > _SORT_SIZE:
+        sample = np.sort(rest[rng.integers(0, len(rest), _SORT_SIZE)])[::-1]
+        estimate = np.cumsum(sample) * (rest.sum() / max(sample.sum(), np.finfo(float).tiny))
+        boundary = np.searchsorted(estimate, target - total, side='right')
+        high = sample[max(boundary - 64, 0)]
+        low = sample[min(boundary + 64, len(sample) - 1)]
+        
+        above = rest[rest > high]
+        if total + above.sum() > target:
+            rest = above
+            continue
+        if len(above):
+            count, total, smallest = count + len(above), total + above.sum(), above.min()
+        band = rest[(rest <= high) & (rest >= low)]
+        if total + band.sum() > target:
+            rest = band
+            break
+        count, total, smallest = count + len(band), total + band.sum(), low
+        rest = rest[rest < low]
+    
+    ranked = np.sort(rest)[::-1]
+    k = int(np.searchsorted(total + np.cumsum(ranked), target, side='right'))
+    return count + k, ranked[k - 1] if k else smallest
+
+def abc_classify(values, thresholds=ABC_THRESHOLDS, labels=('A', 'B', 'C')):
+    """
+    Assign ABC classes by cumulative share of (dollar) volume.
+    
+    As in `assign_category`, an item belongs to the first class whose
+    threshold is not exceeded by the cumulative share of all items ranked
+    above it plus itself (ties ranked in catalog order, like a stable
+    sort). Only the class boundaries are located: a weighted selection
+    finds how many items each class holds and the volume at each boundary
+    without sorting the catalog (`np.searchsorted` on the cumulative share
+    of a narrow band of values), then every item is classed by comparing
+    its volume with the boundary volumes.
+    
+    Args:
+        values (array-like): Annual dollar volume of each item (non-negative)
+        thresholds (sequence): Increasing cumulative shares closing each class
+        labels (sequence): Class labels, one more than `thresholds`
+    
+    Returns:
+        np.ndarray: Class label of each item
+    """
+    thresholds = _validate_thresholds(thresholds, labels)
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 1 or not np.all(np.isfinite(values)) or np.any(values < 0):
+        raise ValueError("values must be a 1-D array of non-negative volumes")
+    
+    total = values.sum()
+    if total == 0:
+        return np.asarray(labels)[np.full(len(values), len(thresholds))]
+    
+    rng = np.random.default_rng(0)
+    boundaries = [_top_count(values, share * total, rng) for share in thresholds]
+    cutoffs = [cutoff for _, cutoff in boundaries]
+    
+    # Items strictly below a boundary volume fall after it ...
+    classes = np.zeros(len(values), dtype=np.intp)
+    for cutoff in cutoffs:
+        classes += values < cutoff
+    # ... and tied items at a boundary are split in catalog order
+    for b, (count, cutoff) in enumerate(boundaries):
+        if np.isfinite(cutoff):
+            ties = np.flatnonzero(values == cutoff)
+            inside = count - np.count_nonzero(values > cutoff)
+            classes[ties[inside:]] = np.maximum(classes[ties[inside:]], b + 1)
+    return np.asarray(labels)[classes]
+
+def xyz_classify(demand, thresholds=XYZ_THRESHOLDS, labels=('X', 'Y', 'Z')):
+    """
+    Assign XYZ classes by the coefficient of variation of demand.
+    
+    Args:
+        demand (array-like): Demand history shaped (n_items, n_periods)
+        thresholds (sequence): Increasing CV limits closing each class
+        labels (sequence): Class labels, one more than `thresholds`
+    
+    Returns:
+        np.ndarray: Class label of each item (items without demand are
+            put in the last class)
+    """
+    thresholds = _validate_thresholds(thresholds, labels)
+    demand = np.asarray(demand, dtype=np.float64)
+    if demand.ndim != 2:
+        raise ValueError("demand must be shaped (n_items, n_periods)")
+    
+    mean = demand.mean(axis=1)
+    std = demand.std(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = np.where(mean > 0, std / mean, np.inf)
+    return np.asarray(labels)[np.searchsorted(thresholds, cv, side='left')]
+
+def abc_xyz_classify(values, demand, abc_thresholds=ABC_THRESHOLDS,
+                     xyz_thresholds=XYZ_THRESHOLDS):
+    """
+    Combine ABC (value) and XYZ (variability) classes, e.g. 'AX' or 'CZ'.
+    
+    Args:
+        values (array-like): Annual dollar volume of each item
+        demand (array-like): Demand history shaped (n_items, n_periods)
+        abc_thresholds (sequence): Cumulative shares closing the A and B classes
+        xyz_thresholds (sequence): CV limits closing the X and Y classes
+    
+    Returns:
+        np.ndarray: Two-letter class of each item
+    """
+    abc = abc_classify(values, abc_thresholds)
+    xyz = xyz_classify(demand, xyz_thresholds)
+    if len(abc) != len(xyz):
+        raise ValueError("values and demand must describe the same items")
+    return np.char.add(abc, xyz)
+
+def apply_policies(classes, policies=INVENTORY_POLICIES):
+    """
+    Fill policy columns for every item from a per-class policy table.
+    
+    Replaces one `.loc` mask per class: class labels are matched to the
+    table once and every policy field is a single take from a small
+    lookup array.
+    
+    Args:
+        classes (array-like): Class label of each item
+        policies (dict): {class: {field: value}}, e.g. `INVENTORY_POLICIES`
+    
+    Returns:
+        dict: {field: np.ndarray with one value per item}, ready for
+            `DataFrame.assign(**columns)`
+    """
+    classes = np.asarray(classes)
+    keys = np.array(sorted(policies))
+    position = np.minimum(np.searchsorted(keys, classes), len(keys) - 1)
+    if len(classes) and not np.all(keys[position] == classes):
+        missing = np.unique(classes[keys[position] != classes])
+        raise ValueError(f"No policy for classes {list(missing)}")
+    
+    fields = policies[keys[0]].keys()
+    return {field: np.array([policies[key][field] for key in keys])[position]
+            for field in fields}
@@ -0,0 +1,220 @@
+"""Economic order quantities for whole product catalogs, with quantity discounts."""
+import numpy as np
+
+def economic_order_quantity(demand, order_cost, holding_cost):
+    """
+    Calculate the EOQ, broadcasting over any mix of scalars and arrays.
+    
+    Sensitivity grids need no loops: e.g. `demand_range[:, None]` against
+    `holding_range[None, :]` gives a (n_demand, n_holding) EOQ table.
+    
+    Args:
+        demand (float or array-like): Annual demand (D)
+        order_cost (float or array-like): Fixed cost per order (S)
+        holding_cost (float or array-like): Holding cost per unit per year (H)
+    
+    Returns:
+        np.ndarray: sqrt(2DS/H) with the broadcast shape of the inputs
+    """
+    demand, order_cost, holding_cost = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (demand, order_cost, holding_cost)))
+    if np.any(demand < 0) or np.any(order_cost < 0) or np.any(holding_cost <= 0):
+        raise ValueError("Demand and order cost must be non-negative and holding cost positive")
+    return np.sqrt(2 * demand * order_cost / holding_cost)
+
+def eoq_analysis(demand, order_cost, holding_cost, order_quantity=None, days_per_year=365):
+    """
+    Evaluate an order quantity (the EOQ by default) for many items at once.
+    
+    Args:
+        demand (float or array-like): Annual demand (D)
+        order_cost (float or array-like): Fixed cost per order (S)
+        holding_cost (float or array-like): Holding cost per unit per year (H)
+        order_quantity (float or array-like, optional): Quantity to evaluate
+            (default: the EOQ)
+        days_per_year (float): Days used to express the cycle time
+    
+    Returns:
+        dict: 'order_quantity', 'orders_per_year', 'cycle_time' (days),
+            'ordering_cost', 'holding_cost' and 'total_cost' arrays
+    """
+    if order_quantity is None:
+        order_quantity = economic_order_quantity(demand, order_cost, holding_cost)
+    demand, order_cost, holding_cost, order_quantity = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64)
+          for a in (demand, order_cost, holding_cost, order_quantity)))
+    if np.any(order_quantity <= 0):
+        raise ValueError("Order quantities must be positive")
+    
+    orders_per_year = demand / order_quantity
+    ordering = orders_per_year * order_cost
+    holding = order_quantity / 2 * holding_cost
+    with np.errstate(divide='ignore'):
+        cycle_time = days_per_year / orders_per_year
+    
+    return {
+        'order_quantity': order_quantity,
+        'orders_per_year': orders_per_year,
+        'cycle_time': cycle_time,
+        'ordering_cost': ordering,
+        'holding_cost': holding,
+        'total_cost': ordering + holding
+    }
+
+def _discount_table(breakpoints, prices):
+    """
+    Validate a discount table and pad unused tiers by repeating the last one.
+    
+    Tables are 1-D (shared by all items) or 2-D (one row per item, with
+    NaN/inf breakpoints marking unused tiers). A repeated tier has zero
+    width, so it never changes a tier lookup or a purchase cost.
+    """
+    breakpoints = np.asarray(breakpoints, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    if breakpoints.shape != prices.shape or breakpoints.ndim not in (1, 2):
+        raise ValueError("breakpoints and prices must have the same 1-D or 2-D shape")
+    
+    used = np.isfinite(breakpoints)
+    if not np.all(used[..., 0]) or np.any(used[..., 1:] & ~used[..., :-1]):
+        raise ValueError("Every table needs a first tier and unused tiers must come last")
+    if np.any(~np.isfinite(prices) & used) or np.any((prices <= 0) & used):
+        raise ValueError("Prices of used tiers must be positive")
+    
+    last = np.maximum.accumulate(np.where(used, np.arange(used.shape[-1]), 0), axis=-1)
+    breakpoints = np.take_along_axis(breakpoints, last, axis=-1)
+    prices = np.take_along_axis(prices, last, axis=-1)
+    if np.any(np.diff(breakpoints, axis=-1)[used[..., 1:]] <= 0) or np.any(breakpoints[..., 0] < 0):
+        raise ValueError("Breakpoints must be non-negative and strictly increasing")
+    return breakpoints, prices
+
+def _tier_index(quantity, breakpoints):
+    """
+    Index of the tier each quantity falls in (below the first tier -> 0).
+    
+    A shared table is searched with `np.searchsorted`; per-item tables
+    broadcast their item axis against the last axis of `quantity`.
+    """
+    if breakpoints.ndim == 1:
+        tier = np.searchsorted(breakpoints, quantity, side='right') - 1
+    else:
+        tier = np.sum(breakpoints <= quantity[..., np.newaxis], axis=-1) - 1
+    return np.maximum(tier, 0)
+
+def _tier_offsets(breakpoints, prices, kind):
+    """Fixed part of the purchase cost, C(Q) = offset_j + price_j * Q, per tier."""
+    if kind == 'all_units':
+        return np.zeros_like(prices)
+    # Incremental: cost of every unit bought at earlier tiers' prices
+    widths = np.diff(breakpoints, axis=-1) * prices[..., :-1]
+    cumulative = prices[..., :1] * breakpoints[..., :1] + np.cumsum(widths, axis=-1)
+    cost_at_breakpoint = np.concatenate([prices[..., :1] * breakpoints[..., :1], cumulative], axis=-1)
+    return cost_at_breakpoint - prices * breakpoints
+
+def _gather_tier(table, tier):
+    """Look up per-tier values (shared or per-item table) for tier indices."""
+    if table.ndim == 1:
+        return table[tier]
+    table = np.broadcast_to(table, tier.shape + table.shape[-1:])
+    return np.take_along_axis(table, tier[..., np.newaxis], axis=-1)[..., 0]
+
+def purchase_cost(quantity, breakpoints, prices, kind='all_units'):
+    """
+    Cost of buying `quantity` units under an all-units or incremental discount.
+    
+    Args:
+        quantity (float or array-like): Order quantities
+        breakpoints (array-like): Minimum quantity of each price tier, shared
+            (n_tiers,) or per item (n_items, n_tiers); NaN pads unused tiers
+        prices (array-like): Unit price of each tier, same shape as `breakpoints`
+        kind (str): 'all_units' (every unit at the reached tier's price) or
+            'incremental' (only units beyond a breakpoint get its price)
+    
+    Returns:
+        np.ndarray: Purchase cost of each order
+    """
+    if kind not in ('all_units', 'incremental'):
+        raise ValueError("kind must be 'all_units' or 'incremental'")
+    breakpoints, prices = _discount_table(breakpoints, prices)
+    quantity = np.asarray(quantity, dtype=np.float64)
+    tier = _tier_index(quantity, breakpoints)
+    offsets = _tier_offsets(breakpoints, prices, kind)
+    return _gather_tier(offsets, tier) + _gather_tier(prices, tier) * quantity
+
+def quantity_discount_eoq(demand, order_cost, holding_rate, breakpoints, prices,
+                          kind='all_units', holding_cost=0.0, days_per_year=365):
+    """
+    Find the cost-minimizing order quantity under quantity discounts.
+    
+    The annual cost is purchase (D C(Q)/Q) + ordering (D S/Q) + holding
+    ((H Q + i C(Q)) / 2), with C(Q) the purchase cost of an order. Each
+    tier's unconstrained optimum is clipped into the tier, all tiers of all
+    items are evaluated at once and the cheapest candidate is kept.
+    
+    Args:
+        demand (float or array-like): Annual demand (D), e.g. one per SKU
+        order_cost (float or array-like): Fixed cost per order (S)
+        holding_rate (float or array-like): Annual holding cost as a fraction
+            of the unit price (i)
+        breakpoints (array-like): Minimum quantity of each price tier, shared
+            (n_tiers,) or per item (n_items, n_tiers); NaN pads unused tiers
+        prices (array-like): Unit price of each tier, same shape as `breakpoints`
+        kind (str): 'all_units' or 'incremental'
+        holding_cost (float or array-like): Holding cost per unit per year
+            that does not depend on the price (H)
+        days_per_year (float): Days used to express the cycle time
+    
+    Returns:
+        dict: 'order_quantity', 'tier', 'unit_price' (average price paid),
+            'orders_per_year', 'cycle_time', 'purchase_cost', 'ordering_cost',
+            'holding_cost' and 'total_cost' arrays
+    """
+    if kind not in ('all_units', 'incremental'):
+        raise ValueError("kind must be 'all_units' or 'incremental'")
+    breakpoints, prices = _discount_table(breakpoints, prices)
+    offsets = _tier_offsets(breakpoints, prices, kind)
+    
+    demand, order_cost, holding_rate, holding_cost = (
+        np.asarray(a, dtype=np.float64)[..., np.newaxis]
+        for a in (demand, order_cost, holding_rate, holding_cost))
+    if np.any(demand <= 0) or np.any(order_cost <= 0) or np.any(holding_rate < 0):
+        raise ValueError("Demand and order cost must be positive and holding rate non-negative")
+    if np.any(holding_cost + holding_rate * prices <= 0):
+        raise ValueError("Every tier needs a positive holding cost")
+    
+    # Unconstrained optimum of each tier, clipped into [b_j, b_j+1]
+    upper = np.concatenate([breakpoints[..., 1:], np.full(breakpoints.shape[:-1] + (1,), np.inf)],
+                           axis=-1)
+    fixed = np.maximum(order_cost + offsets, 0)
+    candidates = np.sqrt(2 * demand * fixed / (holding_cost + holding_rate * prices))
+    candidates = np.clip(candidates, breakpoints, upper)
+    # Zero-width padding tiers at a breakpoint of 0 give Q = 0, never optimal
+    candidates = np.where(candidates > 0, candidates, np.nan)
+    
+    # Evaluate every candidate at the tier it falls in: its own, or the next
+    # one when clipped onto the next breakpoint
+    bumped = candidates >= upper
+    following = lambda a: np.concatenate([a[..., 1:], a[..., -1:]], axis=-1)
+    tier = np.arange(prices.shape[-1]) + bumped
+    cost = (np.where(bumped, following(offsets), offsets)
+            + np.where(bumped, following(prices), prices) * candidates)
+    total = (demand * (cost + order_cost) / candidates
+             + (holding_cost * candidates + holding_rate * cost) / 2)
+    
+    best = np.nanargmin(total, axis=-1)[..., np.newaxis]
+    pick = lambda a: np.take_along_axis(np.broadcast_to(a, total.shape), best, axis=-1)[..., 0]
+    quantity, cost = pick(candidates), pick(cost)
+    demand, order_cost, holding_rate, holding_cost = (
+        a[..., 0] for a in (demand, order_cost, holding_rate, holding_cost))
+    
+    orders_per_year = demand / quantity
+    return {
+        'order_quantity': quantity,
+        'tier': pick(tier),
+        'unit_price': cost / quantity,
+        'orders_per_year': orders_per_year,
+        'cycle_time': days_per_year / orders_per_year,
+        'purchase_cost': demand * cost / quantity,
+        'ordering_cost': orders_per_year * order_cost,
+        'holding_cost': (holding_cost * quantity + holding_rate * cost) / 2,
+        'total_cost': pick(total)
+    }
@@ -0,0 +1,81 @@
+"""Unit normal loss function and its table-driven inverse for fill-rate targets."""
+import numpy as np
+from scipy import special
+
+from .tables import hermite_table, convert_with_table, normal_pdf
+
+# Loss values covered by the inverse table; beyond it Newton's method is used
+LOSS_RANGE = (1e-9, 1e3)
+
+# Largest absolute z error of the inverse table (checked on a dense grid in the tests)
+MAX_LOSS_Z_ERROR = 1e-8
+
+def normal_loss(z):
+    """
+    Unit normal loss function G(z) = E[max(Z - z, 0)] = pdf(z) - z * (1 - cdf(z)).
+    
+    Expected shortage per replenishment cycle is sigma_LT * G(k) for a
+    safety factor k.
+    
+    Args:
+        z (float or array-like): Safety factors
+    
+    Returns:
+        np.ndarray: Loss values, shaped like the input
+    """
+    z = np.asarray(z, dtype=np.float64)
+    return normal_pdf(z) - z * special.ndtr(-z)
+
+def _z_from_loss_exact(loss):
+    """
+    Solve G(z) = loss by Newton's method on log G.
+    
+    log G is concave and decreasing, so starting where pdf(z) = loss (to
+    the right of the root) the iterates fall monotonically onto it; only
+    values still moving are updated.
+    """
+    loss = np.asarray(loss, dtype=np.float64)
+    target = np.log(loss)
+    z = np.sqrt(np.maximum(-2 * np.log(loss * np.sqrt(2 * np.pi)), 0))
+    active = np.flatnonzero(np.isfinite(target))
+    for _ in range(100):
+        if not len(active):
+            break
+        current = z[active]
+        step = ((np.log(normal_loss(current)) - target[active])
+                * normal_loss(current) / special.ndtr(-current))
+        z[active] = current + step
+        active = active[np.abs(step) > 1e-14 * np.maximum(np.abs(current), 1)]
+    z[np.isinf(target)] = -target[np.isinf(target)]
+    return z
+
+def _log_loss_slope(log_loss):
+    """dz / d(log G) = -G(z) / (1 - cdf(z)) at the z solving G(z) = exp(log_loss)."""
+    z = _z_from_loss_exact(np.exp(log_loss))
+    return -normal_loss(z) / special.ndtr(-z)
+
+_LOG_LOSS_RANGE = tuple(np.log(LOSS_RANGE))
+_LOSS_KNOTS = 2**12
+_LOSS_TABLE = hermite_table(lambda u: _z_from_loss_exact(np.exp(u)), _log_loss_slope,
+                            *_LOG_LOSS_RANGE, _LOSS_KNOTS)
+
+def z_from_normal_loss(loss):
+    """
+    Safety factor z whose unit normal loss G(z) equals `loss`.
+    
+    Losses in `LOSS_RANGE` are read from a cubic Hermite table over
+    log G with an absolute error below `MAX_LOSS_Z_ERROR`; the others are
+    solved with Newton's method.
+    
+    Args:
+        loss (float or array-like): Positive loss values
+    
+    Returns:
+        np.ndarray: Safety factors, shaped like the input
+    """
+    loss = np.asarray(loss, dtype=np.float64)
+    if not np.all(loss > 0):
+        raise ValueError("Loss values must be positive")
+    z = convert_with_table(np.log(np.atleast_1d(loss)), _LOSS_TABLE, _LOG_LOSS_RANGE,
+                           lambda u: _z_from_loss_exact(np.exp(u)))
+    return z.reshape(loss.shape)
@@ -0,0 +1,193 @@
+"""Guaranteed-service safety stock placement over multi-echelon trees."""
+import numpy as np
+
+from .service_level import z_from_service_level
+
+def _levels(parent):
+    """
+    Nodes grouped by depth, roots first.
+    
+    Children are found with one stable sort of the parent array, so each
+    level is gathered from the previous one without a Python loop over
+    nodes; nodes never reached from a root lie on a cycle.
+    
+    Returns:
+        list: np.ndarray of node indices per depth
+    """
+    n = len(parent)
+    order = np.argsort(parent, kind='stable')
+    starts = np.searchsorted(parent[order], np.arange(-1, n + 1))
+    levels = [order[starts[0]:starts[1]]]
+    reached = len(levels[0])
+    while True:
+        frontier = levels[-1]
+        first, last = starts[frontier + 1], starts[frontier + 2]
+        sizes = last - first
+        if not sizes.sum():
+            break
+        # Concatenate the children ranges of every frontier node
+        offsets = np.repeat(first - np.cumsum(sizes) + sizes, sizes)
+        levels.append(order[offsets + np.arange(sizes.sum())])
+        reached += sizes.sum()
+    if reached != n:
+        raise ValueError("parent must describe a forest (some nodes lie on a cycle)")
+    return levels
+
+def _sum_by_parent(values, parent):
+    """
+    Sum the rows of `values` that share a parent.
+    
+    Returns:
+        tuple: (distinct parents, summed rows)
+    """
+    order = np.argsort(parent, kind='stable')
+    keys = parent[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.add.reduceat(values[order], starts, axis=0)
+
+def guaranteed_service_stock(parent, processing_time, demand_stddev, demand_mean=0.0,
+                             holding_cost=1.0, service_level=0.95, max_service_time=None,
+                             external_service_time=0, pooling=True, chunk_size=2**22):
+    """
+    Place safety stock in a multi-echelon tree with the guaranteed-service model.
+    
+    Every node j quotes an outbound service time S_j to its children and
+    waits the inbound service time SI_j = S_parent (or
+    `external_service_time` at a root). It covers its net replenishment
+    time tau_j = SI_j + T_j - S_j >= 0 with safety stock
+    z_j * sigma_j * sqrt(tau_j), where sigma_j pools the demand of every
+    node below it. Service times are chosen to minimize the total holding
+    cost of safety stock, subject to each node's maximum service time
+    (0 by default at leaves, i.e. customer-facing stores hold stock).
+    
+    The exact dynamic program over the tree (Graves & Willems) is
+    evaluated level by level: for all nodes of one depth at once, the
+    cost of every (SI, S) pair is a broadcast over an integer grid, the
+    children's cost-to-go is summed with `np.add.reduceat`, and the
+    minimum over S gives the node's cost-to-go. A top-down pass then
+    reads off the optimal service times. Nodes are processed in blocks
+    of at most `chunk_size` grid cells.
+    
+    Args:
+        parent (array-like): Parent index of each node (-1 for roots);
+            stores are leaves, DCs and plants are their ancestors
+        processing_time (array-like): Whole periods T_j each node needs
+            once its inputs arrive (e.g. transport lead time)
+        demand_stddev (float or array-like): Standard deviation of external
+            per-period demand at each node (usually only at leaves)
+        demand_mean (float or array-like): Mean external per-period demand
+        holding_cost (float or array-like): Holding cost per unit at each node
+        service_level (float or array-like): Cycle service level per node
+        max_service_time (array-like, optional): Longest outbound service
+            time allowed per node (default: 0 at leaves, unlimited inside;
+            use np.inf for no limit)
+        external_service_time (int or array-like): Inbound service time of
+            the roots from outside suppliers
+        pooling (bool): Pool independent demand (sigma = sqrt of summed
+            variances); False adds standard deviations (fully correlated)
+        chunk_size (int): Maximum (node, SI, S) grid cells evaluated at once
+    
+    Returns:
+        dict: Arrays with one value per node:
+            - 'service_time': Outbound service time S
+            - 'inbound_service_time': SI
+            - 'net_replenishment_time': tau = SI + T - S
+            - 'demand_mean', 'demand_stddev': Demand served through the node
+            - 'safety_stock': z * sigma * sqrt(tau)
+            - 'base_stock': mean * tau + safety stock
+            - 'holding_cost': Holding cost of the safety stock
+          and 'total_cost', the optimal total holding cost.
+    """
+    parent = np.asarray(parent)
+    if parent.ndim != 1 or not np.issubdtype(parent.dtype, np.integer):
+        raise ValueError("parent must be a 1-D array of node indices")
+    n = len(parent)
+    if np.any((parent < -1) | (parent >= n)):
+        raise ValueError("parent indices must be -1 or a valid node")
+    parent = parent.astype(np.intp)
+    processing_time, external_service_time = (
+        np.broadcast_to(np.asarray(a, dtype=np.float64), (n,))
+        for a in (processing_time, external_service_time))
+    if (np.any(processing_time < 0) or np.any(processing_time != np.round(processing_time))
+            or np.any(external_service_time < 0)
+            or np.any(external_service_time != np.round(external_service_time))):
+        raise ValueError("Processing and service times must be non-negative whole periods")
+    demand_stddev, demand_mean, holding_cost = (
+        np.broadcast_to(np.asarray(a, dtype=np.float64), (n,)).copy()
+        for a in (demand_stddev, demand_mean, holding_cost))
+    if np.any(demand_stddev < 0) or np.any(holding_cost < 0):
+        raise ValueError("Demand standard deviations and holding costs must be non-negative")
+    z = np.broadcast_to(z_from_service_level(service_level), (n,))
+    
+    levels = _levels(parent)
+    is_leaf = np.bincount(parent[parent >= 0], minlength=n) == 0
+    if max_service_time is None:
+        max_service_time = np.where(is_leaf, 0, np.inf)
+    max_service_time = np.broadcast_to(np.asarray(max_service_time, dtype=np.float64), (n,))
+    if np.any(max_service_time < 0):
+        raise ValueError("Maximum service times must be non-negative")
+    
+    # Demand through each node, leaves upward
+    variance = demand_stddev**2
+    for level in levels[:0:-1]:
+        children_parent = parent[level]
+        demand_mean += np.bincount(children_parent, demand_mean[level], minlength=n)
+        if pooling:
+            variance += np.bincount(children_parent, variance[level], minlength=n)
+        else:
+            demand_stddev += np.bincount(children_parent, demand_stddev[level], minlength=n)
+    if pooling:
+        demand_stddev = np.sqrt(variance)
+    
+    # Longest inbound service time any node can see, roots downward
+    latest = np.empty(n)
+    for depth, level in enumerate(levels):
+        inbound = external_service_time[level] if depth == 0 else latest[parent[level]]
+        latest[level] = inbound + processing_time[level]
+    horizon = int(latest.max())
+    grid = np.arange(horizon + 1)
+    
+    # Cost-to-go f_j(SI) and its best S, deepest level first
+    cost_to_go = np.zeros((n, horizon + 1))
+    best_service = np.zeros((n, horizon + 1), dtype=np.intp)
+    children_cost = np.zeros((n, horizon + 1))
+    rate = holding_cost * z * demand_stddev
+    step = max(1, chunk_size // (horizon + 1)**2)
+    for depth in range(len(levels) - 1, -1, -1):
+        level = levels[depth]
+        if depth + 1 < len(levels):
+            below = levels[depth + 1]
+            parents, totals = _sum_by_parent(cost_to_go[below], parent[below])
+            children_cost[parents] = totals
+        for start in range(0, len(level), step):
+            nodes = level[start:start + step]
+            # tau over (node, SI, S)
+            tau = (grid[:, np.newaxis] - grid + processing_time[nodes, np.newaxis, np.newaxis])
+            with np.errstate(invalid='ignore'):
+                total = rate[nodes, np.newaxis, np.newaxis] * np.sqrt(tau)
+            allowed = (tau >= 0) & (grid <= max_service_time[nodes, np.newaxis, np.newaxis])
+            total = np.where(allowed, total + children_cost[nodes, np.newaxis, :], np.inf)
+            best_service[nodes] = np.argmin(total, axis=2)
+            cost_to_go[nodes] = np.take_along_axis(
+                total, best_service[nodes][:, :, np.newaxis], axis=2)[:, :, 0]
+    
+    # Optimal service times, roots downward
+    inbound = np.empty(n, dtype=np.intp)
+    service = np.empty(n, dtype=np.intp)
+    for depth, level in enumerate(levels):
+        inbound[level] = (external_service_time[level] if depth == 0
+                          else service[parent[level]])
+        service[level] = best_service[level, inbound[level]]
+    tau = inbound + processing_time - service
+    safety_stock = z * demand_stddev * np.sqrt(tau)
+    return {
+        'service_time': service,
+        'inbound_service_time': inbound,
+        'net_replenishment_time': tau,
+        'demand_mean': demand_mean,
+        'demand_stddev': demand_stddev,
+        'safety_stock': safety_stock,
+        'base_stock': demand_mean * tau + safety_stock,
+        'holding_cost': holding_cost * safety_stock,
+        'total_cost': float(np.sum(holding_cost * safety_stock))
+    }
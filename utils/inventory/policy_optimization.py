@@ -0,0 +1,185 @@
+"""Simulation-based search for periodic-review (R, S) and (s, S) policies."""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .safety_stock import lead_time_demand_std
+from .simulation import simulate_policy
+
+# Measures the service constraint can be placed on
+SERVICE_MEASURES = ('fill_rate', 'service_level')
+
+# Replication x SKU cells `simulate_policy` simulates at once in each worker
+_SIMULATION_CHUNK_SIZE = 2**15
+
+def policy_candidates(daily_demand, demand_stddev, lead_time, policy='RS',
+                      review_periods=(1, 7, 14, 30), z_levels=np.linspace(0, 3, 13),
+                      order_up_to_gaps=(0.5, 1.0, 2.0), lead_time_stddev=0.0):
+    """
+    Candidate policies around the closed-form normal approximation.
+    
+    As in the two-stage design of the sunglass notebook, demand over the
+    review period plus lead time is approximately normal, so for each
+    review period R the reorder level is d(R + L) + z * sigma_{R+L}. For
+    (R, S) the order-up-to level equals it; for (s, S) the order-up-to
+    level adds `gap` review periods of demand (the notebook uses 1).
+    
+    Args:
+        daily_demand (float or array-like): Mean daily demand per SKU
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        lead_time (float or array-like): Mean lead time in days
+        policy (str): 'RS' or 'sS'
+        review_periods (sequence): Review periods R to try, in days
+        z_levels (sequence): Safety factors z to try
+        order_up_to_gaps (sequence): (S - s) in review periods of demand ('sS' only)
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        dict: 'review_period', 'reorder_point' and 'order_up_to' arrays
+            shaped (*sku_shape, n_candidates)
+    """
+    if policy not in ('RS', 'sS'):
+        raise ValueError("policy must be 'RS' or 'sS'")
+    review, z, gap = np.meshgrid(np.asarray(review_periods, dtype=np.intp),
+                                 np.asarray(z_levels, dtype=np.float64),
+                                 np.asarray(order_up_to_gaps if policy == 'sS' else [0.0]),
+                                 indexing='ij')
+    review, z, gap = (a.ravel() for a in (review, z, gap))
+    if np.any(review < 1):
+        raise ValueError("Review periods must be at least 1 day")
+    
+    daily_demand, demand_stddev, lead_time, lead_time_stddev = (
+        np.asarray(a, dtype=np.float64)[..., np.newaxis]
+        for a in (daily_demand, demand_stddev, lead_time, lead_time_stddev))
+    protection = lead_time + review
+    sigma = lead_time_demand_std(demand_stddev, protection, daily_demand, lead_time_stddev)
+    reorder_point = daily_demand * protection + z * sigma
+    order_up_to = reorder_point + gap * review * daily_demand
+    shape = np.broadcast_shapes(reorder_point.shape, order_up_to.shape)
+    return {
+        'review_period': np.broadcast_to(review, shape).copy(),
+        'reorder_point': np.broadcast_to(reorder_point, shape).copy(),
+        'order_up_to': np.broadcast_to(order_up_to, shape).copy()
+    }
+
+def _optimize_chunk(task):
+    """Simulate every candidate of a chunk of SKUs; runs in a worker process."""
+    (candidates, daily_demand, demand_stddev, lead_time, lead_time_stddev, holding_cost,
+     shortage_cost, order_cost, target, measure, days, n_replications, seed, chunk_size) = task
+    n_skus = len(daily_demand)
+    rng = np.random.default_rng(seed)
+    
+    # Common random numbers: every candidate of a SKU sees the same paths
+    demand = rng.standard_normal((days - 1, n_replications, n_skus, 1))
+    demand = np.maximum(demand * demand_stddev[:, np.newaxis] + daily_demand[:, np.newaxis], 0)
+    lead_times = rng.standard_normal((days, n_replications, n_skus, 1))
+    lead_times = np.maximum(np.rint(lead_times * lead_time_stddev[:, np.newaxis]
+                                    + lead_time[:, np.newaxis]), 0).astype(np.intp)
+    
+    result = simulate_policy(candidates['reorder_point'], daily_demand[:, np.newaxis],
+                             order_up_to=candidates['order_up_to'],
+                             review_period=candidates['review_period'],
+                             days=days, n_replications=n_replications, demand=demand,
+                             lead_times=lead_times, chunk_size=chunk_size)
+    stats = {key: values.mean(axis=0) for key, values in result.items()}
+    cost = (holding_cost[:, np.newaxis] * stats['average_inventory']
+            + (shortage_cost[:, np.newaxis] * stats['lost_sales']
+               + order_cost[:, np.newaxis] * stats['orders']) / days)
+    
+    # Cheapest candidate meeting the target, else the best-served one
+    feasible = stats[measure] >= target
+    any_feasible = feasible.any(axis=1)
+    score = np.where(any_feasible[:, np.newaxis], np.where(feasible, cost, np.inf),
+                     -stats[measure])
+    best = np.argmin(score, axis=1)[:, np.newaxis]
+    
+    def pick(values):
+        return np.take_along_axis(values, best, axis=1)[:, 0]
+    
+    chosen = {key: pick(values) for key, values in candidates.items()}
+    chosen.update(cost=pick(cost), fill_rate=pick(stats['fill_rate']),
+                  service_level=pick(stats['service_level']),
+                  average_inventory=pick(stats['average_inventory']),
+                  feasible=any_feasible)
+    return chosen
+
+def optimize_policy(daily_demand, demand_stddev, lead_time, holding_cost, shortage_cost,
+                    policy='RS', target=0.95, measure='fill_rate', order_cost=0.0,
+                    review_periods=(1, 7, 14, 30), z_levels=np.linspace(0, 3, 13),
+                    order_up_to_gaps=(0.5, 1.0, 2.0), lead_time_stddev=0.0, days=365,
+                    n_replications=200, seed=0, n_jobs=1, chunk_size=64):
+    """
+    Search review period, reorder level and order-up-to level per SKU.
+    
+    Replaces hand-set policy tables (`review_period_days`,
+    `safety_stock_days`): every candidate of `policy_candidates` is
+    simulated with `simulate_policy` and the one with the lowest expected
+    holding plus shortage (plus ordering) cost per day whose mean
+    `measure` reaches `target` is kept. All candidates of a SKU are run in
+    one batched simulation on the same demand and lead-time paths (common
+    random numbers), so cost differences reflect the policies rather than
+    sampling noise. Chunks of SKUs are distributed over a process pool
+    when `n_jobs > 1`; results do not depend on `n_jobs`.
+    
+    Args:
+        daily_demand (array-like): Mean daily demand per SKU
+        demand_stddev (array-like): Standard deviation of daily demand
+        lead_time (array-like): Mean lead time in days
+        holding_cost (float or array-like): Cost per unit held per day
+        shortage_cost (float or array-like): Cost per unit of lost demand
+        policy (str): 'RS' (order up to S every R days) or 'sS' (order up
+            to S when the position is at or below s on a review day)
+        target (float): Minimum mean fill rate or cycle service level
+        measure (str): 'fill_rate' or 'service_level'
+        order_cost (float or array-like): Fixed cost per order
+        review_periods (sequence): Review periods R to try, in days
+        z_levels (sequence): Safety factors z to try
+        order_up_to_gaps (sequence): (S - s) in review periods of demand ('sS' only)
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+        days (int): Simulated horizon per replication
+        n_replications (int): Demand paths per SKU
+        seed (int): Seed of the random paths
+        n_jobs (int): Number of worker processes
+        chunk_size (int): Number of SKUs per worker task
+    
+    Returns:
+        dict: One value per SKU: 'review_period', 'reorder_point',
+            'order_up_to', expected 'cost' per day, mean 'fill_rate',
+            'service_level' and 'average_inventory', and 'feasible' (False
+            where no candidate reached the target; the best-served
+            candidate is returned instead)
+    """
+    if measure not in SERVICE_MEASURES:
+        raise ValueError(f"measure must be one of {SERVICE_MEASURES}")
+    if not 0 <= target <= 1:
+        raise ValueError("target must be between 0 and 1")
+    parameters = [np.atleast_1d(np.asarray(a, dtype=np.float64))
+                  for a in (daily_demand, demand_stddev, lead_time, lead_time_stddev,
+                            holding_cost, shortage_cost, order_cost)]
+    n_skus = np.broadcast_shapes(*(p.shape for p in parameters))
+    if len(n_skus) != 1:
+        raise ValueError("SKU parameters must be scalars or 1-D arrays")
+    parameters = [np.broadcast_to(p, n_skus) for p in parameters]
+    (daily_demand, demand_stddev, lead_time, lead_time_stddev,
+     holding_cost, shortage_cost, order_cost) = parameters
+    if np.any(daily_demand < 0) or np.any(holding_cost < 0) or np.any(shortage_cost < 0):
+        raise ValueError("Demand and costs must be non-negative")
+    
+    candidates = policy_candidates(daily_demand, demand_stddev, lead_time, policy,
+                                   review_periods, z_levels, order_up_to_gaps,
+                                   lead_time_stddev)
+    starts = range(0, n_skus[0], chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = []
+    for start, chunk_seed in zip(starts, seeds):
+        chunk = slice(start, start + chunk_size)
+        tasks.append(({key: values[chunk] for key, values in candidates.items()},
+                      *(p[chunk] for p in parameters), target, measure, days, n_replications,
+                      chunk_seed, _SIMULATION_CHUNK_SIZE))
+    
+    if n_jobs == 1 or len(tasks) == 1:
+        results = [_optimize_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_optimize_chunk, tasks))
+    return {key: np.concatenate([r[key] for r in results]) for key in results[0]}
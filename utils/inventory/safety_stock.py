@@ -0,0 +1,146 @@
+"""Closed-form safety stock and reorder point formulas that broadcast."""
+import numpy as np
+
+from .loss_function import normal_loss, z_from_normal_loss
+from .service_level import z_from_service_level
+
+def lead_time_demand_std(demand_stddev, lead_time, daily_demand=0.0, lead_time_stddev=0.0):
+    """
+    Standard deviation of demand over the lead time.
+    
+    Uses sqrt(L * sigma_d^2 + d^2 * sigma_L^2), as in the safety stock
+    notebook; with no lead-time variability this is sigma_d * sqrt(L).
+    
+    Args:
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        lead_time (float or array-like): Average lead time in days
+        daily_demand (float or array-like): Average daily demand
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        np.ndarray: Lead-time demand standard deviation, broadcast over the inputs
+    """
+    demand_stddev, lead_time, daily_demand, lead_time_stddev = (
+        np.asarray(a, dtype=np.float64)
+        for a in (demand_stddev, lead_time, daily_demand, lead_time_stddev))
+    if np.any(lead_time < 0) or np.any(demand_stddev < 0) or np.any(lead_time_stddev < 0):
+        raise ValueError("Lead times and standard deviations must be non-negative")
+    return np.sqrt(lead_time * demand_stddev**2 + daily_demand**2 * lead_time_stddev**2)
+
+def safety_stock(demand_stddev, lead_time, service_level, daily_demand=0.0,
+                 lead_time_stddev=0.0):
+    """
+    Safety stock for a cycle service level: z * sigma_LT.
+    
+    Args:
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        lead_time (float or array-like): Average lead time in days
+        service_level (float or array-like): Cycle service level in (0, 1)
+        daily_demand (float or array-like): Average daily demand (needed
+            when the lead time varies)
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        np.ndarray: Safety stock, broadcast over the inputs
+    """
+    z = z_from_service_level(service_level)
+    return z * lead_time_demand_std(demand_stddev, lead_time, daily_demand, lead_time_stddev)
+
+def reorder_point(daily_demand, lead_time, demand_stddev, service_level, lead_time_stddev=0.0):
+    """
+    Reorder point: expected lead-time demand plus safety stock.
+    
+    Args:
+        daily_demand (float or array-like): Average daily demand
+        lead_time (float or array-like): Average lead time in days
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        service_level (float or array-like): Cycle service level in (0, 1)
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        np.ndarray: Reorder point, broadcast over the inputs
+    """
+    daily_demand = np.asarray(daily_demand, dtype=np.float64)
+    return daily_demand * np.asarray(lead_time, dtype=np.float64) + safety_stock(
+        demand_stddev, lead_time, service_level, daily_demand, lead_time_stddev)
+
+def fill_rate_safety_stock(demand_stddev, lead_time, fill_rate, order_quantity,
+                           daily_demand=0.0, lead_time_stddev=0.0):
+    """
+    Safety stock for a fill rate (type-2 service): k * sigma_LT.
+    
+    The expected shortage per cycle, sigma_LT * G(k), may be at most the
+    fraction (1 - fill_rate) of the order quantity, so the safety factor
+    solves G(k) = (1 - fill_rate) * Q / sigma_LT with the table-driven
+    inverse of the unit normal loss function. k is negative when orders
+    are large enough to reach the fill rate without safety stock.
+    
+    Args:
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        lead_time (float or array-like): Average lead time in days
+        fill_rate (float or array-like): Target fraction of demand met from stock, in (0, 1)
+        order_quantity (float or array-like): Order quantity Q (e.g. the EOQ)
+        daily_demand (float or array-like): Average daily demand (needed
+            when the lead time varies)
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        np.ndarray: Safety stock, broadcast over the inputs (0 where demand
+            over the lead time does not vary)
+    """
+    fill_rate, order_quantity = (np.asarray(a, dtype=np.float64)
+                                 for a in (fill_rate, order_quantity))
+    if not np.all((fill_rate > 0) & (fill_rate < 1)):
+        raise ValueError("Fill rates must be between 0 and 1")
+    if np.any(order_quantity <= 0):
+        raise ValueError("Order quantities must be positive")
+    sigma = lead_time_demand_std(demand_stddev, lead_time, daily_demand, lead_time_stddev)
+    varies = sigma > 0
+    with np.errstate(divide='ignore'):
+        loss = np.where(varies, (1 - fill_rate) * order_quantity / sigma, 1.0)
+    return np.where(varies, z_from_normal_loss(loss) * sigma, 0.0)
+
+def fill_rate_reorder_point(daily_demand, lead_time, demand_stddev, fill_rate, order_quantity,
+                            lead_time_stddev=0.0):
+    """
+    Reorder point for a fill rate: expected lead-time demand plus safety stock.
+    
+    Args:
+        daily_demand (float or array-like): Average daily demand
+        lead_time (float or array-like): Average lead time in days
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        fill_rate (float or array-like): Target fraction of demand met from stock, in (0, 1)
+        order_quantity (float or array-like): Order quantity Q
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        np.ndarray: Reorder point, broadcast over the inputs
+    """
+    daily_demand = np.asarray(daily_demand, dtype=np.float64)
+    return daily_demand * np.asarray(lead_time, dtype=np.float64) + fill_rate_safety_stock(
+        demand_stddev, lead_time, fill_rate, order_quantity, daily_demand, lead_time_stddev)
+
+def expected_shortage(safety_stock, demand_stddev, lead_time, daily_demand=0.0,
+                      lead_time_stddev=0.0):
+    """
+    Expected units short per replenishment cycle: sigma_LT * G(SS / sigma_LT).
+    
+    Divided by the order quantity this gives the fill rate a safety stock
+    achieves, 1 - shortage / Q.
+    
+    Args:
+        safety_stock (float or array-like): Safety stock
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        lead_time (float or array-like): Average lead time in days
+        daily_demand (float or array-like): Average daily demand
+        lead_time_stddev (float or array-like): Standard deviation of the lead time
+    
+    Returns:
+        np.ndarray: Expected shortage per cycle, broadcast over the inputs
+    """
+    safety_stock = np.asarray(safety_stock, dtype=np.float64)
+    sigma = lead_time_demand_std(demand_stddev, lead_time, daily_demand, lead_time_stddev)
+    varies = sigma > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shortage = sigma * normal_loss(safety_stock / sigma)
+    return np.where(varies, shortage, np.maximum(-safety_stock, 0.0))
@@ -0,0 +1,38 @@
+"""Vectorized conversion between cycle service levels and z-scores."""
+import numpy as np
+from scipy import special
+
+def z_from_service_level(service_level):
+    """
+    z-score of a cycle service level (the standard normal ppf).
+    
+    Calls `scipy.special.ndtri` (what `stats.norm.ppf` evaluates) once on
+    the whole array, without the distribution-object overhead. Benchmarks
+    showed a cubic Hermite table was slower than the ufunc, so the result
+    is exact.
+    
+    Args:
+        service_level (float or array-like): Service levels in (0, 1)
+    
+    Returns:
+        np.ndarray: z-scores, shaped like the input
+    """
+    service_level = np.asarray(service_level, dtype=np.float64)
+    if not np.all((service_level > 0) & (service_level < 1)):
+        raise ValueError("Service levels must be between 0 and 1")
+    return special.ndtri(service_level)
+
+def service_level_from_z(z):
+    """
+    Cycle service level of a z-score (the standard normal cdf).
+    
+    Calls `scipy.special.ndtr` (what `stats.norm.cdf` evaluates) once on
+    the whole array.
+    
+    Args:
+        z (float or array-like): z-scores (NaN stays NaN)
+    
+    Returns:
+        np.ndarray: Service levels, shaped like the input
+    """
+    return special.ndtr(np.asarray(z, dtype=np.float64))
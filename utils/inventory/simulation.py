@@ -0,0 +1,287 @@
+"""Monte Carlo simulation of inventory policies over replications x SKUs."""
+import numpy as np
+
+# Sampled lead times are truncated this many standard deviations above the mean
+_LEAD_TIME_SPREAD = 6
+
+class _Pipeline:
+    """
+    Outstanding orders of many inventories as a ring of arrival days.
+    
+    Slot `day % length` holds the quantity (and number of orders) due on
+    that day in every cell, so placing an order is one scatter-add and
+    receiving is one row read; orders may cross when lead times vary.
+    """
+    
+    def __init__(self, max_lead_time, n_cells):
+        self.length = max_lead_time + 1
+        self.quantity = np.zeros((self.length, n_cells))
+        self.orders = np.zeros((self.length, n_cells), dtype=np.intp)
+        self.on_order = np.zeros(n_cells)
+        self.outstanding = np.zeros(n_cells, dtype=np.intp)
+    
+    def place(self, day, cells, quantity, lead_time):
+        """Order `quantity` for the given cells, due `lead_time` days later."""
+        due = (day + lead_time) % self.length * self.quantity.shape[1] + cells
+        self.quantity.ravel()[due] += quantity
+        self.orders.ravel()[due] += 1
+        self.on_order[cells] += quantity
+        self.outstanding[cells] += 1
+    
+    def receive(self, day, on_hand):
+        """Move the orders due on `day` into `on_hand`, emptying their slot."""
+        slot = day % self.length
+        on_hand += self.quantity[slot]
+        self.on_order -= self.quantity[slot]
+        self.outstanding -= self.orders[slot]
+        self.quantity[slot] = 0
+        self.orders[slot] = 0
+
+def _day_major(values, n_replications, shape, dtype):
+    """
+    Per-day draws as a compact (days, 1 or n_replications, columns) array.
+    
+    The first axis of `values` is the day; the remaining axes broadcast
+    against (n_replications, *shape) as usual. Broadcast axes are never
+    materialized: the second result maps each flattened SKU to its column.
+    
+    Returns:
+        tuple: (draws, column of each SKU)
+    """
+    values = np.asarray(values, dtype=dtype)
+    if values.ndim < 1:
+        raise ValueError("Per-day draws need a leading day axis")
+    missing = 1 + len(shape) - (values.ndim - 1)
+    values = values.reshape(values.shape[:1] + (1,) * max(missing, 0) + values.shape[1:])
+    if np.broadcast_shapes(values.shape[1:], (n_replications,) + shape) != (n_replications,) + shape:
+        raise ValueError(f"Per-day draws of shape {values.shape[1:]} do not broadcast "
+                         f"to {(n_replications,) + shape}")
+    sku_shape = values.shape[2:]
+    columns = np.broadcast_to(np.arange(int(np.prod(sku_shape))).reshape(sku_shape), shape)
+    return values.reshape(values.shape[:2] + (-1,)), columns.ravel()
+
+def _draws_on(draws, day, n_replications):
+    """One day of per-day draws for a block of SKUs, flattened like its cells."""
+    values, columns = draws
+    return np.broadcast_to(values[day][:, columns], (n_replications, len(columns))).ravel()
+
+def simulate_policy(reorder_point, daily_demand, demand_stddev=0.0, order_quantity=None,
+                    order_up_to=None, review_period=1, lead_time=5, lead_time_stddev=0.0,
+                    days=60, n_replications=1000, initial_inventory=None, max_outstanding=None,
+                    demand=None, lead_times=None, return_path=False, chunk_size=2**15, seed=None):
+    """
+    Simulate an inventory policy with lost sales over replications x SKUs.
+    
+    Follows the reorder point notebook day by day, for all replications
+    and SKUs at once: demand is taken from on-hand stock (excess demand
+    is lost), then on review days (multiples of `review_period`) an order
+    is placed when the inventory position (on hand plus on order) is at
+    or below s, and orders arrive after their lead time (on the day of
+    ordering for a lead time of 0). The order is Q units when
+    `order_quantity` is given and S minus the position when `order_up_to`
+    is given, which covers
+        
+        (s, Q): order_quantity=Q
+        (s, S): order_up_to=S
+        (R, S): order_up_to=S, reorder_point=S, review_period=R
+        (R, s, S): order_up_to=S, review_period=R
+    
+    Outstanding orders live in an array-backed pipeline, so the day loop
+    is the only Python loop; SKUs are processed in blocks of at most
+    `chunk_size` replication x SKU cells.
+    
+    Args:
+        reorder_point (float or array-like): Reorder level s per SKU
+        daily_demand (float or array-like): Mean daily demand per SKU
+        demand_stddev (float or array-like): Standard deviation of daily
+            demand (normal, truncated at 0)
+        order_quantity (float or array-like, optional): Order quantity Q
+        order_up_to (float or array-like, optional): Order-up-to level S
+        review_period (int or array-like): Days between reviews (1 for
+            continuous review)
+        lead_time (float or array-like): Mean lead time in days
+        lead_time_stddev (float or array-like): Standard deviation of the
+            lead time; sampled lead times are rounded to whole days and
+            truncated to [0, mean + 6 standard deviations]
+        days (int): Days simulated, including day 0 (starting stock)
+        n_replications (int): Independent demand paths per SKU
+        initial_inventory (float or array-like, optional): Stock on day 0
+            (default: s + Q, or S)
+        max_outstanding (int, optional): Most orders open at once per
+            inventory (default: no limit)
+        demand (array-like, optional): Demand paths broadcastable to
+            (days - 1, n_replications, *sku_shape), used instead of sampling;
+            `demand[t - 1]` is consumed on day t
+        lead_times (array-like, optional): Whole-day lead times broadcastable
+            to (days, n_replications, *sku_shape), used instead of
+            sampling; an order placed on day t takes `lead_times[t]` days
+        return_path (bool): Also return the end-of-day on-hand inventory
+        chunk_size (int): Maximum replication x SKU cells simulated at once
+        seed (int, optional): Seed of the random generator
+    
+    Returns:
+        dict: Arrays shaped (n_replications, *sku_shape):
+            - 'service_level': Share of the `days` days without a stockout
+            - 'fill_rate': Share of demand served from stock
+            - 'average_inventory': Mean end-of-day on-hand inventory
+            - 'lost_sales': Units of demand lost
+            - 'orders': Number of orders placed
+            - 'inventory': (days, n_replications, *sku_shape) path, if requested
+    """
+    if (order_quantity is None) == (order_up_to is None):
+        raise ValueError("Give exactly one of order_quantity and order_up_to")
+    if days < 1 or n_replications < 1:
+        raise ValueError("days and n_replications must be positive")
+    up_to = order_up_to is not None
+    reorder_point, daily_demand, demand_stddev, lead_time, lead_time_stddev = (
+        np.asarray(a, dtype=np.float64) for a in (reorder_point, daily_demand, demand_stddev,
+                                                  lead_time, lead_time_stddev))
+    order_size = np.asarray(order_up_to if up_to else order_quantity, dtype=np.float64)
+    review_period = np.asarray(review_period)
+    if initial_inventory is None:
+        initial_inventory = order_size if up_to else reorder_point + order_size
+    initial_inventory = np.asarray(initial_inventory, dtype=np.float64)
+    if up_to and np.any(order_size < reorder_point):
+        raise ValueError("Order-up-to levels must be at least the reorder points")
+    if not up_to and np.any(order_size <= 0):
+        raise ValueError("Order quantities must be positive")
+    if np.any(review_period < 1) or np.any(review_period != np.round(review_period)):
+        raise ValueError("Review periods must be whole numbers of days, at least 1")
+    if np.any(lead_time < 0) or np.any(demand_stddev < 0) or np.any(lead_time_stddev < 0):
+        raise ValueError("Lead times and standard deviations must be non-negative")
+    parameters = (reorder_point, order_size, review_period.astype(np.intp), daily_demand,
+                  demand_stddev, lead_time, lead_time_stddev, initial_inventory)
+    shape = np.broadcast_shapes(*(p.shape for p in parameters))
+    parameters = [np.broadcast_to(p, shape).ravel() for p in parameters]
+    
+    if demand is not None:
+        demand = _day_major(demand, n_replications, shape, np.float64)
+        if len(demand[0]) < days - 1:
+            raise ValueError("demand must cover days - 1 days")
+    if lead_times is not None:
+        lead_times = _day_major(lead_times, n_replications, shape, np.intp)
+        if len(lead_times[0]) < days or np.any(lead_times[0] < 0):
+            raise ValueError("lead_times must cover every day and be non-negative")
+        max_lead_time = int(lead_times[0].max())
+    else:
+        max_lead_time = int(np.ceil(np.max(lead_time + _LEAD_TIME_SPREAD * lead_time_stddev,
+                                           initial=0)))
+    
+    rng = np.random.default_rng(seed)
+    n_skus = int(np.prod(shape))
+    step = max(1, chunk_size // n_replications)
+    results = {key: np.empty((n_replications, n_skus)) for key in
+               ('service_level', 'fill_rate', 'average_inventory', 'lost_sales', 'orders')}
+    if return_path:
+        results['inventory'] = np.empty((days, n_replications, n_skus))
+    
+    for start in range(0, n_skus, step):
+        cells = np.arange(start, min(start + step, n_skus))
+        block_draws = [None if draws is None else (draws[0], draws[1][cells])
+                       for draws in (demand, lead_times)]
+        block = _simulate_block([np.tile(p[cells], n_replications) for p in parameters],
+                                up_to, days, n_replications, max_lead_time, max_outstanding,
+                                *block_draws, rng, return_path)
+        for key, values in block.items():
+            results[key][..., cells] = values.reshape(values.shape[:-1] + (n_replications, -1))
+    return {key: values.reshape(values.shape[:-1] + shape) for key, values in results.items()}
+
+def simulate_sq_policy(reorder_point, order_quantity, daily_demand, demand_stddev=0.0, **kwargs):
+    """
+    Simulate a continuous-review (s, Q) policy with lost sales.
+    
+    Shorthand for `simulate_policy(reorder_point, daily_demand,
+    demand_stddev, order_quantity=order_quantity, **kwargs)`. With
+    `max_outstanding=1` and the notebook's demand path the result matches
+    the reorder point notebook loop exactly.
+    
+    Args:
+        reorder_point (float or array-like): Reorder point s per SKU
+        order_quantity (float or array-like): Order quantity Q per SKU
+        daily_demand (float or array-like): Mean daily demand per SKU
+        demand_stddev (float or array-like): Standard deviation of daily demand
+        **kwargs: Lead times, horizon, replications etc. (see `simulate_policy`)
+    
+    Returns:
+        dict: Per-replication distributions (see `simulate_policy`)
+    """
+    return simulate_policy(reorder_point, daily_demand, demand_stddev,
+                           order_quantity=order_quantity, **kwargs)
+
+def _simulate_block(parameters, up_to, days, n_replications, max_lead_time, max_outstanding,
+                    demand, lead_times, rng, return_path):
+    """Run one block of SKUs (flattened with their replications) through every day."""
+    (reorder_point, order_size, review_period, daily_demand, demand_stddev,
+     lead_time, lead_time_stddev, on_hand) = parameters
+    n_cells = len(on_hand)
+    on_hand = on_hand.copy()
+    pipeline = _Pipeline(max_lead_time, n_cells)
+    fixed_lead_time = np.rint(lead_time).astype(np.intp)
+    random_lead_time = np.any(lead_time_stddev > 0)
+    periodic = np.any(review_period > 1)
+    
+    inventory_total = on_hand.copy()
+    stockout_days = np.zeros(n_cells)
+    orders = np.zeros(n_cells)
+    lost = np.zeros(n_cells)
+    demanded = np.zeros(n_cells)
+    path = np.empty((days, n_cells)) if return_path else None
+    if return_path:
+        path[0] = on_hand
+    today = np.empty(n_cells)
+    position = np.empty(n_cells)
+    
+    for day in range(1, days):
+        if demand is None:
+            rng.standard_normal(out=today)
+            today *= demand_stddev
+            today += daily_demand
+            np.maximum(today, 0, out=today)
+        else:
+            today = _draws_on(demand, day - 1, n_replications)
+        on_hand -= today
+        demanded += today
+        stockout_days += on_hand < 0
+        lost -= np.minimum(on_hand, 0)
+        np.maximum(on_hand, 0, out=on_hand)
+        
+        np.add(on_hand, pipeline.on_order, out=position)
+        place = position <= reorder_point
+        if up_to:
+            place &= position < order_size
+        if periodic:
+            place &= day % review_period == 0
+        if max_outstanding is not None:
+            place &= pipeline.outstanding < max_outstanding
+        orders += place
+        ordering = np.flatnonzero(place)
+        if len(ordering):
+            if lead_times is not None:
+                delay = _draws_on(lead_times, day, n_replications)[ordering]
+            elif random_lead_time:
+                delay = np.rint(rng.normal(lead_time[ordering], lead_time_stddev[ordering]))
+                delay = np.clip(delay, 0, max_lead_time).astype(np.intp)
+            else:
+                delay = fixed_lead_time[ordering]
+            quantity = order_size[ordering]
+            if up_to:
+                quantity = quantity - position[ordering]
+            pipeline.place(day, ordering, quantity, delay)
+        
+        pipeline.receive(day, on_hand)
+        inventory_total += on_hand
+        if return_path:
+            path[day] = on_hand
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fill_rate = np.where(demanded > 0, 1 - lost / demanded, 1.0)
+    block = {
+        'service_level': 1 - stockout_days / days,
+        'fill_rate': fill_rate,
+        'average_inventory': inventory_total / days,
+        'lost_sales': lost,
+        'orders': orders
+    }
+    if return_path:
+        block['inventory'] = path
+    return block
@@ -0,0 +1,252 @@
+"""Chunked, broadcasting parameter sweeps over closed-form inventory formulas."""
+import numpy as np
+import pandas as pd
+
+from .eoq import economic_order_quantity, eoq_analysis
+from .safety_stock import (lead_time_demand_std, safety_stock, reorder_point,
+                           fill_rate_safety_stock, fill_rate_reorder_point)
+
+# Formulas that can be swept by name
+FORMULAS = {
+    'eoq': economic_order_quantity,
+    'eoq_analysis': eoq_analysis,
+    'lead_time_demand_std': lead_time_demand_std,
+    'safety_stock': safety_stock,
+    'reorder_point': reorder_point,
+    'fill_rate_safety_stock': fill_rate_safety_stock,
+    'fill_rate_reorder_point': fill_rate_reorder_point
+}
+
+_REDUCTIONS = {
+    'min': (np.min, np.minimum, np.inf),
+    'max': (np.max, np.maximum, -np.inf),
+    'sum': (np.sum, np.add, 0.0),
+    'mean': (np.sum, np.add, 0.0)
+}
+
+class LabeledArray:
+    """
+    An array whose axes are named and carry coordinate values.
+    
+    Attributes:
+        values (np.ndarray): The data
+        dims (tuple): Axis names
+        coords (dict): {axis name: 1-D coordinate values}
+    """
+    
+    def __init__(self, values, dims, coords):
+        self.values = values
+        self.dims = tuple(dims)
+        self.coords = {dim: np.asarray(coords[dim]) for dim in self.dims}
+        if values.shape != tuple(len(self.coords[dim]) for dim in self.dims):
+            raise ValueError("values must have one axis per dim, sized like its coordinates")
+    
+    @property
+    def shape(self):
+        """tuple: Length of each named axis."""
+        return self.values.shape
+    
+    def __repr__(self):
+        axes = ', '.join(f'{dim}: {len(self.coords[dim])}' for dim in self.dims)
+        return f'LabeledArray({axes})'
+    
+    def sel(self, **selection):
+        """
+        Select the nearest coordinate along some axes, dropping those axes.
+        
+        Returns:
+            LabeledArray: The remaining axes
+        """
+        index = tuple(_nearest(self.coords[dim], selection[dim]) if dim in selection
+                      else slice(None) for dim in self.dims)
+        dims = [dim for dim in self.dims if dim not in selection]
+        return LabeledArray(self.values[index], dims, self.coords)
+    
+    def to_frame(self):
+        """
+        Convert to pandas: a DataFrame for 2-D arrays (rows = first axis,
+        ready for `sns.heatmap`) or a Series for 1-D arrays.
+        """
+        if len(self.dims) == 1:
+            dim = self.dims[0]
+            return pd.Series(self.values, index=pd.Index(self.coords[dim], name=dim))
+        if len(self.dims) == 2:
+            rows, columns = self.dims
+            return pd.DataFrame(self.values, index=pd.Index(self.coords[rows], name=rows),
+                                columns=pd.Index(self.coords[columns], name=columns))
+        raise ValueError("Only 1-D and 2-D arrays convert to pandas; use sel() first")
+
+def _nearest(coords, value):
+    """Index of the coordinate closest to `value`."""
+    return int(np.argmin(np.abs(coords - value)))
+
+class Sweep:
+    """
+    A lazily evaluated grid of a broadcasting formula over named axes.
+    
+    Nothing is computed until `evaluate` or `reduce` is called; both walk
+    the grid in blocks of at most `chunk_size` points, evaluating each
+    block with a single broadcast call. Leading axes are fixed per block
+    and trailing axes are covered whole, so a 6-D study only ever holds
+    one block of temporaries, and `reduce` never materializes the grid.
+    
+    Example:
+        grid = Sweep('safety_stock', {'demand_stddev': np.linspace(10, 40, 20),
+                                      'lead_time_stddev': np.linspace(0.5, 2, 20)},
+                     lead_time=5, daily_demand=100, service_level=0.95)
+        sns.heatmap(grid.evaluate().to_frame())
+    """
+    
+    def __init__(self, formula, axes, output=None, **fixed):
+        """
+        Args:
+            formula (str or callable): A name in `FORMULAS` or any function
+                whose keyword arguments broadcast
+            axes (dict): {argument name: 1-D values}, in axis order
+            output (str, optional): Key to take when the formula returns a
+                dict (e.g. 'total_cost' for 'eoq_analysis')
+            **fixed: Arguments held constant over the grid
+        """
+        if isinstance(formula, str):
+            if formula not in FORMULAS:
+                raise ValueError(f"Unknown formula '{formula}'; choose from {sorted(FORMULAS)}")
+            formula = FORMULAS[formula]
+        if not axes:
+            raise ValueError("A sweep needs at least one axis")
+        overlap = set(axes) & set(fixed)
+        if overlap:
+            raise ValueError(f"Arguments given both as axes and fixed: {sorted(overlap)}")
+        
+        self.formula = formula
+        self.output = output
+        self.fixed = fixed
+        self.dims = tuple(axes)
+        self.coords = {dim: np.asarray(values) for dim, values in axes.items()}
+        if any(c.ndim != 1 or len(c) == 0 for c in self.coords.values()):
+            raise ValueError("Every axis needs a non-empty 1-D array of values")
+    
+    @property
+    def shape(self):
+        """tuple: Grid size along each swept axis, before evaluation."""
+        return tuple(len(self.coords[dim]) for dim in self.dims)
+    
+    def sel(self, **selection):
+        """
+        Fix some axes at their nearest coordinate, without evaluating.
+        
+        Returns:
+            Sweep: The sweep over the remaining axes
+        """
+        fixed = dict(self.fixed)
+        for dim, value in selection.items():
+            fixed[dim] = self.coords[dim][_nearest(self.coords[dim], value)]
+        axes = {dim: self.coords[dim] for dim in self.dims if dim not in selection}
+        return Sweep(self.formula, axes, self.output, **fixed)
+    
+    def _blocks(self, chunk_size):
+        """Yield block indices: integers on leading axes, then one slice."""
+        shape = self.shape
+        for split in range(len(shape)):
+            inner = int(np.prod(shape[split + 1:]))
+            if inner <= chunk_size:
+                break
+        step = max(1, chunk_size // inner)
+        for prefix in np.ndindex(*shape[:split]):
+            for start in range(0, shape[split], step):
+                yield prefix + (slice(start, min(start + step, shape[split])),)
+    
+    def _evaluate_block(self, index):
+        """Evaluate the formula on one block with a single broadcast call."""
+        split = len(index) - 1
+        block_dims = self.dims[split:]
+        arguments = dict(self.fixed)
+        for i, dim in enumerate(self.dims):
+            if i < split:
+                arguments[dim] = self.coords[dim][index[i]]
+            else:
+                values = self.coords[dim][index[i]] if i == split else self.coords[dim]
+                shape = [1] * len(block_dims)
+                shape[i - split] = -1
+                arguments[dim] = values.reshape(shape)
+        
+        result = self.formula(**arguments)
+        if isinstance(result, dict):
+            if self.output is None:
+                raise ValueError("The formula returns a dict; pass `output` to pick a key")
+            result = result[self.output]
+        block_shape = (index[split].stop - index[split].start,) + self.shape[split + 1:]
+        return np.broadcast_to(result, block_shape)
+    
+    def evaluate(self, chunk_size=2**20, out=None):
+        """
+        Evaluate the whole grid block by block.
+        
+        Args:
+            chunk_size (int): Maximum grid points evaluated per call
+            out (np.ndarray, optional): Destination shaped like the grid, e.g.
+                a `np.lib.format.open_memmap` array for grids larger than memory
+        
+        Returns:
+            LabeledArray: Values over all axes
+        """
+        if out is None:
+            out = np.empty(self.shape)
+        elif out.shape != self.shape:
+            raise ValueError(f"out must have shape {self.shape}")
+        for index in self._blocks(chunk_size):
+            out[index] = self._evaluate_block(index)
+        return LabeledArray(out, self.dims, self.coords)
+    
+    def reduce(self, how='max', over=(), chunk_size=2**20):
+        """
+        Reduce over some axes without materializing the grid.
+        
+        Args:
+            how (str): 'min', 'max', 'sum' or 'mean'
+            over (sequence): Axis names to reduce over
+            chunk_size (int): Maximum grid points evaluated per call
+        
+        Returns:
+            LabeledArray: Reduced values over the remaining axes
+        """
+        if how not in _REDUCTIONS:
+            raise ValueError(f"how must be one of {sorted(_REDUCTIONS)}")
+        over = [over] if isinstance(over, str) else list(over)
+        if not set(over) <= set(self.dims):
+            raise ValueError(f"Unknown axes {sorted(set(over) - set(self.dims))}")
+        block_reduce, combine, initial = _REDUCTIONS[how]
+        
+        # Kept axes first, so every block maps onto one region of the result
+        kept = [dim for dim in self.dims if dim not in over]
+        ordered = Sweep(self.formula, {dim: self.coords[dim] for dim in kept + over},
+                        self.output, **self.fixed)
+        n_kept = len(kept)
+        result = np.full(ordered.shape[:n_kept], initial)
+        for index in ordered._blocks(chunk_size):
+            block = ordered._evaluate_block(index)
+            split = len(index) - 1
+            reduced_axes = tuple(range(max(n_kept - split, 0), block.ndim))
+            target = index[:n_kept]
+            result[target] = combine(result[target], block_reduce(block, axis=reduced_axes))
+        
+        if how == 'mean':
+            result /= np.prod([len(self.coords[dim]) for dim in over])
+        return LabeledArray(result, kept, self.coords)
+
+def sweep(formula, axes, output=None, chunk_size=2**20, **fixed):
+    """
+    Evaluate a formula over the full grid of the given axes.
+    
+    Shorthand for `Sweep(formula, axes, output, **fixed).evaluate(chunk_size)`.
+    
+    Args:
+        formula (str or callable): A name in `FORMULAS` or a broadcasting function
+        axes (dict): {argument name: 1-D values}, in axis order
+        output (str, optional): Key to take when the formula returns a dict
+        chunk_size (int): Maximum grid points evaluated per call
+        **fixed: Arguments held constant over the grid
+    
+    Returns:
+        LabeledArray: Values over all axes
+    """
+    return Sweep(formula, axes, output, **fixed).evaluate(chunk_size)
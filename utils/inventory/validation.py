@@ -0,0 +1,126 @@
+"""Columnar validation of SKU policy tables."""
+import numpy as np
+
+# Policy columns the checks read; tables may hold any subset of them
+POLICY_COLUMNS = ('safety_stock', 'reorder_point', 'service_level', 'investment', 'unit_cost')
+
+# Checks of `validate_policies` in flag bit order: {name: columns needed}
+POLICY_CHECKS = {
+    'non_finite_value': (),
+    'safety_stock_not_positive': ('safety_stock',),
+    'reorder_point_not_positive': ('reorder_point',),
+    'service_level_out_of_range': ('service_level',),
+    'investment_not_positive': ('investment',),
+    'reorder_point_below_safety_stock': ('reorder_point', 'safety_stock'),
+    'investment_mismatch': ('investment', 'safety_stock', 'unit_cost')
+}
+
+def _table_columns(policies):
+    """Column names of a DataFrame, structured array or dict of arrays."""
+    names = getattr(getattr(policies, 'dtype', None), 'names', None)
+    if names is not None:
+        return list(names)
+    if hasattr(policies, 'columns'):
+        return list(policies.columns)
+    if isinstance(policies, dict):
+        return list(policies)
+    raise ValueError("policies must be a DataFrame, structured array or dict of columns")
+
+def validate_policies(policies, columns=None, tolerance=0.01):
+    """
+    Check every row of a SKU policy table with vectorized masks.
+    
+    The column checks of `check_multi_product_safety` and
+    `check_multi_item_policy` (positive safety stocks, reorder points and
+    investment; service levels in [0, 1]), two consistency checks
+    (reorder point covers the safety stock; investment equals unit cost
+    times safety stock) and a check for NaN or infinite entries each run
+    as one comparison over whole columns. Checks whose columns are absent
+    are skipped. The result is a compact
+    report: one integer of violation bits per row, decoded with
+    `violation_names`.
+    
+    Args:
+        policies (DataFrame, structured array or dict): Policy table with
+            any of `POLICY_COLUMNS`
+        columns (dict, optional): {policy column: table column} for tables
+            using other names, e.g. {'safety_stock': 'SS'}
+        tolerance (float): Acceptable absolute difference in the
+            consistency checks
+    
+    Returns:
+        dict: Report with:
+            - 'flags': np.ndarray of violation bits per row (bit i set
+              when the i-th check of `POLICY_CHECKS` fails)
+            - 'rows': Indices of rows with any violation
+            - 'counts': {check: number of failing rows} for checks run
+            - 'valid': True when no row fails
+    """
+    names = dict(zip(POLICY_COLUMNS, POLICY_COLUMNS))
+    names.update(columns or {})
+    available = set(_table_columns(policies))
+    values = {column: np.asarray(policies[names[column]], dtype=np.float64).ravel()
+              for column in POLICY_COLUMNS if names[column] in available}
+    if not values:
+        raise ValueError(f"policies has none of the columns {POLICY_COLUMNS}")
+    lengths = {len(column) for column in values.values()}
+    if len(lengths) != 1:
+        raise ValueError("Policy columns must have the same length")
+    n_rows = lengths.pop()
+    
+    safety_stock = values.get('safety_stock')
+    reorder_point = values.get('reorder_point')
+    service_level = values.get('service_level')
+    investment = values.get('investment')
+    unit_cost = values.get('unit_cost')
+    masks = {}
+    non_finite = np.zeros(n_rows, dtype=bool)
+    for column in values.values():
+        non_finite |= ~np.isfinite(column)
+    masks['non_finite_value'] = non_finite
+    # NaN compares false, so missing values are only flagged as non-finite
+    if safety_stock is not None:
+        masks['safety_stock_not_positive'] = safety_stock <= 0
+    if reorder_point is not None:
+        masks['reorder_point_not_positive'] = reorder_point <= 0
+    if service_level is not None:
+        masks['service_level_out_of_range'] = (service_level < 0) | (service_level > 1)
+    if investment is not None:
+        masks['investment_not_positive'] = investment <= 0
+    if reorder_point is not None and safety_stock is not None:
+        masks['reorder_point_below_safety_stock'] = reorder_point < safety_stock - tolerance
+    if investment is not None and safety_stock is not None and unit_cost is not None:
+        with np.errstate(invalid='ignore'):
+            expected = unit_cost * safety_stock
+            masks['investment_mismatch'] = np.abs(investment - expected) > tolerance
+    
+    flags = np.zeros(n_rows, dtype=np.uint8)
+    for bit, check in enumerate(POLICY_CHECKS):
+        if check in masks:
+            flags |= masks[check].astype(np.uint8) << np.uint8(bit)
+    rows = np.flatnonzero(flags)
+    return {
+        'flags': flags,
+        'rows': rows,
+        'counts': {check: int(np.count_nonzero(mask)) for check, mask in masks.items()},
+        'valid': len(rows) == 0
+    }
+
+def violation_names(flags):
+    """
+    Names of the failed checks for each row of a report.
+    
+    Only the distinct flag values are decoded, so this stays cheap for
+    the violating rows of a large table.
+    
+    Args:
+        flags (array-like): Violation bits, e.g. `report['flags'][report['rows']]`
+    
+    Returns:
+        list: Tuple of check names per row
+    """
+    flags = np.asarray(flags)
+    distinct, inverse = np.unique(flags, return_inverse=True)
+    decoded = [tuple(check for bit, check in enumerate(POLICY_CHECKS) if value >> bit & 1)
+               for value in distinct.tolist()]
+    return [decoded[i] for i in inverse.ravel().tolist()]
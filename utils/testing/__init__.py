@@ -8,7 +8,6 @@ from .probability_tests import (
 
 from .inventory_tests import (
     check_service_level,
-    check_z_score,
     check_two_stage_system
 )
 
@@ -34,7 +33,6 @@ __all__ = [
     
     # Inventory
     'check_service_level',
-    'check_z_score',
     'check_two_stage_system',
     
     # Hypothesis
@@ -3,6 +3,10 @@
 import numpy as np
 from scipy import stats
 
+from ..forecasting.exponential_smoothing import simple_exponential_smoothing
+from ..forecasting.holt_winters import holt_winters
+from ..forecasting.diagnostics import autocorrelation
+
 def check_moving_average(ma_values, original_data, window_size, weights=None, tolerance=0.001):
     """
     Check if moving average calculations are correct.
@@ -45,18 +49,20 @@ def check_moving_average(ma_values, original_data, window_size, weights=None, to
     return True
 
 def check_exponential_smoothing(smoothed_values, original_data, alpha, beta=None, gamma=None, 
-                              seasonal_periods=None, tolerance=0.001):
+                              seasonal_periods=None, tolerance=0.001, seasonal='additive'):
     """
     Check exponential smoothing calculations.
     
     Args:
         smoothed_values (array-like): Calculated smoothed values
-        original_data (array-like): Original time series data
+        original_data (array-like): Original time series data (1-D, or 2-D
+            shaped (n_series, n_periods) for a panel)
         alpha (float): Level smoothing factor
         beta (float, optional): Trend smoothing factor
         gamma (float, optional): Seasonal smoothing factor
         seasonal_periods (int, optional): Number of periods in seasonal cycle
         tolerance (float): Acceptable difference from expected values
+        seasonal (str): 'additive' or 'multiplicative' Holt-Winters model
         
     Returns:
         bool: True if calculations are within tolerance
@@ -70,14 +76,25 @@ def check_exponential_smoothing(smoothed_values, original_data, alpha, beta=None
     if gamma is not None:
         if not (0 <= gamma <= 1) or seasonal_periods is None:
             return False
+    
+    smoothed_values = np.asarray(smoothed_values, dtype=float)
+    
+    # Holt-Winters check: rebuild the seasonal recurrence for every series at once
+    if gamma is not None:
+        try:
+            expected = holt_winters(original_data, alpha, beta, gamma, seasonal_periods,
+                                    seasonal=seasonal)[0]
+        except ValueError:
+            return False
+        return (smoothed_values.shape == expected.shape and
+                np.allclose(smoothed_values, expected, rtol=tolerance))
             
     # Basic exponential smoothing check
-    if beta is None and gamma is None:
-        level = original_data[0]
-        for i in range(1, len(original_data)):
-            level = alpha * original_data[i] + (1 - alpha) * level
-            if not np.isclose(smoothed_values[i], level, rtol=tolerance):
-                return False
+    if beta is None:
+        expected = simple_exponential_smoothing(original_data, alpha)
+        if smoothed_values.shape != expected.shape:
+            return False
+        return np.allclose(smoothed_values[..., 1:], expected[..., 1:], rtol=tolerance)
                 
     return True
 
@@ -145,9 +162,8 @@ def check_arima_residuals(residuals, significance_level=0.05):
     if p_value < significance_level:
         return False
         
-    # Check for autocorrelation
-    acf = np.correlate(residuals, residuals, mode='full')[len(residuals)-1:]
-    acf = acf / acf[0]
+    # Check for autocorrelation (FFT-based, same normalization as np.correlate)
+    acf = autocorrelation(residuals, demean=False)
     if np.any(np.abs(acf[1:]) > 2/np.sqrt(len(residuals))):
         return False
         
@@ -1,6 +1,9 @@
 """Test functions for inventory management problems."""
 import numpy as np
-from scipy import stats
+
+from ..inventory.eoq import economic_order_quantity, eoq_analysis
+from ..inventory.safety_stock import safety_stock
+from ..inventory.service_level import service_level_from_z
 
 def check_eoq(solution_dict, D=1200, S=100, H=20, tolerance=1.0):
     """
@@ -8,19 +11,23 @@ def check_eoq(solution_dict, D=1200, S=100, H=20, tolerance=1.0):
     
     Args:
         solution_dict (dict): Dictionary containing 'eoq' key with calculated EOQ
-        D (float): Annual demand
-        S (float): Ordering cost
-        H (float): Holding cost
+            (a scalar, or one value per product)
+        D (float or array-like): Annual demand
+        S (float or array-like): Ordering cost
+        H (float or array-like): Holding cost
         tolerance (float): Acceptable difference from expected value
         
     Returns:
-        bool: True if EOQ is within tolerance of expected value
+        bool: True if every EOQ is within tolerance of expected value
     """
     if 'eoq' not in solution_dict:
         return False
-    eoq = solution_dict['eoq']
-    expected_eoq = np.sqrt(2 * D * S / H)
-    return abs(eoq - expected_eoq) <= tolerance
+    eoq = np.asarray(solution_dict['eoq'], dtype=float)
+    try:
+        expected_eoq = economic_order_quantity(D, S, H)
+    except ValueError:
+        return False
+    return bool(np.all(np.abs(eoq - expected_eoq) <= tolerance))
 
 def check_total_cost(solution_dict, D=1200, S=100, H=20, tolerance=1.0):
     """
@@ -39,10 +46,12 @@ def check_total_cost(solution_dict, D=1200, S=100, H=20, tolerance=1.0):
         bool: True if total cost is within tolerance of expected value
     """
     if 'total_cost' in solution_dict:
-        total_cost = solution_dict['total_cost']
-        Q = np.sqrt(2 * D * S / H)  # Use optimal Q for checking
-        expected_cost = (D * S / Q) + (H * Q / 2)
-        return abs(total_cost - expected_cost) <= tolerance
+        total_cost = np.asarray(solution_dict['total_cost'], dtype=float)
+        try:
+            expected_cost = eoq_analysis(D, S, H)['total_cost']  # Use optimal Q for checking
+        except ValueError:
+            return False
+        return bool(np.all(np.abs(total_cost - expected_cost) <= tolerance))
     elif 'cost_curves' in solution_dict:
         curves = solution_dict['cost_curves']
         if not all(k in curves for k in ['ordering_costs', 'holding_costs', 'total_costs']):
@@ -81,11 +90,11 @@ def check_pareto_analysis(solution_dict, tolerance=0.01):
     cumulative = solution_dict['cumulative_percentages']
     
     # Check if percentages sum to 1
-    if abs(sum(percentages) - 1.0) > tolerance:
+    if abs(np.sum(percentages) - 1.0) > tolerance:
         return False
     
     # Check if cumulative percentages are monotonically increasing
-    if not all(cumulative[i] <= cumulative[i+1] for i in range(len(cumulative)-1)):
+    if not np.all(np.diff(np.asarray(cumulative, dtype=np.float64)) >= 0):
         return False
     
     # Check if final cumulative percentage is 1
@@ -232,7 +241,7 @@ def check_service_level(solution_dict, target=0.95, tolerance=0.01):
         bool: True if service level is within tolerance
     """
     if 'z_score' in solution_dict:
-        achieved_level = stats.norm.cdf(solution_dict['z_score'])
+        achieved_level = service_level_from_z(solution_dict['z_score'])
         return abs(achieved_level - target) <= tolerance
     
     elif 'service_level' in solution_dict:
@@ -241,11 +250,49 @@ def check_service_level(solution_dict, target=0.95, tolerance=0.01):
     elif 'safety_stock' in solution_dict:
         # Check if safety stock provides the target service level
         z_score = solution_dict['safety_stock'] / (solution_dict.get('demand_std', 20))
-        achieved_level = stats.norm.cdf(z_score)
+        achieved_level = service_level_from_z(z_score)
         return abs(achieved_level - target) <= tolerance
     
     return False
 
+def check_two_stage_system(solution_dict, mean=75, std_dev=25, lead_time_days=3,
+                           review_period_days=7, service_level=0.95, days_per_month=30,
+                           tolerance=0.5):
+    """
+    Check store-level parameters of the two-stage system design.
+    
+    Values and demand parameters may be arrays (one entry per store), so
+    a whole network of stores is validated in one call.
+    
+    Args:
+        solution_dict (dict): Dictionary containing any of:
+            - 'safety_stock'
+            - 'reorder_point'
+            - 'order_up_to'
+        mean (float or array-like): Monthly mean demand per store
+        std_dev (float or array-like): Monthly demand standard deviation
+        lead_time_days (float or array-like): Replenishment lead time in days
+        review_period_days (float or array-like): Review period in days
+        service_level (float or array-like): Target cycle service level
+        days_per_month (float): Days used to convert monthly demand to daily
+        tolerance (float): Acceptable difference from expected value
+        
+    Returns:
+        bool: True if every provided value is within tolerance
+    """
+    keys = [k for k in ('safety_stock', 'reorder_point', 'order_up_to') if k in solution_dict]
+    if not keys:
+        return False
+    
+    daily_mean = np.asarray(mean) / days_per_month
+    daily_std = np.asarray(std_dev) / np.sqrt(days_per_month)
+    cycle_days = np.asarray(review_period_days) + np.asarray(lead_time_days)
+    expected = {'safety_stock': safety_stock(daily_std, cycle_days, service_level)}
+    expected['reorder_point'] = daily_mean * cycle_days + expected['safety_stock']
+    expected['order_up_to'] = expected['reorder_point'] + daily_mean * np.asarray(review_period_days)
+    return all(bool(np.all(np.abs(np.asarray(solution_dict[k]) - expected[k]) <= tolerance))
+               for k in keys)
+
 def check_variable_lt_safety(solution_dict, tolerance=0.01):
     """
     Check safety stock calculations with variable lead time.
@@ -279,6 +326,12 @@ def check_variable_lt_safety(solution_dict, tolerance=0.01):
     
     return True
 
+def _per_product(values):
+    """Values of a {product: value} dict (or an array of them) as one array."""
+    if isinstance(values, dict):
+        values = list(values.values())
+    return np.asarray(values, dtype=np.float64)
+
 def check_multi_product_safety(solution_dict):
     """
     Check safety stock calculations for multiple products.
@@ -298,19 +351,21 @@ def check_multi_product_safety(solution_dict):
     if not all(k in solution_dict for k in required_keys):
         return False
     
-    for product_dict in solution_dict.values():
-        if isinstance(product_dict, dict):
-            # Safety stocks should be positive
-            if any(ss <= 0 for ss in solution_dict['safety_stocks'].values()):
-                return False
-            
-            # Service levels should be between 0 and 1
-            if any(not 0 <= sl <= 1 for sl in solution_dict['service_levels'].values()):
-                return False
-            
-            # Costs should be positive
-            if any(cost <= 0 for cost in solution_dict['inventory_costs'].values()):
-                return False
+    safety_stocks, service_levels, costs = (
+        _per_product(solution_dict[k])
+        for k in ('safety_stocks', 'service_levels', 'inventory_costs'))
+    
+    # Safety stocks should be positive
+    if np.any(safety_stocks <= 0):
+        return False
+    
+    # Service levels should be between 0 and 1
+    if not np.all((service_levels >= 0) & (service_levels <= 1)):
+        return False
+    
+    # Costs should be positive
+    if np.any(costs <= 0):
+        return False
     
     # Total investment should be positive and match sum of individual costs
     if solution_dict['total_investment'] <= 0:
@@ -337,19 +392,21 @@ def check_multi_item_policy(solution_dict):
     if not all(k in solution_dict for k in required_keys):
         return False
     
-    for part_dict in solution_dict.values():
-        if isinstance(part_dict, dict):
-            # Reorder points should be positive
-            if any(rop <= 0 for rop in solution_dict['reorder_points'].values()):
-                return False
-            
-            # Safety stocks should be positive
-            if any(ss <= 0 for ss in solution_dict['safety_stocks'].values()):
-                return False
-            
-            # Service levels should be between 0 and 1
-            if any(not 0 <= sl <= 1 for sl in solution_dict['service_levels'].values()):
-                return False
+    reorder_points, safety_stocks, service_levels = (
+        _per_product(solution_dict[k])
+        for k in ('reorder_points', 'safety_stocks', 'service_levels'))
+    
+    # Reorder points should be positive
+    if np.any(reorder_points <= 0):
+        return False
+    
+    # Safety stocks should be positive
+    if np.any(safety_stocks <= 0):
+        return False
+    
+    # Service levels should be between 0 and 1
+    if not np.all((service_levels >= 0) & (service_levels <= 1)):
+        return False
     
     # Total investment should be positive
     if solution_dict['total_investment'] <= 0:
@@ -0,0 +1,74 @@
+"""
+Test module for incremental ABC reclassification.
+Checks that updates keep the classes of a full reclassification and
+report exactly the SKUs whose class changed.
+"""
+
+import numpy as np
+import pytest
+
+from utils.inventory import ABCIndex, abc_classify
+
+@pytest.fixture
+def catalog():
+    """Dollar volumes of a few thousand SKUs."""
+    rng = np.random.default_rng(17)
+    return rng.integers(100, 10000, 3000) * rng.uniform(10, 1000, 3000)
+
+def test_initial_classes_match_full_classification(catalog):
+    """Test the index starts from the `assign_category` classes."""
+    index = ABCIndex(catalog)
+    np.testing.assert_array_equal(index.classes, abc_classify(catalog))
+
+@pytest.mark.parametrize('bucket_size', [4, 64])
+def test_updates_report_only_changed_classes(catalog, bucket_size):
+    """Test random batches against reclassifying from scratch."""
+    rng = np.random.default_rng(bucket_size)
+    volume = catalog.copy()
+    index = ABCIndex(volume, bucket_size=bucket_size)
+    
+    for _ in range(100):
+        skus = rng.integers(0, len(volume), rng.integers(1, 10))
+        new_volume = volume[skus] * rng.lognormal(0, 1.5, len(skus))
+        before = abc_classify(volume)
+        volume[skus] = new_volume
+        
+        changes = index.update(skus, new_volume)
+        after = abc_classify(volume)
+        np.testing.assert_array_equal(index.classes, after)
+        assert sorted(sku for sku, _, _ in changes) == list(np.flatnonzero(before != after))
+        for sku, old, new in changes:
+            assert (old, new) == (before[sku], after[sku])
+
+def test_add_sales_with_named_and_new_skus():
+    """Test sales increments, duplicate SKUs in a batch and new SKUs."""
+    index = ABCIndex([500, 300, 150, 40, 10], skus=['P1', 'P2', 'P3', 'P4', 'P5'])
+    assert list(index.classes) == ['A', 'A', 'B', 'C', 'C']
+    
+    changes = index.add_sales(['P4', 'P4', 'P6'], [300, 300, 5])
+    assert sorted(changes) == [('P2', 'A', 'B'), ('P3', 'B', 'C'), ('P4', 'C', 'A'),
+                               ('P6', None, 'C')]
+    assert index.class_of('P4') == 'A'
+    np.testing.assert_array_equal(index.classes, abc_classify(index.volumes))
+
+def test_batch_of_new_skus():
+    """Test many unknown SKUs, one repeated, are added in a single update."""
+    index = ABCIndex([500, 300, 150, 40, 10])
+    new = np.arange(5, 5005)
+    changes = index.update(list(new) + [5], np.append(np.linspace(1, 100, 5000), 900.0))
+    assert len(index.skus) == 5005
+    assert index.volumes[5] == 900.0
+    np.testing.assert_array_equal(index.classes, abc_classify(index.volumes))
+    assert sorted(sku for sku, old, _ in changes if old is None) == list(new)
+
+def test_policies_and_empty_volume():
+    """Test policy columns follow the classes and zero volume is all C."""
+    index = ABCIndex(np.zeros(4))
+    assert list(index.classes) == ['C'] * 4
+    
+    changes = index.update([2, 3], [800.0, 200.0])
+    assert changes == [(2, 'C', 'A')]
+    assert list(index.policies()['review_period_days']) == [30, 30, 7, 30]
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,78 @@
+"""
+Test module for the grouped forecast-accuracy engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.forecasting import AccuracyAccumulator, forecast_accuracy, naive_scale
+
+@pytest.fixture
+def backtest_rows():
+    """Synthetic (store, horizon) backtest rows."""
+    rng = np.random.default_rng(42)
+    n = 3000
+    actuals = rng.poisson(20, n).astype(float)
+    actuals[:10] = 0  # zero sales must not break MAPE
+    forecasts = actuals + rng.normal(0, 3, n)
+    store = rng.choice(['NYC', 'BOS', 'CHI'], n)
+    horizon = rng.integers(1, 4, n)
+    return forecasts, actuals, store, horizon
+
+def test_matches_pandas_groupby(backtest_rows):
+    """Test grouped metrics against a plain pandas computation."""
+    forecasts, actuals, store, horizon = backtest_rows
+    result = forecast_accuracy(forecasts, actuals, {'store': store, 'horizon': horizon}, scale=2.0)
+    
+    df = pd.DataFrame({'store': store, 'horizon': horizon,
+                       'error': actuals - forecasts, 'actual': actuals, 'forecast': forecasts})
+    for (s, h), rows in df.groupby(['store', 'horizon']):
+        metrics = result.loc[(s, h)]
+        nonzero = rows[rows['actual'] != 0]
+        assert metrics['count'] == len(rows)
+        assert np.isclose(metrics['mae'], rows['error'].abs().mean())
+        assert np.isclose(metrics['rmse'], np.sqrt((rows['error']**2).mean()))
+        assert np.isclose(metrics['mape'],
+                          100 * (nonzero['error'] / nonzero['actual']).abs().mean())
+        assert np.isclose(metrics['smape'], 100 * (2 * rows['error'].abs() /
+                          (rows['actual'].abs() + rows['forecast'].abs())).mean())
+        assert np.isclose(metrics['mase'], rows['error'].abs().mean() / 2.0)
+
+def test_chunked_and_merged_accumulators(backtest_rows):
+    """Test chunked updates and merged workers give the one-shot result."""
+    forecasts, actuals, store, horizon = backtest_rows
+    groups = {'store': store, 'horizon': horizon}
+    expected = forecast_accuracy(forecasts, actuals, groups)
+    
+    left, right = AccuracyAccumulator(), AccuracyAccumulator()
+    for start in range(0, len(actuals), 500):
+        chunk = slice(start, start + 500)
+        target = left if start < 1500 else right
+        target.update(forecasts[chunk], actuals[chunk],
+                      {'store': store[chunk], 'horizon': horizon[chunk]})
+    merged = left.merge(right).result()
+    
+    pd.testing.assert_frame_equal(merged, expected)
+
+def test_single_group_and_naive_scale():
+    """Test ungrouped metrics and the naive MASE scale."""
+    history = np.array([10.0, 12.0, 11.0, 15.0])
+    assert np.isclose(naive_scale(history), 7 / 3)
+    np.testing.assert_allclose(naive_scale(np.vstack([history, 2 * history])), [7 / 3, 14 / 3])
+    
+    result = forecast_accuracy([14.0, 16.0], [15.0, 15.0], scale=naive_scale(history))
+    assert len(result) == 1
+    assert np.isclose(result['mase'].iloc[0], 1 / (7 / 3))
+
+def test_mismatched_keys_rejected(backtest_rows):
+    """Test accumulators refuse rows grouped by different keys."""
+    forecasts, actuals, store, horizon = backtest_rows
+    acc = AccuracyAccumulator().update(forecasts, actuals, {'store': store})
+    with pytest.raises(ValueError):
+        acc.update(forecasts, actuals, {'horizon': horizon})
+    with pytest.raises(ValueError):
+        acc.update(forecasts[:5], actuals)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
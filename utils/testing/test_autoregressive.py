@@ -0,0 +1,81 @@
+"""
+Test module for the batched Yule-Walker AR fitter.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import fit_ar, ar_residuals, ar_forecast, residual_diagnostics
+
+@pytest.fixture
+def ar2_panel():
+    """Thirty AR(2) series around a mean of 50."""
+    rng = np.random.default_rng(42)
+    noise = rng.normal(size=(30, 700))
+    values = np.zeros_like(noise)
+    for t in range(2, values.shape[1]):
+        values[:, t] = 0.6 * values[:, t-1] - 0.3 * values[:, t-2] + noise[:, t]
+    return values[:, 200:] + 50
+
+def _yule_walker(series, order):
+    """Dense Yule-Walker solution with the biased autocovariance."""
+    centered = series - series.mean()
+    n = len(centered)
+    acov = np.array([np.sum(centered[k:] * centered[:n-k]) / n for k in range(order + 1)])
+    toeplitz = acov[np.abs(np.subtract.outer(np.arange(order), np.arange(order)))]
+    coef = np.linalg.solve(toeplitz, acov[1:])
+    return coef, acov[0] - coef @ acov[1:]
+
+def test_matches_dense_yule_walker(ar2_panel):
+    """Test Levinson-Durbin against a direct Toeplitz solve."""
+    params = fit_ar(ar2_panel, 4)
+    for i in range(3):
+        coef, sigma2 = _yule_walker(ar2_panel[i], 4)
+        np.testing.assert_allclose(params['coef'][i], coef, atol=1e-10)
+        assert np.isclose(params['sigma2'][i], sigma2)
+    
+    # The fit should recover the generating process
+    np.testing.assert_allclose(params['coef'][:, :2].mean(axis=0), [0.6, -0.3], atol=0.05)
+    assert np.all(np.abs(params['pacf'][:, 2:]) < 0.2)
+
+def test_residuals_feed_diagnostics(ar2_panel):
+    """Test AR residuals are white noise while the raw series are not."""
+    params = fit_ar(ar2_panel, 2)
+    residuals = ar_residuals(ar2_panel, params)
+    
+    assert residuals.shape == (30, 498)
+    assert residual_diagnostics(residuals)['white_noise'].mean() > 0.7
+    assert not residual_diagnostics(ar2_panel)['white_noise'].any()
+
+def test_forecast_recursion(ar2_panel):
+    """Test multi-step forecasts follow the AR recursion."""
+    params = fit_ar(ar2_panel[0], 2)
+    forecasts = ar_forecast(ar2_panel[0], params, 3)
+    
+    mu = params['mean']
+    phi = params['coef']
+    x = list(ar2_panel[0][-2:] - mu)
+    for h in range(3):
+        x.append(phi[0] * x[-1] + phi[1] * x[-2])
+        assert np.isclose(forecasts[h], x[-1] + mu)
+
+def test_differenced_model_forecasts_drift():
+    """Test ARIMA(1, 1, 0) forecasts integrate the differenced forecasts."""
+    rng = np.random.default_rng(0)
+    walk = np.cumsum(rng.normal(2.0, 0.1, (4, 400)), axis=1)
+    params = fit_ar(walk, 1, d=1)
+    
+    forecasts = ar_forecast(walk, params, 5)
+    steps = np.diff(np.hstack([walk[:, -1:], forecasts]), axis=1)
+    np.testing.assert_allclose(steps, 2.0, atol=0.1)
+    assert ar_residuals(walk, params).shape == (4, 398)
+
+def test_invalid_arguments(ar2_panel):
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        fit_ar(ar2_panel, 0)
+    with pytest.raises(ValueError):
+        fit_ar(ar2_panel[:, :3], 5)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
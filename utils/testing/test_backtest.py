@@ -0,0 +1,81 @@
+"""
+Test module for the rolling-origin backtest harness.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import (
+    backtest,
+    rolling_origins,
+    simple_exponential_smoothing,
+    holts_method,
+    holts_forecast
+)
+
+@pytest.fixture
+def sales_panel():
+    """Trending daily sales for eight series."""
+    rng = np.random.default_rng(42)
+    t = np.arange(80)
+    return 100 + 0.5 * t + rng.normal(0, 3, (8, 80))
+
+METHODS = {
+    'sma_3': ('sma', {'window': 3}),
+    'wma_3': ('wma', {'weights': [0.2, 0.3, 0.5]}),
+    'ses': ('ses', {'alpha': 0.3}),
+    'holt': ('holt', {'alpha': 0.5, 'beta': 0.3})
+}
+
+def test_rolling_origins_are_lazy():
+    """Test origin generation."""
+    origins = rolling_origins(20, initial=10, horizon=3, step=2)
+    assert next(origins) == 10
+    assert list(origins) == [12, 14, 16]
+    with pytest.raises(ValueError):
+        list(rolling_origins(20, initial=10, horizon=0))
+
+def test_reused_state_matches_refitting(sales_panel):
+    """Test the rolled-forward state gives the same errors as refitting each fold."""
+    initial, horizon = 40, 3
+    result = backtest(sales_panel, {'ses': METHODS['ses'], 'holt': METHODS['holt']},
+                      initial, horizon, step=5)
+    
+    ses_errors, holt_errors = [], []
+    for origin in rolling_origins(80, initial, horizon, step=5):
+        history = sales_panel[:, :origin]
+        actual = sales_panel[:, origin:origin + horizon]
+        ses_level = simple_exponential_smoothing(history, 0.3)[:, -1:]
+        ses_errors.append(np.abs(actual - ses_level))
+        _, level, trend = holts_method(history, 0.5, 0.3)
+        holt_errors.append(np.abs(actual - holts_forecast(level, trend, horizon)))
+    
+    for name, errors in (('ses', ses_errors), ('holt', holt_errors)):
+        per_horizon = np.concatenate(errors).mean(axis=0)
+        np.testing.assert_allclose(result.loc[name]['mae'].values, per_horizon)
+
+def test_moving_average_forecasts(sales_panel):
+    """Test moving-average methods forecast the last window average."""
+    result = backtest(sales_panel, {'sma_3': METHODS['sma_3']}, 70, 2, step=10)
+    origin = 70
+    flat = sales_panel[:, origin-3:origin].mean(axis=1, keepdims=True)
+    errors = np.abs(sales_panel[:, origin:origin + 2] - flat).mean(axis=0)
+    np.testing.assert_allclose(result.loc['sma_3']['mae'].values, errors)
+
+def test_worker_pool_matches_serial(sales_panel):
+    """Test parallel method x chunk tasks give the serial result."""
+    serial = backtest(sales_panel, METHODS, 30, 4, step=3)
+    parallel = backtest(sales_panel, METHODS, 30, 4, step=3, n_jobs=2, chunk_size=3)
+    
+    assert list(serial.index.get_level_values('horizon').unique()) == [1, 2, 3, 4]
+    np.testing.assert_allclose(parallel.values, serial.values)
+
+def test_invalid_methods(sales_panel):
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        backtest(sales_panel, {'arima': ('arima', {})}, 30, 4)
+    with pytest.raises(ValueError):
+        backtest(sales_panel, METHODS, 78, 4)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,83 @@
+"""
+Test module for ABC / ABC-XYZ classification.
+Checks classes against the notebook's sort-cumsum-apply approach and the
+vectorized policy table lookup.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.inventory import (
+    INVENTORY_POLICIES,
+    abc_classify,
+    xyz_classify,
+    abc_xyz_classify,
+    apply_policies
+)
+
+def notebook_abc(volume):
+    """The ABC analysis notebook: full sort, cumulative share, row-wise apply."""
+    df = pd.DataFrame({'Annual_Volume': volume})
+    df = df.sort_values('Annual_Volume', ascending=False, kind='stable')
+    df['Cumulative_Percentage'] = (df['Annual_Volume'] / df['Annual_Volume'].sum() * 100).cumsum()
+    category = df['Cumulative_Percentage'].apply(
+        lambda pct: 'A' if pct <= 80 else ('B' if pct <= 95 else 'C'))
+    return category.sort_index().values
+
+@pytest.mark.parametrize('n_items', [50, 5000, 200000])
+def test_matches_notebook(n_items):
+    """Test the partial-sort classes equal the full-sort classes."""
+    rng = np.random.default_rng(n_items)
+    volume = rng.integers(100, 10000, n_items) * rng.uniform(10, 1000, n_items)
+    np.testing.assert_array_equal(abc_classify(volume), notebook_abc(volume))
+
+def test_ties_and_zero_volume():
+    """Test class sizes with tied volumes and dead stock."""
+    volume = np.r_[np.full(4000, 50.0), np.full(6000, 1.0), np.zeros(3000)]
+    classes = abc_classify(volume)
+    expected = notebook_abc(volume)
+    for category in 'ABC':
+        assert np.sum(classes == category) == np.sum(expected == category)
+    assert np.all(classes[volume == 0] == 'C')
+    assert np.all(abc_classify(np.zeros(5)) == 'C')
+
+def test_custom_thresholds():
+    """Test more classes and custom labels."""
+    classes = abc_classify([60, 25, 10, 5], thresholds=[0.6, 0.85, 0.95],
+                           labels=['A', 'B', 'C', 'D'])
+    np.testing.assert_array_equal(classes, ['A', 'B', 'C', 'D'])
+    
+    with pytest.raises(ValueError):
+        abc_classify([1, 2, 3], thresholds=[0.95, 0.8])
+
+def test_xyz_and_combined_classes():
+    """Test demand variability classes and their combination with ABC."""
+    demand = np.array([
+        [100, 102, 98, 101, 99, 100],
+        [100, 20, 180, 30, 170, 100],
+        [0, 0, 300, 0, 0, 10],
+        [0, 0, 0, 0, 0, 0],
+    ])
+    np.testing.assert_array_equal(xyz_classify(demand), ['X', 'Y', 'Z', 'Z'])
+    
+    combined = abc_xyz_classify([800, 150, 40, 10], demand)
+    np.testing.assert_array_equal(combined, ['AX', 'BY', 'CZ', 'CZ'])
+
+def test_apply_policies_matches_loc_masks():
+    """Test one vectorized lookup fills the notebook's policy columns."""
+    classes = np.array(['C', 'A', 'B', 'A', 'C'])
+    columns = apply_policies(classes)
+    
+    np.testing.assert_array_equal(columns['review_period_days'], [30, 7, 14, 7, 30])
+    np.testing.assert_allclose(columns['service_level'], [0.90, 0.99, 0.95, 0.99, 0.90])
+    assert columns['review_frequency'][1] == INVENTORY_POLICIES['A']['review_frequency']
+    
+    df = pd.DataFrame({'Category': classes}).assign(**columns)
+    assert list(df.columns) == ['Category'] + list(INVENTORY_POLICIES['A'])
+    
+    with pytest.raises(ValueError):
+        apply_policies(['A', 'D'])
+
+if __name__ == '__main__':
+    pytest.main([__file__])
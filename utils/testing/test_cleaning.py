@@ -0,0 +1,96 @@
+"""
+Test module for the demand cleaning stage.
+Checks the rolling median/MAD filter against a brute-force reference and
+the bincount resampler against reshaped sums.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.forecasting import rolling_median_filter, resample_panel
+from utils.forecasting.cleaning import MAD_SCALE
+
+def reference_filter(series, window, n_mads, min_periods):
+    """Recompute each trailing window from scratch."""
+    cleaned = series.copy()
+    outliers = np.zeros(len(series), dtype=bool)
+    for t in range(len(series)):
+        values = series[max(0, t - window + 1):t + 1]
+        values = values[np.isfinite(values)]
+        if not np.isfinite(series[t]) or len(values) < min_periods:
+            continue
+        median = np.median(values)
+        mad = np.median(np.abs(values - median))
+        if abs(series[t] - median) > n_mads * MAD_SCALE * mad:
+            outliers[t] = True
+            cleaned[t] = median
+    return cleaned, outliers
+
+@pytest.fixture
+def spiky_panel():
+    """Daily demand with injected spikes and a few missing days."""
+    rng = np.random.default_rng(3)
+    panel = rng.poisson(50, (5, 200)).astype(float)
+    panel[0, [20, 90, 150]] = [400, 5, 300]
+    panel[2, 60] = 1000
+    panel[3, [10, 11, 40]] = np.nan
+    panel[4, ::7] = 80
+    return panel
+
+@pytest.mark.parametrize('window', [1, 6, 7, 30])
+def test_filter_matches_reference(spiky_panel, window):
+    """Test the sliding order statistics give the recomputed answers."""
+    min_periods = window // 2 + 1
+    cleaned, outliers = rolling_median_filter(spiky_panel, window)
+    for row, series in enumerate(spiky_panel):
+        expected, expected_outliers = reference_filter(series, window, 3.0, min_periods)
+        np.testing.assert_array_equal(outliers[row], expected_outliers)
+        np.testing.assert_allclose(cleaned[row], expected, equal_nan=True)
+
+def test_filter_removes_spikes(spiky_panel):
+    """Test injected spikes are flagged and missing values are kept."""
+    cleaned, outliers = rolling_median_filter(spiky_panel, 14, chunk_size=2)
+    assert outliers[0, [20, 90, 150]].all()
+    assert outliers[2, 60]
+    assert cleaned[2, 60] < 100
+    assert np.isnan(cleaned[3, [10, 11, 40]]).all()
+    
+    single, single_outliers = rolling_median_filter(spiky_panel[2], 14)
+    np.testing.assert_array_equal(single, cleaned[2])
+    np.testing.assert_array_equal(single_outliers, outliers[2])
+
+def test_min_mad_protects_intermittent_demand():
+    """Test sparse sales in a window of zeros are only flagged without a floor."""
+    demand = np.zeros(60)
+    demand[::9] = 2
+    assert rolling_median_filter(demand, 10)[1].any()
+    assert not rolling_median_filter(demand, 10, min_mad=1.0)[1].any()
+
+def test_resample_by_factor():
+    """Test consecutive buckets, including a partial last bucket."""
+    hourly = np.arange(2 * 50, dtype=float).reshape(2, 50)
+    daily, starts = resample_panel(hourly, 24)
+    
+    np.testing.assert_array_equal(starts, [0, 24, 48])
+    np.testing.assert_allclose(daily[:, :2], hourly[:, :48].reshape(2, 2, 24).sum(axis=2))
+    np.testing.assert_allclose(daily[:, 2], hourly[:, 48:].sum(axis=1))
+
+def test_resample_by_labels_matches_pandas():
+    """Test date labels and NaN handling against a pandas resample."""
+    index = pd.date_range('2024-01-01', periods=24 * 10, freq='h')
+    rng = np.random.default_rng(0)
+    hourly = rng.gamma(2.0, 5.0, (3, len(index)))
+    hourly[1, 30:60] = np.nan
+    
+    for how in ('sum', 'mean'):
+        result, days = resample_panel(hourly, index.floor('D'), how=how, chunk_size=2)
+        expected = getattr(pd.DataFrame(hourly.T, index=index).resample('D'), how)()
+        np.testing.assert_array_equal(days, expected.index.values)
+        np.testing.assert_allclose(result, expected.values.T)
+    
+    with pytest.raises(ValueError):
+        resample_panel(hourly, index[:10].floor('D'))
+
+if __name__ == '__main__':
+    pytest.main([__file__])
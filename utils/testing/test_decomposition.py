@@ -0,0 +1,70 @@
+"""
+Test module for multi-seasonal decomposition.
+Checks recovered daily/weekly patterns and chunked memory-mapped processing.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import multi_seasonal_decompose
+
+@pytest.fixture
+def hourly_panel():
+    """Hourly sales with daily and weekly cycles, as in Part 3 of the notebook."""
+    rng = np.random.default_rng(42)
+    t = np.arange(24 * 7 * 12)
+    daily = 100 * np.sin(2 * np.pi * t / 24)
+    weekly = 50 * np.sin(2 * np.pi * t / (24 * 7))
+    sales = 1000 + daily + weekly + rng.normal(0, 10, (6, len(t)))
+    return sales, daily, weekly
+
+def test_recovers_daily_and_weekly_patterns(hourly_panel):
+    """Test both seasonal patterns are extracted in one call."""
+    sales, daily, weekly = hourly_panel
+    result = multi_seasonal_decompose(sales, [24 * 7, 24])
+    
+    assert result['periods'] == [24, 168]
+    assert result['seasonal'].shape == (2,) + sales.shape
+    for series_daily, series_weekly in zip(*result['seasonal']):
+        assert np.corrcoef(series_daily, daily)[0, 1] > 0.99
+        assert np.corrcoef(series_weekly, weekly)[0, 1] > 0.95
+
+def test_components_reconstruct_data(hourly_panel):
+    """Test the additive components sum back to the data."""
+    sales = hourly_panel[0][0]
+    result = multi_seasonal_decompose(sales, [24, 168])
+    
+    seasonal = result['seasonal'].sum(axis=0)
+    np.testing.assert_allclose(result['trend'] + seasonal + result['resid'], sales)
+    np.testing.assert_allclose(result['seasonal'][0][:24], result['seasonal'][0][24:48])
+    
+    # Plain lists are accepted like arrays
+    listed = multi_seasonal_decompose(sales.tolist(), [24, 168])
+    np.testing.assert_allclose(listed['trend'], result['trend'])
+
+def test_memmap_input_and_output_match_in_memory(hourly_panel, tmp_path):
+    """Test chunked processing of memory-mapped input into .npy outputs."""
+    sales = hourly_panel[0]
+    source = np.lib.format.open_memmap(tmp_path / 'sales.npy', 'w+', np.float32, sales.shape)
+    source[:] = sales
+    source.flush()
+    
+    in_memory = multi_seasonal_decompose(np.asarray(source), [24, 168])
+    mapped = multi_seasonal_decompose(np.load(tmp_path / 'sales.npy', mmap_mode='r'),
+                                      [24, 168], chunk_size=4, out_dir=tmp_path / 'out')
+    
+    for key in ('trend', 'seasonal', 'resid'):
+        assert isinstance(mapped[key], np.memmap)
+        np.testing.assert_allclose(mapped[key], in_memory[key])
+    np.testing.assert_allclose(np.load(tmp_path / 'out' / 'resid.npy'), in_memory['resid'])
+
+def test_invalid_arguments(hourly_panel):
+    """Test argument validation."""
+    sales = hourly_panel[0]
+    with pytest.raises(ValueError):
+        multi_seasonal_decompose(sales[:, :200], [24, 168])
+    with pytest.raises(ValueError):
+        multi_seasonal_decompose(sales, [1])
+
+if __name__ == '__main__':
+    pytest.main([__file__])
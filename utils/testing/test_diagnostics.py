@@ -0,0 +1,70 @@
+"""
+Test module for batched residual diagnostics.
+Compares the vectorized tests with their one-series SciPy/NumPy equivalents.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.forecasting import autocorrelation, ljung_box, residual_diagnostics
+from utils.testing.forecasting_tests import check_arima_residuals
+
+@pytest.fixture
+def residual_panel():
+    """Four white-noise series and one MA(2) (autocorrelated) series."""
+    rng = np.random.default_rng(42)
+    panel = rng.normal(0, 1, (5, 400))
+    panel[4] = np.convolve(rng.normal(0, 1, 402), [1.0, 0.8, 0.5], mode='valid')
+    return panel
+
+def test_autocorrelation_matches_correlate(residual_panel):
+    """Test FFT autocorrelation against np.correlate for every series."""
+    acf = autocorrelation(residual_panel, demean=False)
+    for row, acf_row in zip(residual_panel, acf):
+        full = np.correlate(row, row, mode='full')[len(row)-1:]
+        np.testing.assert_allclose(acf_row, full / full[0], atol=1e-12)
+    
+    assert autocorrelation(residual_panel[0], max_lag=5).shape == (6,)
+
+def test_ljung_box_statistic(residual_panel):
+    """Test the Ljung-Box statistic against its textbook formula."""
+    q_stat, p_value = ljung_box(residual_panel, lags=5)
+    
+    n = residual_panel.shape[1]
+    row = residual_panel[4] - residual_panel[4].mean()
+    rho = [np.sum(row[k:] * row[:-k]) / np.sum(row**2) for k in range(1, 6)]
+    expected = n * (n + 2) * sum(r**2 / (n - k) for k, r in enumerate(rho, start=1))
+    
+    assert np.isclose(q_stat[4], expected)
+    assert p_value[4] < 0.001
+    assert np.all(p_value[:4] > 0.01)
+
+def test_batched_tests_match_scipy(residual_panel):
+    """Test the batched zero-mean, Levene and normality p-values."""
+    results = residual_diagnostics(residual_panel)
+    half = residual_panel.shape[1] // 2
+    
+    for i, row in enumerate(residual_panel):
+        assert np.isclose(results['mean_p'][i], stats.ttest_1samp(row, 0).pvalue)
+        assert np.isclose(results['levene_p'][i], stats.levene(row[:half], row[half:]).pvalue)
+        assert np.isclose(results['normality_p'][i], stats.normaltest(row).pvalue)
+    
+    assert not results['white_noise'][4]
+    assert results['white_noise'][:4].sum() >= 3
+
+def test_checker_uses_same_acf_bound():
+    """Test check_arima_residuals still rejects strongly autocorrelated residuals."""
+    rng = np.random.default_rng(0)
+    trending = np.cumsum(rng.normal(0, 1, 500))
+    assert not check_arima_residuals(trending - trending.mean())
+
+def test_invalid_lags(residual_panel):
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        ljung_box(residual_panel, lags=0)
+    with pytest.raises(ValueError):
+        residual_diagnostics(residual_panel[:, :10])
+
+if __name__ == '__main__':
+    pytest.main([__file__])
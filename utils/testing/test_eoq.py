@@ -0,0 +1,101 @@
+"""
+Test module for the vectorized EOQ engine.
+Checks catalog-wide EOQ metrics against the notebook formulas and the
+quantity-discount optimizer against a brute-force search.
+"""
+
+import numpy as np
+import pytest
+
+from utils.inventory import (
+    economic_order_quantity,
+    eoq_analysis,
+    purchase_cost,
+    quantity_discount_eoq
+)
+from utils.testing.inventory_tests import check_eoq, check_total_cost
+
+def brute_force_discount(demand, order_cost, holding_rate, breakpoints, prices, kind):
+    """Minimize the annual cost on a fine grid of order quantities."""
+    quantity = np.linspace(1, 5000, 200001)
+    cost = purchase_cost(quantity, breakpoints, prices, kind)
+    total = demand * (cost + order_cost) / quantity + holding_rate * cost / 2
+    return quantity[total.argmin()], total.min()
+
+def test_catalog_matches_notebook():
+    """Test the multiple-products table of the EOQ notebook."""
+    rng = np.random.default_rng(42)
+    demand = rng.integers(500, 5000, 1000)
+    order_cost = rng.uniform(50, 200, 1000)
+    holding_cost = rng.uniform(10, 50, 1000)
+    
+    result = eoq_analysis(demand, order_cost, holding_cost)
+    eoq = np.sqrt(2 * demand * order_cost / holding_cost)
+    np.testing.assert_allclose(result['order_quantity'], eoq)
+    np.testing.assert_allclose(result['orders_per_year'], demand / eoq)
+    np.testing.assert_allclose(result['cycle_time'], 365 * eoq / demand)
+    np.testing.assert_allclose(result['total_cost'], np.sqrt(2 * demand * order_cost * holding_cost))
+    
+    assert check_eoq({'eoq': result['order_quantity']}, demand, order_cost, holding_cost)
+    assert check_total_cost({'total_cost': result['total_cost']}, demand, order_cost, holding_cost)
+    assert not check_eoq({'eoq': result['order_quantity'] + 2}, demand, order_cost, holding_cost)
+
+@pytest.mark.parametrize('D,S,H', [(1200, 100, 0), (1200, -100, 20), (0, 100, 20)])
+def test_checkers_reject_degenerate_parameters(D, S, H):
+    """Test the checkers return False instead of raising on invalid costs."""
+    assert not check_eoq({'eoq': 100.0}, D, S, H)
+    assert not check_total_cost({'total_cost': 2000.0}, D, S, H)
+
+def test_sensitivity_grid_broadcasts():
+    """Test a demand x holding-cost grid needs no loop."""
+    demand = np.linspace(500, 2000, 50)
+    holding = np.linspace(10, 40, 20)
+    grid = economic_order_quantity(demand[:, None], 100, holding[None, :])
+    assert grid.shape == (50, 20)
+    assert grid[10, 5] == pytest.approx(np.sqrt(2 * demand[10] * 100 / holding[5]))
+    
+    costs = eoq_analysis(1000, 100, 20, order_quantity=[0.8 * 100, 100, 1.2 * 100])
+    assert costs['total_cost'][1] == pytest.approx(2000)
+    assert np.all(costs['total_cost'][[0, 2]] > 2000)
+
+def test_purchase_cost_tiers():
+    """Test all-units and incremental purchase costs at and between breakpoints."""
+    breakpoints, prices = [0, 100, 500], [10, 9, 8]
+    quantity = np.array([50, 100, 300, 600])
+    np.testing.assert_allclose(purchase_cost(quantity, breakpoints, prices),
+                               [500, 900, 2700, 4800])
+    np.testing.assert_allclose(purchase_cost(quantity, breakpoints, prices, 'incremental'),
+                               [500, 1000, 2800, 1000 + 3600 + 800])
+
+@pytest.mark.parametrize('kind', ['all_units', 'incremental'])
+def test_discount_matches_brute_force(kind):
+    """Test the tier candidates find the grid optimum."""
+    cases = [(1000, 100, 0.2, [0, 100, 500], [10, 9.5, 9.0]),
+             (200, 50, 0.25, [0, 300, 1000], [5, 4.9, 4.8]),
+             (5000, 20, 0.3, [0, 50, 200, 1000], [3, 2.8, 2.7, 2.2])]
+    for demand, order_cost, rate, breakpoints, prices in cases:
+        result = quantity_discount_eoq(demand, order_cost, rate, breakpoints, prices, kind)
+        quantity, total = brute_force_discount(demand, order_cost, rate, breakpoints, prices, kind)
+        assert result['order_quantity'] == pytest.approx(quantity, rel=1e-3)
+        assert result['total_cost'] == pytest.approx(total, rel=1e-6)
+
+def test_per_item_discount_tables():
+    """Test padded per-item tables give the same answers as one item at a time."""
+    breakpoints = np.array([[0, 100, 500], [0, 300, np.nan], [0, np.nan, np.nan]])
+    prices = np.array([[10, 9.5, 9.0], [5, 4.9, np.nan], [7, np.nan, np.nan]])
+    demand = np.array([1000, 200, 800])
+    
+    result = quantity_discount_eoq(demand, 50, 0.2, breakpoints, prices)
+    for item in range(3):
+        used = np.isfinite(breakpoints[item])
+        expected = quantity_discount_eoq(demand[item], 50, 0.2, breakpoints[item, used],
+                                         prices[item, used])
+        for key in ('order_quantity', 'unit_price', 'total_cost'):
+            assert result[key][item] == pytest.approx(expected[key])
+    assert result['order_quantity'][2] == pytest.approx(np.sqrt(2 * 800 * 50 / (0.2 * 7)))
+    
+    with pytest.raises(ValueError):
+        quantity_discount_eoq(demand, 50, 0.2, [0, 500, 100], [10, 9, 8])
+
+if __name__ == '__main__':
+    pytest.main([__file__])
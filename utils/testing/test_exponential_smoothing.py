@@ -0,0 +1,86 @@
+"""
+Test module for the panel exponential smoothing engine.
+Checks SES and Holt's method against the notebook recurrences.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import simple_exponential_smoothing, holts_method, holts_forecast
+from utils.forecasting.benchmarks import (
+    loop_simple_exponential_smoothing,
+    loop_holts_method,
+    benchmark_exponential_smoothing
+)
+from utils.testing.forecasting_tests import check_exponential_smoothing
+
+@pytest.fixture
+def yogurt_panel():
+    """Yogurt sales from the notebook plus a trending series."""
+    yogurt_sales = np.array([120, 132, 125, 138, 128, 135, 140, 133, 129, 142,
+                             136, 131, 144, 138, 135, 142, 140, 138, 145, 140])
+    trend_data = np.array([100, 108, 115, 125, 133, 142, 150, 160, 168, 177,
+                           185, 195, 203, 212, 220, 230, 238, 247, 255, 265])
+    return np.vstack([yogurt_sales, trend_data])
+
+def test_ses_matches_recurrence(yogurt_panel):
+    """Test shared-alpha SES (linear filter) against the scalar loop and checker."""
+    smoothed = simple_exponential_smoothing(yogurt_panel, 0.2)
+    
+    for row, smoothed_row in zip(yogurt_panel, smoothed):
+        np.testing.assert_allclose(smoothed_row, loop_simple_exponential_smoothing(row, 0.2))
+        assert check_exponential_smoothing(smoothed_row, row, 0.2)
+
+def test_ses_per_series_alpha(yogurt_panel):
+    """Test per-series alpha values use the right parameter for each row."""
+    alphas = np.array([0.2, 0.5])
+    smoothed = simple_exponential_smoothing(yogurt_panel, alphas)
+    
+    for row, smoothed_row, alpha in zip(yogurt_panel, smoothed, alphas):
+        np.testing.assert_allclose(smoothed_row, loop_simple_exponential_smoothing(row, alpha))
+
+def test_ses_does_not_truncate_integers():
+    """Test integer sales give fractional smoothed values."""
+    smoothed = simple_exponential_smoothing(np.array([10, 11]), 0.5)
+    np.testing.assert_allclose(smoothed, [10.0, 10.5])
+
+def test_ses_float32(yogurt_panel):
+    """Test explicit float32 computation."""
+    smoothed = simple_exponential_smoothing(yogurt_panel, 0.3, dtype=np.float32)
+    assert smoothed.dtype == np.float32
+    np.testing.assert_allclose(smoothed[0], loop_simple_exponential_smoothing(yogurt_panel[0], 0.3),
+                               rtol=1e-5)
+
+def test_holts_method_matches_recurrence(yogurt_panel):
+    """Test Holt's method against the scalar loop for every series."""
+    result, level, trend = holts_method(yogurt_panel, 0.5, [0.3, 0.1])
+    
+    for i, beta in enumerate([0.3, 0.1]):
+        expected = loop_holts_method(yogurt_panel[i], 0.5, beta)
+        np.testing.assert_allclose(result[i], expected[0])
+        np.testing.assert_allclose(level[i], expected[1])
+        np.testing.assert_allclose(trend[i], expected[2])
+
+def test_holts_forecast():
+    """Test forecasts extend the last level along the last trend."""
+    _, level, trend = holts_method(np.arange(10, 30, 2), 0.5, 0.3)
+    forecasts = holts_forecast(level, trend, 3)
+    np.testing.assert_allclose(forecasts, [30, 32, 34])
+
+def test_invalid_parameters():
+    """Test parameter validation."""
+    with pytest.raises(ValueError):
+        simple_exponential_smoothing(np.arange(5), 1.5)
+    with pytest.raises(ValueError):
+        simple_exponential_smoothing(np.ones((2, 5)), [0.1, 0.2, 0.3])
+    with pytest.raises(ValueError):
+        holts_method(np.arange(1), 0.5, 0.5)
+
+def test_benchmark_reports_speedup():
+    """Test the benchmark runs on a small panel."""
+    results = benchmark_exponential_smoothing(n_series=5, n_periods=40, repeat=1)
+    assert results['ses_speedup'] > 0
+    assert results['holt_speedup'] > 0
+
+if __name__ == '__main__':
+    pytest.main([__file__])
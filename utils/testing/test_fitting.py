@@ -0,0 +1,83 @@
+"""
+Test module for smoothing-parameter fitting.
+Checks grid + refinement results, warm starts and parameter caching.
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize_scalar
+
+from utils.forecasting import (
+    fit_smoothing_parameters,
+    save_parameters,
+    load_parameters,
+    simple_exponential_smoothing
+)
+
+@pytest.fixture
+def demand_panel():
+    """Random-walk-plus-noise demand for 40 series."""
+    rng = np.random.default_rng(42)
+    level = np.cumsum(rng.normal(0, 1, (40, 120)), axis=1) + 100
+    return level + rng.normal(0, 2, level.shape)
+
+def _ses_one_step_mse(series, alpha):
+    """One-step-ahead MSE of SES computed with the panel smoother."""
+    smoothed = simple_exponential_smoothing(series, alpha)
+    return np.mean((series[1:] - smoothed[:-1])**2)
+
+def test_ses_fit_matches_scalar_optimizer(demand_panel):
+    """Test fitted alphas agree with a bounded scalar optimizer."""
+    params = fit_smoothing_parameters(demand_panel, 'ses')
+    assert params['beta'] is None
+    
+    for i in range(3):
+        series = demand_panel[i]
+        best = minimize_scalar(lambda a: _ses_one_step_mse(series, a),
+                               bounds=(0, 1), method='bounded')
+        assert np.isclose(params['alpha'][i], best.x, atol=1e-3)
+        assert np.isclose(params['mse'][i], _ses_one_step_mse(series, params['alpha'][i]))
+
+def test_holt_fit_improves_on_defaults(demand_panel):
+    """Test fitted Holt parameters beat the notebook's hard-coded values."""
+    fitted = fit_smoothing_parameters(demand_panel, 'holt')
+    defaults = fit_smoothing_parameters(demand_panel, 'holt',
+                                        initial={'alpha': 0.5, 'beta': 0.3},
+                                        n_iter=0, n_sweeps=0)
+    
+    assert np.all((fitted['alpha'] >= 0) & (fitted['alpha'] <= 1))
+    assert np.all((fitted['beta'] >= 0) & (fitted['beta'] <= 1))
+    assert np.all(fitted['mse'] <= defaults['mse'] + 1e-9)
+
+def test_process_pool_matches_serial(demand_panel):
+    """Test worker chunks give the same result as a serial fit."""
+    serial = fit_smoothing_parameters(demand_panel, 'ses')
+    parallel = fit_smoothing_parameters(demand_panel, 'ses', n_jobs=2, chunk_size=15)
+    np.testing.assert_allclose(parallel['alpha'], serial['alpha'])
+
+def test_cached_parameters_warm_start(demand_panel, tmp_path):
+    """Test saved parameters reload, realign by id and warm-start a fit."""
+    ids = np.array([f"SKU{i:03d}" for i in range(len(demand_panel))])
+    params = fit_smoothing_parameters(demand_panel, 'holt')
+    path = tmp_path / 'params.npz'
+    save_parameters(path, params, series_ids=ids)
+    
+    # Reordered catalog with one new SKU
+    next_ids = np.concatenate([ids[::-1], ['SKU999']])
+    cached = load_parameters(path, series_ids=next_ids)
+    np.testing.assert_allclose(cached['alpha'][:-1], params['alpha'][::-1])
+    assert np.isnan(cached['alpha'][-1])
+    
+    next_panel = np.vstack([demand_panel[::-1], demand_panel[:1]])
+    warm = fit_smoothing_parameters(next_panel, 'holt', initial=cached)
+    np.testing.assert_allclose(warm['mse'][:-1], params['mse'][::-1], rtol=0.01)
+
+def test_invalid_arguments():
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        fit_smoothing_parameters(np.arange(10), 'arima')
+    with pytest.raises(ValueError):
+        fit_smoothing_parameters(np.arange(2), 'holt')
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,112 @@
+"""
+Test module for the content-addressed forecast cache.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import (
+    ForecastCache,
+    cached,
+    simple_moving_average,
+    holts_method
+)
+
+@pytest.fixture
+def sales_panel():
+    """Random daily sales for 20 series."""
+    rng = np.random.default_rng(42)
+    return rng.poisson(50, (20, 365)).astype(float)
+
+def test_hits_on_equal_content(sales_panel):
+    """Test a copy of the same history with the same parameters hits the cache."""
+    sma = cached(simple_moving_average)
+    first = sma(sales_panel, 7)
+    second = sma(sales_panel.copy(), 7)
+    
+    assert second is first
+    assert sma.cache.stats['hits'] == 1
+    assert sma.cache.stats['misses'] == 1
+    np.testing.assert_allclose(first, simple_moving_average(sales_panel, 7))
+
+def test_hits_on_equivalent_calls(sales_panel):
+    """Test positional, keyword and defaulted spellings of a call share a key."""
+    sma = cached(simple_moving_average)
+    first = sma(sales_panel, 7)
+    assert sma(sales_panel, window=7) is first
+    assert sma(data=sales_panel, window=7, dtype=np.float64) is first
+    assert sma(sales_panel, 7, np.float64) is first
+    
+    assert sma.cache.stats['hits'] == 3
+    assert sma.cache.stats['misses'] == 1
+
+def test_misses_on_changed_input(sales_panel):
+    """Test changed data, parameters or dtype produce new keys."""
+    sma = cached(simple_moving_average)
+    sma(sales_panel, 7)
+    sma(sales_panel, 14)
+    sma(sales_panel, 7, dtype=np.float32)
+    sma(sales_panel.astype(np.float32), 7)
+    changed = sales_panel.copy()
+    changed[3, 100] += 1
+    sma(changed, 7)
+    
+    assert sma.cache.stats['misses'] == 5
+    assert sma.cache.stats['hits'] == 0
+
+def test_cached_results_are_read_only(sales_panel):
+    """Test callers cannot corrupt cached tuples of arrays."""
+    holt = cached(holts_method)
+    _, level, _ = holt(sales_panel, 0.5, 0.3)
+    with pytest.raises(ValueError):
+        level[0, 0] = 0.0
+
+def test_lru_byte_budget(sales_panel):
+    """Test the memory tier evicts least recently used entries."""
+    entry_bytes = sales_panel.nbytes
+    cache = ForecastCache(max_bytes=2 * entry_bytes)
+    sma = cache.wrap(simple_moving_average)
+    
+    sma(sales_panel, 3)
+    sma(sales_panel, 4)
+    sma(sales_panel, 3)  # refresh window 3
+    sma(sales_panel, 5)  # evicts window 4
+    
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['bytes'] <= 2 * entry_bytes
+    sma(sales_panel, 3)
+    sma(sales_panel, 4)
+    assert cache.stats['hits'] == 2
+    assert cache.stats['misses'] == 4
+
+def test_disk_tier_survives_restart(sales_panel, tmp_path):
+    """Test a new cache instance reads results written by a previous one."""
+    sma = cached(simple_moving_average, ForecastCache(directory=tmp_path))
+    expected = sma(sales_panel, 7)
+    
+    restarted = cached(simple_moving_average, ForecastCache(directory=tmp_path))
+    np.testing.assert_allclose(restarted(sales_panel, 7), expected)
+    assert restarted.cache.stats['disk_hits'] == 1
+    assert restarted.cache.stats['misses'] == 0
+    
+    restarted.cache.clear(disk=True)
+    restarted(sales_panel, 7)
+    assert restarted.cache.stats['misses'] == 1
+
+def test_object_arrays_hash_by_content():
+    """Test object arrays, e.g. SKU labels, key on their elements."""
+    skus = np.array(['SKU1', 'SKU2', None], dtype=object)
+    key = ForecastCache.make_key('f', (skus,))
+    assert key == ForecastCache.make_key('f', (skus.copy(),))
+    assert key != ForecastCache.make_key('f', (np.array(['SKU1', 'SKU3', None], dtype=object),))
+    assert key != ForecastCache.make_key('f', (skus.reshape(1, 3),))
+    with pytest.raises(TypeError):
+        ForecastCache.make_key('f', (np.array([object()], dtype=object),))
+
+def test_unhashable_arguments_rejected(sales_panel):
+    """Test arguments without stable content are refused."""
+    with pytest.raises(TypeError):
+        ForecastCache.make_key('f', (object(),))
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,101 @@
+"""
+Test module for the Holt-Winters engine and the seasonal smoothing checker.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import holt_winters, holt_winters_forecast
+from utils.testing.forecasting_tests import check_exponential_smoothing
+
+def _scalar_holt_winters(data, alpha, beta, gamma, m, multiplicative=False):
+    """Straightforward single-series reference implementation."""
+    n = len(data)
+    level = np.zeros(n)
+    trend = np.zeros(n)
+    season = np.zeros(n)
+    level[:m] = np.mean(data[:m])
+    trend[:m] = (np.mean(data[m:2*m]) - level[0]) / m
+    season[:m] = data[:m] / level[0] if multiplicative else data[:m] - level[0]
+    
+    for t in range(m, n):
+        if multiplicative:
+            level[t] = alpha * data[t] / season[t-m] + (1 - alpha) * (level[t-1] + trend[t-1])
+            season[t] = gamma * data[t] / level[t] + (1 - gamma) * season[t-m]
+        else:
+            level[t] = alpha * (data[t] - season[t-m]) + (1 - alpha) * (level[t-1] + trend[t-1])
+            season[t] = gamma * (data[t] - level[t]) + (1 - gamma) * season[t-m]
+        trend[t] = beta * (level[t] - level[t-1]) + (1 - beta) * trend[t-1]
+    
+    if multiplicative:
+        return (level + trend) * season
+    return level + trend + season
+
+@pytest.fixture
+def seasonal_panel():
+    """Three trending monthly series with different seasonal amplitudes."""
+    rng = np.random.default_rng(42)
+    t = np.arange(60)
+    amplitude = np.array([[5.0], [10.0], [20.0]])
+    return 200 + 0.8 * t + amplitude * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1, (3, 60))
+
+@pytest.mark.parametrize('seasonal', ['additive', 'multiplicative'])
+def test_matches_scalar_reference(seasonal_panel, seasonal):
+    """Test the panel engine against the scalar recurrence."""
+    result, level, trend, season = holt_winters(seasonal_panel, 0.3, 0.1, 0.2, 12,
+                                                seasonal=seasonal)
+    assert result.shape == level.shape == trend.shape == season.shape == seasonal_panel.shape
+    
+    for row, result_row in zip(seasonal_panel, result):
+        expected = _scalar_holt_winters(row, 0.3, 0.1, 0.2, 12, seasonal == 'multiplicative')
+        np.testing.assert_allclose(result_row, expected)
+
+def test_per_series_periods_and_parameters(seasonal_panel):
+    """Test series with different periods and parameters are handled together."""
+    periods = np.array([12, 6, 12])
+    alphas = np.array([0.2, 0.4, 0.6])
+    result = holt_winters(seasonal_panel, alphas, 0.1, 0.3, periods)[0]
+    
+    for i in range(3):
+        expected = _scalar_holt_winters(seasonal_panel[i], alphas[i], 0.1, 0.3, periods[i])
+        np.testing.assert_allclose(result[i], expected)
+
+def test_forecast_repeats_last_season():
+    """Test a pure seasonal pattern is forecast exactly."""
+    pattern = np.array([10.0, 20.0, 30.0, 20.0])
+    data = np.tile(pattern, 6)
+    _, level, trend, season = holt_winters(data, 0.5, 0.5, 0.5, 4)
+    
+    forecasts = holt_winters_forecast(level, trend, season, 4, 6)
+    np.testing.assert_allclose(forecasts, np.tile(pattern, 2)[:6])
+
+def test_checker_validates_seasonal_recurrence(seasonal_panel):
+    """Test the checker accepts correct seasonal results and rejects others."""
+    for seasonal in ['additive', 'multiplicative']:
+        result = holt_winters(seasonal_panel, 0.3, 0.1, 0.2, 12, seasonal=seasonal)[0]
+        assert check_exponential_smoothing(result, seasonal_panel, 0.3, 0.1, 0.2, 12,
+                                           seasonal=seasonal)
+        assert check_exponential_smoothing(result[0], seasonal_panel[0], 0.3, 0.1, 0.2, 12,
+                                           seasonal=seasonal)
+        
+        wrong = result.copy()
+        wrong[1, 30] *= 1.05
+        assert not check_exponential_smoothing(wrong, seasonal_panel, 0.3, 0.1, 0.2, 12,
+                                               seasonal=seasonal)
+    
+    # Missing period or too little data
+    assert not check_exponential_smoothing(result, seasonal_panel, 0.3, 0.1, 0.2)
+    assert not check_exponential_smoothing(result[:, :10], seasonal_panel[:, :10],
+                                           0.3, 0.1, 0.2, 12)
+
+def test_invalid_arguments(seasonal_panel):
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        holt_winters(seasonal_panel, 0.3, 0.1, 0.2, 12, seasonal='damped')
+    with pytest.raises(ValueError):
+        holt_winters(seasonal_panel - 500, 0.3, 0.1, 0.2, 12, seasonal='multiplicative')
+    with pytest.raises(ValueError):
+        holt_winters(seasonal_panel, 0.3, 0.1, 0.2, 1)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,78 @@
+"""
+Test module for the unit normal loss function and fill-rate safety stock.
+Checks the loss against numerical integration, the documented maximum
+error of the inverse table and fill-rate calculators for whole catalogs.
+"""
+
+import numpy as np
+import pytest
+from scipy import integrate, stats
+
+from utils.inventory import (
+    LOSS_RANGE, MAX_LOSS_Z_ERROR, normal_loss, z_from_normal_loss,
+    fill_rate_safety_stock, fill_rate_reorder_point, expected_shortage, sweep
+)
+
+def test_loss_matches_integral():
+    """Test G(z) equals E[max(Z - z, 0)] computed by quadrature."""
+    z = np.array([-4.0, -1.0, 0.0, 0.5, 1.645, 3.0])
+    expected = [integrate.quad(lambda x: (x - a) * stats.norm.pdf(x), a, np.inf)[0]
+                for a in z]
+    np.testing.assert_allclose(normal_loss(z), expected, rtol=1e-7)
+    assert normal_loss(0.0) == pytest.approx(1 / np.sqrt(2 * np.pi))
+
+def test_inverse_error_within_bound():
+    """Test the table inverts G to MAX_LOSS_Z_ERROR over its range."""
+    z = np.linspace(-999.0, 5.9, 2_000_001)
+    loss = normal_loss(z)
+    inside = (loss >= LOSS_RANGE[0]) & (loss <= LOSS_RANGE[1])
+    error = np.abs(z_from_normal_loss(loss[inside]) - z[inside])
+    assert error.max() <= MAX_LOSS_Z_ERROR
+
+def test_inverse_outside_table():
+    """Test Newton's method handles losses beyond the table."""
+    z = np.array([-40.0, -6.0, 6.5, 20.0])
+    np.testing.assert_allclose(z_from_normal_loss(normal_loss(z)), z, atol=1e-9)
+    assert z_from_normal_loss(0.1).shape == ()
+    with pytest.raises(ValueError):
+        z_from_normal_loss([0.1, 0.0])
+
+def test_fill_rate_safety_stock_meets_target():
+    """Test the safety stock leaves exactly (1 - fill rate) * Q short per cycle."""
+    rng = np.random.default_rng(0)
+    n = 100_000
+    demand_stddev = rng.uniform(1, 20, n)
+    lead_time = rng.integers(1, 15, n)
+    order_quantity = rng.uniform(10, 500, n)
+    fill_rate = rng.uniform(0.8, 0.999, n)
+    safety = fill_rate_safety_stock(demand_stddev, lead_time, fill_rate, order_quantity)
+    
+    shortage = expected_shortage(safety, demand_stddev, lead_time)
+    np.testing.assert_allclose(1 - shortage / order_quantity, fill_rate, atol=1e-9)
+    np.testing.assert_allclose(
+        fill_rate_reorder_point(10.0, lead_time, demand_stddev, fill_rate, order_quantity),
+        10.0 * lead_time + safety)
+
+def test_fill_rate_textbook_case():
+    """Test a case where large orders need no safety stock and none is negative."""
+    # sigma_LT = 10 * sqrt(4) = 20; G(k) = 0.05 * 100 / 20 = 0.25
+    safety = fill_rate_safety_stock(10, 4, 0.95, 100)
+    assert safety / 20 == pytest.approx(0.3449, abs=1e-3)
+    assert fill_rate_safety_stock(10, 4, 0.5, 1000) < 0
+    assert fill_rate_safety_stock(0, 4, 0.95, 100) == 0
+    with pytest.raises(ValueError):
+        fill_rate_safety_stock(10, 4, 1.0, 100)
+    with pytest.raises(ValueError):
+        fill_rate_safety_stock(10, 4, 0.95, 0)
+
+def test_fill_rate_sweep():
+    """Test fill-rate safety stock is sweepable by name."""
+    grid = sweep('fill_rate_safety_stock',
+                 {'fill_rate': [0.9, 0.95, 0.99], 'order_quantity': [50.0, 200.0]},
+                 demand_stddev=10, lead_time=4)
+    assert grid.values.shape == (3, 2)
+    assert np.all(np.diff(grid.values, axis=0) > 0)
+    assert np.all(np.diff(grid.values, axis=1) < 0)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,80 @@
+"""
+Test module for the panel moving-average engine.
+Checks the vectorized results against the notebook loops and checkers.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import simple_moving_average, weighted_moving_average
+from utils.forecasting.benchmarks import (
+    loop_simple_moving_average,
+    loop_weighted_moving_average,
+    benchmark_moving_average
+)
+from utils.testing.forecasting_tests import check_moving_average
+
+@pytest.fixture
+def sales_panel():
+    """Laptop sales from the notebook plus two synthetic series."""
+    np.random.seed(42)
+    laptop_sales = np.array([45, 52, 48, 58, 50, 42, 55, 53, 49, 51, 47, 54, 50, 43, 56])
+    return np.vstack([laptop_sales, np.random.poisson(50, (2, 15))])
+
+def test_simple_moving_average_matches_loop(sales_panel):
+    """Test SMA against the per-index loop and the checker."""
+    ma = simple_moving_average(sales_panel, 3)
+    assert ma.shape == sales_panel.shape
+    
+    for row, ma_row in zip(sales_panel, ma):
+        np.testing.assert_allclose(ma_row, loop_simple_moving_average(row, 3))
+        assert check_moving_average(ma_row, row, 3)
+
+def test_weighted_moving_average_matches_loop(sales_panel):
+    """Test WMA against the per-index loop and the checker."""
+    weights = np.array([0.2, 0.3, 0.5])
+    wma = weighted_moving_average(sales_panel, weights)
+    
+    for row, wma_row in zip(sales_panel, wma):
+        np.testing.assert_allclose(wma_row, loop_weighted_moving_average(row, weights))
+        assert check_moving_average(wma_row, row, 3, weights=weights)
+
+def test_single_series_and_integer_input():
+    """Test 1-D input keeps its shape and integer sales are not truncated."""
+    data = np.array([1, 2, 4, 7])
+    ma = simple_moving_average(data, 2)
+    
+    assert ma.ndim == 1
+    assert np.isnan(ma[0])
+    np.testing.assert_allclose(ma[1:], [1.5, 3.0, 5.5])
+
+def test_missing_values_stay_local():
+    """Test a NaN only affects the windows that contain it."""
+    data = np.array([[1.0, 2.0, np.nan, 4.0, 5.0, 6.0]])
+    ma = simple_moving_average(data, 2)
+    
+    assert np.isnan(ma[0, 2]) and np.isnan(ma[0, 3])
+    np.testing.assert_allclose(ma[0, 4:], [4.5, 5.5])
+
+def test_window_longer_than_series():
+    """Test windows longer than the series give an all-NaN result."""
+    assert np.isnan(simple_moving_average(np.arange(3), 5)).all()
+    assert np.isnan(weighted_moving_average(np.arange(3), [0.5, 0.3, 0.2, 0.0])).all()
+    
+    with pytest.raises(ValueError):
+        simple_moving_average(np.arange(3), 0)
+
+def test_float32_output():
+    """Test explicit dtype control."""
+    ma = simple_moving_average(np.arange(10), 3, dtype=np.float32)
+    assert ma.dtype == np.float32
+    np.testing.assert_allclose(ma[2:], np.arange(1, 9), rtol=1e-6)
+
+def test_benchmark_reports_speedup():
+    """Test the benchmark runs on a small panel and reports speedups."""
+    results = benchmark_moving_average(n_series=5, n_periods=60, repeat=1)
+    assert results['sma_speedup'] > 0
+    assert results['wma_speedup'] > 0
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,110 @@
+"""
+Test module for guaranteed-service multi-echelon safety stock.
+Checks the tree dynamic program against exhaustive search, demand
+pooling, a store/DC network and the two-stage system checker.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.inventory import guaranteed_service_stock
+from utils.testing.inventory_tests import check_two_stage_system
+
+def exhaustive_cost(parent, processing_time, sigma, holding_cost, z, max_service_time):
+    """Cheapest total holding cost over every assignment of service times."""
+    n = len(parent)
+    horizon = int(processing_time.sum())
+    best = np.inf
+    for service in itertools.product(range(horizon + 1), repeat=n):
+        inbound = [0 if parent[j] < 0 else service[parent[j]] for j in range(n)]
+        tau = np.array(inbound) + processing_time - np.array(service)
+        if np.all(tau >= 0) and np.all(np.array(service) <= max_service_time):
+            best = min(best, np.sum(holding_cost * z * sigma * np.sqrt(tau)))
+    return best
+
+@pytest.mark.parametrize("seed", range(8))
+def test_matches_exhaustive_search(seed):
+    """Test the level-by-level program finds the optimal service times."""
+    rng = np.random.default_rng(seed)
+    parent = np.array([-1] + [rng.integers(0, j) for j in range(1, 4)])
+    processing_time = rng.integers(0, 3, 4)
+    demand_stddev = rng.uniform(1, 5, 4)
+    holding_cost = rng.uniform(0.5, 3, 4)
+    max_service_time = np.where(np.bincount(parent[1:], minlength=4) == 0,
+                                rng.integers(0, 2, 4), 99)
+    result = guaranteed_service_stock(parent, processing_time, demand_stddev,
+                                      holding_cost=holding_cost,
+                                      max_service_time=max_service_time)
+    
+    expected = exhaustive_cost(parent, processing_time, result['demand_stddev'], holding_cost,
+                               stats.norm.ppf(0.95), max_service_time)
+    assert result['total_cost'] == pytest.approx(expected)
+    np.testing.assert_array_equal(
+        result['net_replenishment_time'],
+        result['inbound_service_time'] + processing_time - result['service_time'])
+
+def test_demand_pooling():
+    """Test a DC serving 150 stores pools their demand."""
+    parent = np.r_[-1, np.zeros(150, dtype=int)]
+    store_std = 25 / np.sqrt(30)
+    demand_stddev = np.r_[0, np.full(150, store_std)]
+    pooled = guaranteed_service_stock(parent, np.r_[7, np.full(150, 3)], demand_stddev,
+                                      demand_mean=np.r_[0, np.full(150, 2.5)])
+    assert pooled['demand_stddev'][0] == pytest.approx(np.sqrt(150) * store_std)
+    assert pooled['demand_mean'][0] == pytest.approx(375)
+    
+    correlated = guaranteed_service_stock(parent, np.r_[7, np.full(150, 3)], demand_stddev,
+                                          pooling=False)
+    assert correlated['demand_stddev'][0] == pytest.approx(150 * store_std)
+    # Pooled DC stock is cheap, so the DC holds it and stores wait only 3 days
+    assert pooled['service_time'][0] == 0
+    np.testing.assert_array_equal(pooled['net_replenishment_time'][1:], 3)
+
+def test_store_dc_network():
+    """Test a plant, 40 DCs and 8,000 stores with customer-facing stores."""
+    rng = np.random.default_rng(0)
+    parent = np.r_[-1, np.zeros(40, dtype=int), 1 + rng.integers(0, 40, 8000)]
+    processing_time = np.r_[10, rng.integers(3, 8, 40), rng.integers(1, 3, 8000)]
+    demand_stddev = np.r_[np.zeros(41), rng.uniform(1, 10, 8000)]
+    holding_cost = np.r_[1.0, np.full(40, 2.0), np.full(8000, 4.0)]
+    result = guaranteed_service_stock(parent, processing_time, demand_stddev,
+                                      holding_cost=holding_cost, service_level=0.98)
+    
+    assert result['safety_stock'].shape == (8041,)
+    assert np.all(result['service_time'][41:] == 0)
+    assert np.all(result['net_replenishment_time'] >= 0)
+    assert result['total_cost'] == pytest.approx(np.sum(holding_cost * result['safety_stock']))
+    # Never worse than holding all stock at the stores
+    tau = np.r_[np.zeros(41), 10 + processing_time[parent[41:]] + processing_time[41:]]
+    stores_only = np.sum(holding_cost * stats.norm.ppf(0.98) * result['demand_stddev']
+                         * np.sqrt(tau))
+    assert result['total_cost'] <= stores_only
+
+def test_invalid_networks():
+    """Test cycles and fractional processing times are rejected."""
+    with pytest.raises(ValueError):
+        guaranteed_service_stock([1, 0], [1, 1], [1, 1])
+    with pytest.raises(ValueError):
+        guaranteed_service_stock([-1, 0], [1.5, 1], [1, 1])
+
+def test_two_stage_checker_accepts_arrays():
+    """Test the notebook design and per-store arrays validate in one call."""
+    z = stats.norm.ppf(0.95)
+    daily_mean, daily_std = 75 / 30, 25 / np.sqrt(30)
+    safety = z * daily_std * np.sqrt(10)
+    design = {'safety_stock': safety, 'reorder_point': daily_mean * 10 + safety,
+              'order_up_to': daily_mean * 17 + safety}
+    assert check_two_stage_system(design)
+    
+    means = np.array([60.0, 75.0, 90.0])
+    stores = {'reorder_point': means / 30 * 10 + z * daily_std * np.sqrt(10)}
+    assert check_two_stage_system(stores, mean=means)
+    stores['reorder_point'][1] += 2
+    assert not check_two_stage_system(stores, mean=means)
+    assert not check_two_stage_system({})
+
+if __name__ == '__main__':
+    pytest.main([__file__])
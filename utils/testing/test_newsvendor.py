@@ -0,0 +1,117 @@
+"""
+Test module for the batch newsvendor solver.
+Checks the GameStop preorder case, discrete quantiles against scipy,
+partial expectations against direct sums and empirical demand.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.inventory import critical_ratio, newsvendor
+
+def test_gamestop_preorder():
+    """Test the normal solution matches the preorder notebook's risk analysis."""
+    result = newsvendor(80, 50, 20, mean=100, stddev=20)
+    assert result['critical_ratio'] == pytest.approx(0.5)
+    assert result['order_quantity'] == pytest.approx(100 + stats.norm.ppf(0.5) * 20)
+    assert result['stockout_probability'] == pytest.approx(0.5)
+    
+    # Leftover and profit agree with integrating over the demand density
+    demand = np.linspace(0, 200, 200001)
+    weight = stats.norm.pdf(demand, 100, 20) * (demand[1] - demand[0])
+    leftover = np.sum(np.maximum(result['order_quantity'] - demand, 0) * weight)
+    assert result['expected_leftover'] == pytest.approx(leftover, rel=1e-4)
+    assert result['expected_profit'] == pytest.approx(
+        80 * result['expected_sales'] + 20 * leftover - 50 * result['order_quantity'],
+        rel=1e-4)
+
+@pytest.mark.parametrize("distribution", ['poisson', 'negative_binomial'])
+def test_discrete_quantiles_match_scipy(distribution):
+    """Test the corrected Cornish-Fisher quantile is the exact scipy quantile."""
+    rng = np.random.default_rng(0)
+    mean = rng.uniform(0.1, 200, 20000)
+    stddev = np.sqrt(mean) * rng.uniform(1.1, 3, 20000)
+    cost = 80 - rng.uniform(0.02, 0.98, 20000) * 60
+    result = newsvendor(80, cost, 20, distribution, mean=mean, stddev=stddev)
+    
+    if distribution == 'poisson':
+        expected = stats.poisson.ppf(result['critical_ratio'], mean)
+    else:
+        p = mean / stddev**2
+        expected = stats.nbinom.ppf(result['critical_ratio'], mean * p / (1 - p), p)
+    np.testing.assert_array_equal(result['order_quantity'], expected)
+
+@pytest.mark.parametrize("distribution", ['poisson', 'negative_binomial'])
+def test_discrete_partial_expectations(distribution):
+    """Test leftover and stockout against sums over the probability mass."""
+    mean, stddev = np.array([0.5, 12.0, 80.0]), np.array([1.0, 5.0, 15.0])
+    result = newsvendor(80, 50, 20, distribution, mean=mean, stddev=stddev)
+    
+    k = np.arange(1000)[:, np.newaxis]
+    if distribution == 'poisson':
+        pmf = stats.poisson.pmf(k, mean)
+    else:
+        p = mean / stddev**2
+        pmf = stats.nbinom.pmf(k, mean * p / (1 - p), p)
+    quantity = result['order_quantity']
+    np.testing.assert_allclose(result['expected_leftover'],
+                               np.sum(np.maximum(quantity - k, 0) * pmf, axis=0))
+    np.testing.assert_allclose(result['stockout_probability'],
+                               np.sum((k > quantity) * pmf, axis=0), atol=1e-12)
+
+def test_empirical_quantile():
+    """Test empirical demand uses the inverted-CDF sample quantile."""
+    rng = np.random.default_rng(1)
+    samples = rng.poisson(50, (300, 101)).astype(float)
+    cost = rng.uniform(25, 75, 300)
+    result = newsvendor(80, cost, 20, 'empirical', samples=samples, chunk_size=1000)
+    
+    expected = [np.quantile(row, ratio, method='inverted_cdf')
+                for row, ratio in zip(samples, result['critical_ratio'])]
+    np.testing.assert_array_equal(result['order_quantity'], expected)
+    np.testing.assert_allclose(
+        result['expected_leftover'],
+        np.maximum(result['order_quantity'][:, np.newaxis] - samples, 0).mean(axis=1))
+
+def test_given_order_quantities():
+    """Test evaluating fixed quantities, which never beat the optimum."""
+    optimal = newsvendor(80, 50, 20, mean=100, stddev=20)
+    quantity = np.linspace(60, 140, 81)
+    evaluated = newsvendor(80, 50, 20, mean=100, stddev=20, order_quantity=quantity)
+    assert evaluated['order_quantity'].shape == (81,)
+    assert np.all(evaluated['expected_profit'] <= optimal['expected_profit'] + 1e-9)
+    
+    poisson = newsvendor(80, 50, 20, 'poisson', mean=10, order_quantity=[0, 10])
+    np.testing.assert_allclose(poisson['stockout_probability'],
+                               1 - stats.poisson.cdf([0, 10], 10))
+
+def test_invalid_inputs():
+    """Test bad prices, distributions and demand parameters are rejected."""
+    with pytest.raises(ValueError):
+        critical_ratio(50, 80, 20)
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, 'gamma', mean=10)
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, 'negative_binomial', mean=10, stddev=3)
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, 'empirical')
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, mean=10)
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, 'poisson', mean=np.nan)
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, 'negative_binomial', mean=10, stddev=np.inf)
+    with pytest.raises(ValueError):
+        newsvendor(80, 50, 20, mean=[10, np.nan], stddev=3)
+
+def test_skewed_negative_binomial_quantile():
+    """Test a Cornish-Fisher start far from the quantile still converges."""
+    mean, stddev, ratio = 1e4, 1e5, 0.999
+    p = mean / stddev**2
+    result = newsvendor(1000, 1, 0, 'negative_binomial', mean=mean, stddev=stddev)
+    assert result['critical_ratio'] == ratio
+    assert result['order_quantity'] == stats.nbinom.ppf(ratio, mean * p / (1 - p), p)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
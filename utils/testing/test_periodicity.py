@@ -0,0 +1,91 @@
+"""
+Test module for seasonal-period detection.
+Checks detected periods on a mixed panel and that the output feeds
+Holt-Winters and the multi-seasonal decomposition directly.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import (
+    detect_seasonal_periods,
+    holt_winters,
+    holts_method,
+    multi_seasonal_decompose
+)
+
+@pytest.fixture
+def mixed_panel():
+    """Hourly daily+weekly, monthly, non-seasonal and weekly series."""
+    rng = np.random.default_rng(0)
+    t = np.arange(24 * 7 * 6)
+    panel = np.vstack([
+        500 + 60 * np.sin(2 * np.pi * t / 24) + 40 * np.sin(2 * np.pi * t / 168),
+        300 + 50 * np.sin(2 * np.pi * t / 12),
+        200 + 0.05 * t,
+        400 + 30 * np.cos(2 * np.pi * t / 7),
+    ])
+    return panel + rng.normal(0, 5, panel.shape)
+
+def test_detects_periods_per_series(mixed_panel):
+    """Test strongest periods are found and missing ones are 0."""
+    periods = detect_seasonal_periods(mixed_panel, n_periods=2)
+    
+    assert periods.shape == (4, 2)
+    assert sorted(periods[0]) == [24, 168]
+    assert list(periods[1]) == [12, 0]
+    assert list(periods[2]) == [0, 0]
+    assert list(periods[3]) == [7, 0]
+
+def test_single_series_and_default(mixed_panel):
+    """Test a 1-D series drops the series axis and `default` fills gaps."""
+    assert list(detect_seasonal_periods(mixed_panel[1])) == [12]
+    assert list(detect_seasonal_periods(mixed_panel[2], default=-1)) == [-1]
+
+def test_output_feeds_holt_winters(mixed_panel):
+    """Test detected periods run Holt-Winters, falling back to Holt for 0."""
+    periods = detect_seasonal_periods(mixed_panel)
+    smoothed, level, trend, season = holt_winters(mixed_panel, 0.3, 0.1, 0.2, periods)
+    
+    _, holt_level, holt_trend = holts_method(mixed_panel[2], 0.3, 0.1)
+    np.testing.assert_allclose(level[2], holt_level)
+    np.testing.assert_allclose(trend[2], holt_trend)
+    assert np.all(season[2] == 0)
+    
+    expected, _, _, _ = holt_winters(mixed_panel[[1]], 0.3, 0.1, 0.2, 12)
+    np.testing.assert_allclose(smoothed[1], expected[0])
+
+def test_output_feeds_decomposition(mixed_panel):
+    """Test per-series periods decompose each series with its own cycles."""
+    seasonal_rows = mixed_panel[[0, 1, 3]]
+    periods = detect_seasonal_periods(seasonal_rows, n_periods=2)
+    result = multi_seasonal_decompose(seasonal_rows, periods)
+    
+    assert list(result['periods'][1]) == [12, 0]
+    assert np.all(result['seasonal'][1, 1] == 0)
+    
+    expected = multi_seasonal_decompose(seasonal_rows[1], 12)
+    np.testing.assert_allclose(result['seasonal'][0, 1], expected['seasonal'][0])
+    np.testing.assert_allclose(result['trend'][1], expected['trend'])
+
+def test_decomposition_falls_back_to_trend(mixed_panel):
+    """Test series without a period get zero seasonals and a moving-average trend."""
+    periods = detect_seasonal_periods(mixed_panel, n_periods=2)
+    result = multi_seasonal_decompose(mixed_panel, periods)
+    
+    assert list(result['periods'][2]) == [0, 0]
+    assert np.all(result['seasonal'][:, 2] == 0)
+    # Trend-only rows smooth over the longest period of the panel (168 hours)
+    expected = np.convolve(np.pad(mixed_panel[2], 84, mode='edge'),
+                           np.r_[0.5, np.ones(167), 0.5] / 168, mode='valid')
+    np.testing.assert_allclose(result['trend'][2], expected)
+    np.testing.assert_allclose(result['trend'][2] + result['resid'][2], mixed_panel[2])
+    
+    expected = multi_seasonal_decompose(mixed_panel[1], 12)
+    np.testing.assert_allclose(result['seasonal'][0, 1], expected['seasonal'][0])
+    
+    with pytest.raises(ValueError):
+        multi_seasonal_decompose(mixed_panel, np.zeros((4, 2), dtype=int))
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+"""
+Test module for the (R, S) / (s, S) policy optimizer.
+Checks candidates against the sunglass notebook's two-stage design,
+periodic-review simulation and the constrained cost search.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.inventory import policy_candidates, optimize_policy, simulate_policy
+
+DAILY_MEAN = 75 / 30
+DAILY_STD = 25 / np.sqrt(30)
+
+def test_candidates_match_two_stage_design():
+    """Test the notebook's reorder point and order-up-to level are a candidate."""
+    z = stats.norm.ppf(0.95)
+    candidates = policy_candidates(DAILY_MEAN, DAILY_STD, 3, policy='sS', review_periods=[7],
+                                   z_levels=[z], order_up_to_gaps=[1.0])
+    cycle_mean = DAILY_MEAN * 10
+    cycle_std = DAILY_STD * np.sqrt(10)
+    reorder_point = cycle_mean + z * cycle_std
+    assert candidates['reorder_point'] == pytest.approx([reorder_point])
+    assert candidates['order_up_to'] == pytest.approx([reorder_point + DAILY_MEAN * 7])
+    
+    grid = policy_candidates([2.0, 5.0], [1.0, 2.0], 3, review_periods=[1, 7],
+                             z_levels=[0, 1, 2])
+    assert grid['order_up_to'].shape == (2, 6)
+    np.testing.assert_array_equal(grid['reorder_point'], grid['order_up_to'])
+
+def test_periodic_review_orders_up_to_level():
+    """Test (R, S) orders the gap to S on review days only."""
+    result = simulate_policy(100, 10, order_up_to=100, review_period=4, lead_time=1,
+                             days=10, n_replications=1, demand=np.full(9, 10.0),
+                             return_path=True)
+    # Reviews on days 4 and 8 order 40 units that arrive a day later
+    np.testing.assert_allclose(result['inventory'][:, 0],
+                               [100, 90, 80, 70, 60, 90, 80, 70, 60, 90])
+    assert result['orders'][0] == 2
+
+def test_optimizer_meets_target_at_lowest_cost():
+    """Test the chosen policy is the cheapest feasible candidate."""
+    result = optimize_policy([DAILY_MEAN, 20.0], [DAILY_STD, 6.0], 3, holding_cost=0.1,
+                             shortage_cost=5.0, target=0.95, days=200, n_replications=60)
+    assert np.all(result['feasible'])
+    assert np.all(result['fill_rate'] >= 0.95)
+    
+    stricter = optimize_policy([DAILY_MEAN, 20.0], [DAILY_STD, 6.0], 3, holding_cost=0.1,
+                               shortage_cost=5.0, target=0.99, days=200, n_replications=60)
+    assert np.all(stricter['order_up_to'] >= result['order_up_to'])
+    assert np.all(stricter['cost'] >= result['cost'])
+
+def test_order_cost_lengthens_review_period():
+    """Test a fixed cost per order favours reviewing less often."""
+    kwargs = dict(holding_cost=0.01, shortage_cost=5.0, policy='sS', days=200,
+                  n_replications=40)
+    free = optimize_policy(20.0, 6.0, 3, **kwargs)
+    costly = optimize_policy(20.0, 6.0, 3, order_cost=100.0, **kwargs)
+    assert costly['review_period'][0] > free['review_period'][0]
+
+def test_unreachable_target_returns_best_served():
+    """Test SKUs without a feasible candidate are flagged."""
+    result = optimize_policy(20.0, 6.0, 3, holding_cost=0.1, shortage_cost=5.0,
+                             target=1.0, review_periods=[1], z_levels=[0.0, 0.5], days=100,
+                             n_replications=30)
+    assert not result['feasible'][0]
+    assert result['reorder_point'][0] == pytest.approx(20.0 * 4 + 0.5 * 6.0 * 2)
+
+def test_results_do_not_depend_on_workers():
+    """Test chunking and the process pool give identical policies."""
+    demand = np.linspace(2, 30, 5)
+    kwargs = dict(holding_cost=0.1, shortage_cost=4.0, days=60, n_replications=20,
+                  chunk_size=2)
+    serial = optimize_policy(demand, demand / 3, 2, **kwargs)
+    parallel = optimize_policy(demand, demand / 3, 2, n_jobs=2, **kwargs)
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], parallel[key])
+
+def test_invalid_arguments():
+    """Test bad arguments are rejected."""
+    with pytest.raises(ValueError):
+        optimize_policy(10, 3, 2, 0.1, 5.0, measure='profit')
+    with pytest.raises(ValueError):
+        policy_candidates(10, 3, 2, policy='sQ')
+    with pytest.raises(ValueError):
+        simulate_policy(100, 10, order_quantity=50, order_up_to=100)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,116 @@
+"""
+Test module for hierarchical forecast reconciliation.
+Compares the sparse implementations with dense textbook formulas on a small hierarchy.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import (
+    Hierarchy,
+    bottom_up,
+    top_down,
+    mint_shrink,
+    holts_method,
+    holts_forecast
+)
+
+@pytest.fixture
+def hierarchy():
+    """24 SKUs in 6 stores in 2 regions (store ids repeat across regions)."""
+    region = np.repeat(['East', 'West'], 12)
+    store = np.tile(np.repeat([1, 2, 3], 4), 2)
+    return Hierarchy.from_levels({'region': region, 'store': store},
+                                 leaf_ids=[f"SKU{i}" for i in range(24)])
+
+def _dense_mint_shrink(base, S, residuals):
+    """Dense MinT-shrink with the Schafer-Strimmer intensity."""
+    x = residuals.T
+    n = x.shape[0]
+    cov = x.T @ x / n
+    std = np.sqrt(np.diag(cov))
+    xs = x / std
+    v = ((xs**2).T @ (xs**2) - (xs.T @ xs)**2 / n) / (n * (n - 1))
+    np.fill_diagonal(v, 0)
+    corr = cov / np.outer(std, std)
+    np.fill_diagonal(corr, 0)
+    lam = np.clip(v.sum() / np.sum(corr**2), 0, 1)
+    
+    W_inv = np.linalg.inv(lam * np.diag(np.diag(cov)) + (1 - lam) * cov)
+    G = np.linalg.solve(S.T @ W_inv @ S, S.T @ W_inv)
+    return S @ G @ base
+
+def test_structure(hierarchy):
+    """Test node counts, labels and summing matrix."""
+    assert hierarchy.n_aggregates == 1 + 2 + 6
+    assert hierarchy.n_nodes == 33
+    assert hierarchy.labels[0] == ('total', 'total')
+    assert hierarchy.labels[3] == ('store', ('East', 1))
+    assert hierarchy.labels[-1] == ('leaf', 'SKU23')
+    
+    S = hierarchy.summing_matrix
+    assert S.shape == (33, 24)
+    np.testing.assert_allclose(S.sum(axis=1).A.ravel()[:3], [24, 12, 12])
+
+def test_bottom_up_and_top_down(hierarchy):
+    """Test both simple methods give coherent forecasts."""
+    rng = np.random.default_rng(42)
+    leaf_forecasts = rng.uniform(10, 20, (24, 3))
+    
+    nodes = bottom_up(leaf_forecasts, hierarchy)
+    np.testing.assert_allclose(nodes[0], leaf_forecasts.sum(axis=0))
+    np.testing.assert_allclose(hierarchy.constraint_matrix @ nodes, 0, atol=1e-9)
+    
+    history = rng.uniform(0, 10, (24, 30))
+    nodes = top_down([300.0, 310.0], hierarchy, history)
+    np.testing.assert_allclose(nodes[0], [300.0, 310.0])
+    np.testing.assert_allclose(nodes[-24:, 0] / 300, history.sum(axis=1) / history.sum())
+    np.testing.assert_allclose(hierarchy.constraint_matrix @ nodes, 0, atol=1e-9)
+
+def test_mint_shrink_matches_dense_formula(hierarchy):
+    """Test the sparse projection form against dense MinT-shrink."""
+    rng = np.random.default_rng(42)
+    S = hierarchy.summing_matrix.toarray()
+    residuals = S @ rng.normal(size=(24, 20)) + rng.normal(0, 0.5, (33, 20))
+    base = rng.normal(100, 5, (33, 4))
+    
+    reconciled = mint_shrink(base, hierarchy, residuals)
+    np.testing.assert_allclose(reconciled, _dense_mint_shrink(base, S, residuals), rtol=1e-8)
+    np.testing.assert_allclose(hierarchy.constraint_matrix @ reconciled, 0, atol=1e-8)
+    assert mint_shrink(base[:, 0], hierarchy, residuals).shape == (33,)
+
+def test_mint_shrink_perfectly_correlated_residuals():
+    """Test identical residual rows (zero shrinkage intensity) still reconcile."""
+    hierarchy = Hierarchy.from_levels({'region': ['East', 'West']})
+    residuals = np.tile([1.0, -1.0, 1.0, -1.0], (hierarchy.n_nodes, 1))
+    base = np.array([10.0, 4.0, 5.0, 4.0, 5.0])
+    
+    reconciled = mint_shrink(base, hierarchy, residuals)
+    assert np.all(np.isfinite(reconciled))
+    np.testing.assert_allclose(hierarchy.constraint_matrix @ reconciled, 0, atol=1e-8)
+
+def test_reconcile_after_smoothing(hierarchy):
+    """Test the pipeline: aggregate history, smooth every node, reconcile."""
+    rng = np.random.default_rng(0)
+    leaf_history = 20 + np.cumsum(rng.normal(0.1, 1, (24, 40)), axis=1)
+    node_history = hierarchy.aggregate(leaf_history)
+    
+    # Per-node parameters make the base forecasts incoherent
+    alphas = rng.uniform(0.2, 0.8, hierarchy.n_nodes)
+    _, level, trend = holts_method(node_history, alphas, 0.2)
+    base = holts_forecast(level, trend, 5)
+    residuals = node_history[:, 2:] - (level[:, 1:-1] + trend[:, 1:-1])
+    
+    reconciled = mint_shrink(base, hierarchy, residuals)
+    np.testing.assert_allclose(hierarchy.constraint_matrix @ reconciled, 0, atol=1e-8)
+    assert not np.allclose(hierarchy.constraint_matrix @ base, 0)
+
+def test_invalid_shapes(hierarchy):
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        mint_shrink(np.ones(10), hierarchy, np.ones((33, 5)))
+    with pytest.raises(ValueError):
+        hierarchy.aggregate(np.ones(5))
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,49 @@
+"""
+Test module for service level <-> z-score conversion.
+Checks agreement with scipy.stats.norm on dense grids and tails, shapes,
+invalid levels and the safety stock formula built on the conversion.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.inventory import z_from_service_level, service_level_from_z, safety_stock
+from utils.testing.inventory_tests import check_service_level
+
+def test_matches_scipy_exactly():
+    """Test both conversions equal the normal ppf and cdf, tails included."""
+    levels = np.r_[1e-12, 1e-4, np.linspace(0.001, 0.999, 100_001), 0.9999, 1 - 1e-12]
+    z = z_from_service_level(levels)
+    np.testing.assert_array_equal(z, stats.norm.ppf(levels))
+    
+    z = np.r_[-40.0, -7.0, np.linspace(-6, 6, 100_001), 8.0, np.inf]
+    np.testing.assert_array_equal(service_level_from_z(z), stats.norm.cdf(z))
+    assert np.isnan(service_level_from_z(np.nan))
+
+def test_shapes_and_round_trip():
+    """Test scalars and N-D inputs keep their shape and round-trip."""
+    assert z_from_service_level(0.95).shape == ()
+    assert z_from_service_level(0.95) == pytest.approx(1.6448536, abs=1e-7)
+    
+    levels = np.random.default_rng(0).uniform(0.5, 0.999, (40, 25))
+    z = z_from_service_level(levels)
+    assert z.shape == (40, 25)
+    np.testing.assert_allclose(service_level_from_z(z), levels, atol=1e-7)
+
+@pytest.mark.parametrize("level", [0.0, 1.0, -0.1, np.nan])
+def test_invalid_service_level(level):
+    """Test service levels outside (0, 1) are rejected."""
+    with pytest.raises(ValueError):
+        z_from_service_level([0.9, level])
+
+def test_safety_stock_and_checker():
+    """Test the safety stock formula and check_service_level use the conversions."""
+    levels = np.array([0.90, 0.95, 0.99])
+    np.testing.assert_allclose(safety_stock(20, 4, levels),
+                               stats.norm.ppf(levels) * 20 * 2, atol=1e-6)
+    assert check_service_level({'z_score': 1.645}, target=0.95)
+    assert not check_service_level({'z_score': 1.28}, target=0.95)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
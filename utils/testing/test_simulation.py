@@ -0,0 +1,116 @@
+"""
+Test module for the (s, Q) Monte Carlo engine.
+Checks replications against the reorder point notebook loop, the order
+pipeline with stochastic lead times, chunking and broadcasting.
+"""
+
+import numpy as np
+import pytest
+
+from utils.inventory import simulate_sq_policy
+
+def notebook_loop(demands, days, rop=650, order_quantity=500, lead_time=5, initial=800):
+    """The variable-demand simulation of the reorder point notebook."""
+    inventory = np.zeros(days)
+    inventory[0] = initial
+    stockouts = 0
+    orders_placed = []
+    orders_received = []
+    for day in range(1, days):
+        inventory[day] = inventory[day-1] - demands[day-1]
+        if inventory[day] < 0:
+            stockouts += 1
+            inventory[day] = 0
+        if inventory[day] <= rop and len(orders_placed) == len(orders_received):
+            orders_placed.append(day)
+        if len(orders_placed) > len(orders_received):
+            if day - orders_placed[len(orders_received)] >= lead_time:
+                inventory[day] += order_quantity
+                orders_received.append(day)
+    return inventory, 1 - stockouts/days, len(orders_placed)
+
+@pytest.mark.parametrize("scale", [1.0, 1.6])
+def test_matches_notebook_loop(scale):
+    """Test one replication reproduces the notebook, stockouts included."""
+    np.random.seed(42)
+    demands = np.maximum(np.random.normal(100, 20, 60), 0) * scale
+    inventory, service_level, n_orders = notebook_loop(demands, 60)
+    
+    result = simulate_sq_policy(650, 500, 100, lead_time=5, days=60, n_replications=1,
+                                initial_inventory=800, max_outstanding=1,
+                                demand=demands, return_path=True)
+    np.testing.assert_allclose(result['inventory'][:, 0], inventory)
+    assert result['service_level'][0] == pytest.approx(service_level)
+    assert result['average_inventory'][0] == pytest.approx(inventory.mean())
+    assert result['orders'][0] == n_orders
+
+def test_replications_match_loop_per_path():
+    """Test every replication x SKU cell equals its own loop."""
+    rng = np.random.default_rng(1)
+    demand = np.maximum(rng.normal(100, 40, (59, 50, 3)), 0)
+    rop = np.array([450.0, 650.0, 850.0])
+    result = simulate_sq_policy(rop, 500, 100, days=60, n_replications=50,
+                                initial_inventory=800, max_outstanding=1, demand=demand)
+    for r in (0, 17, 49):
+        for k in range(3):
+            inventory, service_level, _ = notebook_loop(demand[:, r, k], 60, rop=rop[k])
+            assert result['service_level'][r, k] == pytest.approx(service_level)
+            assert result['average_inventory'][r, k] == pytest.approx(inventory.mean())
+
+def test_fill_rate_counts_lost_sales():
+    """Test lost demand while empty lowers the fill rate."""
+    demand = np.full(9, 100.0)
+    result = simulate_sq_policy(0, 100, 100, lead_time=3, days=10, n_replications=1,
+                                initial_inventory=300, demand=demand, return_path=True)
+    # Stock lasts 3 days; each order of 100 covers one day in four
+    np.testing.assert_allclose(result['inventory'][:, 0], [300, 200, 100, 0, 0, 0, 100, 0, 0, 0])
+    assert result['fill_rate'][0] == pytest.approx(4 / 9)
+    assert result['service_level'][0] == pytest.approx(1 - 5 / 10)
+
+def test_stochastic_lead_times_cross():
+    """Test orders with explicit lead times arrive on their own due days."""
+    lead_times = np.full(12, 1)
+    lead_times[1] = 5
+    result = simulate_sq_policy(250, 100, 100, days=8, n_replications=1,
+                                initial_inventory=300, demand=np.full(7, 100.0),
+                                lead_times=lead_times, return_path=True)
+    # The day-1 order takes 5 days, so later 1-day orders overtake it and
+    # two orders arrive together on day 6
+    np.testing.assert_allclose(result['inventory'][:, 0], [300, 200, 100, 100, 100, 100, 200, 200])
+    
+    spread = simulate_sq_policy(650, 500, 100, 20, lead_time=5, lead_time_stddev=[0, 2],
+                                days=120, n_replications=400, seed=3)
+    assert spread['service_level'][:, 1].mean() < spread['service_level'][:, 0].mean()
+
+def test_distributions_shape_and_monotone():
+    """Test broadcast SKU shapes and that a higher reorder point helps."""
+    rop = np.array([[300.0], [500.0], [700.0]])
+    result = simulate_sq_policy(rop, [400.0, 600.0], 100, 20, lead_time=5, lead_time_stddev=1,
+                                days=90, n_replications=300, seed=0)
+    assert result['service_level'].shape == (300, 3, 2)
+    assert np.all((result['fill_rate'] >= 0) & (result['fill_rate'] <= 1))
+    mean_service = result['service_level'].mean(axis=0)
+    assert np.all(np.diff(mean_service, axis=0) > 0)
+    assert np.all(np.diff(result['average_inventory'].mean(axis=0), axis=0) > 0)
+
+def test_chunking_does_not_change_results():
+    """Test small blocks give the same results on fixed demand paths."""
+    demand = np.random.default_rng(2).gamma(4, 25, (29, 20, 7))
+    lead_times = np.random.default_rng(3).integers(2, 8, (30, 20, 7))
+    kwargs = dict(days=30, n_replications=20, demand=demand, lead_times=lead_times)
+    whole = simulate_sq_policy(np.linspace(300, 900, 7), 400, 100, **kwargs)
+    blocks = simulate_sq_policy(np.linspace(300, 900, 7), 400, 100, chunk_size=45, **kwargs)
+    for key in whole:
+        np.testing.assert_array_equal(whole[key], blocks[key])
+
+def test_invalid_inputs():
+    """Test bad parameters are rejected."""
+    with pytest.raises(ValueError):
+        simulate_sq_policy(650, 0, 100)
+    with pytest.raises(ValueError):
+        simulate_sq_policy(650, 500, 100, lead_time=-1)
+    with pytest.raises(ValueError):
+        simulate_sq_policy(650, 500, 100, days=60, demand=np.ones(10))
+
+if __name__ == '__main__':
+    pytest.main([__file__])
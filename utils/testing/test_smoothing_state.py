@@ -0,0 +1,97 @@
+"""
+Test module for the streaming smoothing state.
+Checks incremental updates reproduce the batch smoothing engines.
+"""
+
+import numpy as np
+import pytest
+
+from utils.forecasting import (
+    SmoothingState,
+    simple_exponential_smoothing,
+    holts_method,
+    holts_forecast,
+    holt_winters,
+    holt_winters_forecast
+)
+
+@pytest.fixture
+def pos_panel():
+    """Seasonal POS demand for four SKUs over 48 periods."""
+    rng = np.random.default_rng(42)
+    t = np.arange(48)
+    return 100 + 0.5 * t + 8 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 2, (4, 48))
+
+def test_ses_updates_match_batch(pos_panel):
+    """Test SES state updates continue the batch result."""
+    state = SmoothingState.from_history(pos_panel[:, :30], 0.3)
+    streamed = state.update(pos_panel[:, 30:])
+    
+    expected = simple_exponential_smoothing(pos_panel, 0.3)
+    np.testing.assert_allclose(streamed, expected[:, 30:])
+
+def test_holt_single_step_updates(pos_panel):
+    """Test one-column-at-a-time Holt updates and forecasts."""
+    state = SmoothingState.from_history(pos_panel[:, :20], 0.5, beta=0.3)
+    for t in range(20, 48):
+        smoothed = state.update(pos_panel[:, t])
+    
+    result, level, trend = holts_method(pos_panel, 0.5, 0.3)
+    np.testing.assert_allclose(smoothed, result[:, -1])
+    np.testing.assert_allclose(state.forecast(3), holts_forecast(level, trend, 3))
+
+@pytest.mark.parametrize('seasonal', ['additive', 'multiplicative'])
+def test_holt_winters_updates_match_batch(pos_panel, seasonal):
+    """Test seasonal state updates and forecasts match the batch engine."""
+    state = SmoothingState.from_history(pos_panel[:, :29], 0.3, beta=0.1, gamma=0.2,
+                                        seasonal_periods=12, seasonal=seasonal)
+    streamed = state.update(pos_panel[:, 29:])
+    
+    result, level, trend, season = holt_winters(pos_panel, 0.3, 0.1, 0.2, 12, seasonal=seasonal)
+    np.testing.assert_allclose(streamed, result[:, 29:])
+    np.testing.assert_allclose(state.forecast(15),
+                               holt_winters_forecast(level, trend, season, 12, 15, seasonal))
+
+def test_missing_observations_roll_forward(pos_panel):
+    """Test NaN keeps a series on its forecast path while others update."""
+    state = SmoothingState.from_history(pos_panel[:, :20], 0.5, beta=0.3)
+    expected_next = state.forecast(1)[:, 0]
+    
+    new_values = pos_panel[:, 20].copy()
+    new_values[1] = np.nan
+    smoothed = state.update(new_values)
+    
+    assert np.isclose(state.level[1], expected_next[1])
+    assert not np.isclose(smoothed[0], expected_next[0])
+
+def test_save_and_load_roundtrip(pos_panel, tmp_path):
+    """Test a serialized state resumes exactly where it stopped."""
+    state = SmoothingState.from_history(pos_panel[:, :30], 0.3, beta=0.1, gamma=0.2,
+                                        seasonal_periods=12)
+    state.update(pos_panel[:, 30:35])
+    state.save(tmp_path / 'state.npz')
+    
+    restored = SmoothingState.load(tmp_path / 'state.npz')
+    assert restored.position == state.position
+    np.testing.assert_allclose(restored.update(pos_panel[:, 35:]), state.update(pos_panel[:, 35:]))
+
+def test_scalar_updates_for_single_series(pos_panel):
+    """Test a lone series accepts scalar observations."""
+    series = pos_panel[0]
+    state = SmoothingState.from_history(series[:30], 0.3)
+    for value in series[30:]:
+        smoothed = state.update(value)
+    
+    assert smoothed.shape == ()
+    assert smoothed == pytest.approx(simple_exponential_smoothing(series, 0.3)[-1])
+
+def test_update_shape_validation(pos_panel):
+    """Test updates must provide one value per series."""
+    state = SmoothingState.from_history(pos_panel, 0.3)
+    with pytest.raises(ValueError):
+        state.update(np.ones(3))
+    with pytest.raises(ValueError):
+        state.update(1.0)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,81 @@
+"""
+Test module for broadcasting parameter sweeps.
+Checks grids against the safety stock notebook's nested loops, chunked
+evaluation and streaming reductions of a 6-D study.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.inventory import Sweep, sweep, reorder_point
+
+DEMAND_STDDEV = np.linspace(10, 40, 20)
+LEAD_TIME_STDDEV = np.linspace(0.5, 2, 20)
+
+def test_matches_notebook_double_loop():
+    """Test the safety stock heat map of the notebook."""
+    z_score = stats.norm.ppf(0.95)
+    expected = np.zeros((20, 20))
+    for i, d_std in enumerate(DEMAND_STDDEV):
+        for j, l_std in enumerate(LEAD_TIME_STDDEV):
+            expected[i, j] = z_score * np.sqrt(5 * d_std**2 + 100**2 * l_std**2)
+    
+    grid = sweep('safety_stock', {'demand_stddev': DEMAND_STDDEV,
+                                  'lead_time_stddev': LEAD_TIME_STDDEV},
+                 lead_time=5, daily_demand=100, service_level=0.95)
+    np.testing.assert_allclose(grid.values, expected)
+    
+    frame = grid.to_frame()
+    assert frame.index.name == 'demand_stddev' and frame.columns.name == 'lead_time_stddev'
+    assert frame.loc[DEMAND_STDDEV[3], LEAD_TIME_STDDEV[7]] == pytest.approx(expected[3, 7])
+
+@pytest.fixture
+def six_d():
+    """A 6-D reorder point study."""
+    axes = {
+        'daily_demand': np.linspace(50, 500, 6),
+        'lead_time': np.arange(2, 12, 2),
+        'demand_stddev': np.linspace(10, 100, 7),
+        'lead_time_stddev': np.linspace(0, 2, 4),
+        'service_level': np.array([0.9, 0.95, 0.99]),
+    }
+    return Sweep(reorder_point, axes), axes
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 100, 2**20])
+def test_chunked_evaluation_matches_broadcast(six_d, chunk_size):
+    """Test every chunk size fills the same grid."""
+    grid, axes = six_d
+    expected = reorder_point(**dict(zip(axes, np.meshgrid(*axes.values(), indexing='ij'))))
+    np.testing.assert_allclose(grid.evaluate(chunk_size).values, expected)
+
+@pytest.mark.parametrize('how', ['min', 'max', 'sum', 'mean'])
+def test_streaming_reduction(six_d, how):
+    """Test reductions over any axes without building the grid."""
+    grid, _ = six_d
+    full = grid.evaluate().values
+    over = ['lead_time', 'lead_time_stddev', 'service_level']
+    reduced = grid.reduce(how, over=over, chunk_size=13)
+    
+    assert reduced.dims == ('daily_demand', 'demand_stddev')
+    np.testing.assert_allclose(reduced.values, getattr(np, how)(full, axis=(1, 3, 4)))
+    assert grid.reduce(how, over=grid.dims, chunk_size=13).values == pytest.approx(
+        getattr(np, how)(full))
+
+def test_selection_and_dict_outputs(six_d):
+    """Test lazy slicing for heat maps and picking a key of eoq_analysis."""
+    grid, _ = six_d
+    heatmap = grid.sel(daily_demand=300, lead_time=6, service_level=0.95).evaluate()
+    assert heatmap.dims == ('demand_stddev', 'lead_time_stddev')
+    np.testing.assert_allclose(heatmap.values, grid.evaluate().sel(
+        daily_demand=300, lead_time=6, service_level=0.95).values)
+    
+    costs = sweep('eoq_analysis', {'demand': [500, 1000], 'holding_cost': [10, 20, 40]},
+                  output='total_cost', order_cost=100)
+    np.testing.assert_allclose(costs.values, np.sqrt(2 * np.array([[500], [1000]]) * 100
+                                                     * np.array([10, 20, 40])))
+    with pytest.raises(ValueError):
+        sweep('eoq_analysis', {'demand': [500]}, order_cost=100, holding_cost=10)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,103 @@
+"""
+Test module for columnar policy table validation.
+Checks violation bits on DataFrames, structured arrays and dicts, and
+the vectorized multi-product checkers.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.inventory import POLICY_CHECKS, validate_policies, violation_names
+from utils.testing.inventory_tests import (
+    check_multi_item_policy,
+    check_multi_product_safety,
+    check_pareto_analysis
+)
+
+def make_policies(n, seed=0):
+    """Consistent random policy table."""
+    rng = np.random.default_rng(seed)
+    safety_stock = rng.uniform(1, 100, n)
+    unit_cost = rng.uniform(1, 10, n)
+    return pd.DataFrame({
+        'safety_stock': safety_stock,
+        'reorder_point': safety_stock + rng.uniform(0, 50, n),
+        'service_level': rng.uniform(0.8, 0.99, n),
+        'unit_cost': unit_cost,
+        'investment': safety_stock * unit_cost
+    })
+
+def test_flags_each_violation():
+    """Test each broken row gets exactly the bits of its failed checks."""
+    policies = make_policies(1000)
+    policies.loc[3, 'safety_stock'] = np.nan
+    policies.loc[10, 'service_level'] = 1.2
+    policies.loc[20, 'reorder_point'] = 0.5
+    policies.loc[30, 'investment'] = -5.0
+    policies.loc[40, ['safety_stock', 'reorder_point', 'investment']] = np.inf
+    with np.errstate(all='raise'):
+        report = validate_policies(policies)
+    
+    np.testing.assert_array_equal(report['rows'], [3, 10, 20, 30, 40])
+    assert not report['valid']
+    assert violation_names(report['flags'][report['rows']]) == [
+        ('non_finite_value',),
+        ('service_level_out_of_range',),
+        ('reorder_point_below_safety_stock',),
+        ('investment_not_positive', 'investment_mismatch'),
+        ('non_finite_value',)
+    ]
+    assert report['counts']['investment_mismatch'] == 1
+    assert report['counts']['safety_stock_not_positive'] == 0
+    assert set(report['counts']) == set(POLICY_CHECKS)
+
+def test_table_types_agree():
+    """Test DataFrames, structured arrays and dicts give the same report."""
+    policies = make_policies(500, seed=1)
+    policies.loc[::50, 'service_level'] = -0.1
+    frame = validate_policies(policies)
+    records = validate_policies(policies.to_records(index=False))
+    columns = validate_policies({k: policies[k].to_numpy() for k in policies})
+    np.testing.assert_array_equal(frame['flags'], records['flags'])
+    np.testing.assert_array_equal(frame['flags'], columns['flags'])
+    assert frame['counts']['service_level_out_of_range'] == 10
+
+def test_renamed_and_partial_columns():
+    """Test column renaming and skipping checks without their columns."""
+    report = validate_policies({'SS': [5.0, -1.0], 'ROP': [10.0, 3.0]},
+                               columns={'safety_stock': 'SS', 'reorder_point': 'ROP'})
+    np.testing.assert_array_equal(report['rows'], [1])
+    assert 'investment_mismatch' not in report['counts']
+    assert validate_policies({'service_level': [0.9, 0.95]})['valid']
+    
+    with pytest.raises(ValueError):
+        validate_policies({'price': [1.0]})
+    with pytest.raises(ValueError):
+        validate_policies({'safety_stock': [1.0, 2.0], 'reorder_point': [3.0]})
+
+def test_multi_product_checkers():
+    """Test the dict checkers on valid and invalid products."""
+    solution = {
+        'safety_stocks': {'A': 10.0, 'B': 20.0},
+        'total_investment': 300.0,
+        'service_levels': {'A': 0.95, 'B': 0.99},
+        'inventory_costs': {'A': 100.0, 'B': 200.0},
+        'reorder_points': {'A': 50.0, 'B': 80.0}
+    }
+    assert check_multi_product_safety(solution)
+    assert check_multi_item_policy(solution)
+    solution['service_levels']['B'] = 1.5
+    assert not check_multi_product_safety(solution)
+    assert not check_multi_item_policy(solution)
+
+def test_pareto_monotonicity():
+    """Test cumulative shares must not decrease."""
+    solution = {'annual_volume': [50, 30, 20], 'volume_percentages': [0.5, 0.3, 0.2],
+                'cumulative_percentages': np.array([0.5, 0.8, 1.0])}
+    assert check_pareto_analysis(solution)
+    solution['cumulative_percentages'] = np.array([0.5, 0.4, 1.0])
+    assert not check_pareto_analysis(solution)
+
+if __name__ == '__main__':
+    pytest.main([__file__])